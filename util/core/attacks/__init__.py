@@ -0,0 +1,547 @@
+from dataclasses import dataclass
+from os import getenv
+from typing import *
+
+import core.magics as magics
+from core.attacks.fill import sliders_attacks_fill
+from core.piece import WHITE_IDX
+from core.square import MASK64, SS, SQ, ss
+from core.square import north_bb, north_east_bb, north_west_bb, south_bb, south_east_bb, south_west_bb
+from env_vars import SLIDER_ENGINE
+
+MAGIC_ENGINE = "magic"
+FILL_ENGINE = "fill"
+
+
+@dataclass
+class Magic:
+    attack_mask: int
+    attacks: Sequence[int]
+    offset: int
+    magic_num: int
+    shift: int
+    square_idx: int
+
+
+KNIGHT_ATTACKS = [
+    SS(0x20400),
+    SS(0x50800),
+    SS(0xa1100),
+    SS(0x142200),
+    SS(0x284400),
+    SS(0x508800),
+    SS(0xa01000),
+    SS(0x402000),
+    SS(0x2040004),
+    SS(0x5080008),
+    SS(0xa110011),
+    SS(0x14220022),
+    SS(0x28440044),
+    SS(0x50880088),
+    SS(0xa0100010),
+    SS(0x40200020),
+    SS(0x204000402),
+    SS(0x508000805),
+    SS(0xa1100110a),
+    SS(0x1422002214),
+    SS(0x2844004428),
+    SS(0x5088008850),
+    SS(0xa0100010a0),
+    SS(0x4020002040),
+    SS(0x20400040200),
+    SS(0x50800080500),
+    SS(0xa1100110a00),
+    SS(0x142200221400),
+    SS(0x284400442800),
+    SS(0x508800885000),
+    SS(0xa0100010a000),
+    SS(0x402000204000),
+    SS(0x2040004020000),
+    SS(0x5080008050000),
+    SS(0xa1100110a0000),
+    SS(0x14220022140000),
+    SS(0x28440044280000),
+    SS(0x50880088500000),
+    SS(0xa0100010a00000),
+    SS(0x40200020400000),
+    SS(0x204000402000000),
+    SS(0x508000805000000),
+    SS(0xa1100110a000000),
+    SS(0x1422002214000000),
+    SS(0x2844004428000000),
+    SS(0x5088008850000000),
+    SS(0xa0100010a0000000),
+    SS(0x4020002040000000),
+    SS(0x400040200000000),
+    SS(0x800080500000000),
+    SS(0x1100110a00000000),
+    SS(0x2200221400000000),
+    SS(0x4400442800000000),
+    SS(0x8800885000000000),
+    SS(0x100010a000000000),
+    SS(0x2000204000000000),
+    SS(0x4020000000000),
+    SS(0x8050000000000),
+    SS(0x110a0000000000),
+    SS(0x22140000000000),
+    SS(0x44280000000000),
+    SS(0x88500000000000),
+    SS(0x10a00000000000),
+    SS(0x20400000000000),
+]
+
+KING_ATTACKS = [
+    SS(0x302),
+    SS(0x705),
+    SS(0xe0a),
+    SS(0x1c14),
+    SS(0x3828),
+    SS(0x7050),
+    SS(0xe0a0),
+    SS(0xc040),
+    SS(0x30203),
+    SS(0x70507),
+    SS(0xe0a0e),
+    SS(0x1c141c),
+    SS(0x382838),
+    SS(0x705070),
+    SS(0xe0a0e0),
+    SS(0xc040c0),
+    SS(0x3020300),
+    SS(0x7050700),
+    SS(0xe0a0e00),
+    SS(0x1c141c00),
+    SS(0x38283800),
+    SS(0x70507000),
+    SS(0xe0a0e000),
+    SS(0xc040c000),
+    SS(0x302030000),
+    SS(0x705070000),
+    SS(0xe0a0e0000),
+    SS(0x1c141c0000),
+    SS(0x3828380000),
+    SS(0x7050700000),
+    SS(0xe0a0e00000),
+    SS(0xc040c00000),
+    SS(0x30203000000),
+    SS(0x70507000000),
+    SS(0xe0a0e000000),
+    SS(0x1c141c000000),
+    SS(0x382838000000),
+    SS(0x705070000000),
+    SS(0xe0a0e0000000),
+    SS(0xc040c0000000),
+    SS(0x3020300000000),
+    SS(0x7050700000000),
+    SS(0xe0a0e00000000),
+    SS(0x1c141c00000000),
+    SS(0x38283800000000),
+    SS(0x70507000000000),
+    SS(0xe0a0e000000000),
+    SS(0xc040c000000000),
+    SS(0x302030000000000),
+    SS(0x705070000000000),
+    SS(0xe0a0e0000000000),
+    SS(0x1c141c0000000000),
+    SS(0x3828380000000000),
+    SS(0x7050700000000000),
+    SS(0xe0a0e00000000000),
+    SS(0xc040c00000000000),
+    SS(0x203000000000000),
+    SS(0x507000000000000),
+    SS(0xa0e000000000000),
+    SS(0x141c000000000000),
+    SS(0x2838000000000000),
+    SS(0x5070000000000000),
+    SS(0xa0e0000000000000),
+    SS(0x40c0000000000000),
+]
+
+PAWN_ATTACKS = (
+    [
+        SS(0x200),
+        SS(0x500),
+        SS(0xa00),
+        SS(0x1400),
+        SS(0x2800),
+        SS(0x5000),
+        SS(0xa000),
+        SS(0x4000),
+        SS(0x20000),
+        SS(0x50000),
+        SS(0xa0000),
+        SS(0x140000),
+        SS(0x280000),
+        SS(0x500000),
+        SS(0xa00000),
+        SS(0x400000),
+        SS(0x2000000),
+        SS(0x5000000),
+        SS(0xa000000),
+        SS(0x14000000),
+        SS(0x28000000),
+        SS(0x50000000),
+        SS(0xa0000000),
+        SS(0x40000000),
+        SS(0x200000000),
+        SS(0x500000000),
+        SS(0xa00000000),
+        SS(0x1400000000),
+        SS(0x2800000000),
+        SS(0x5000000000),
+        SS(0xa000000000),
+        SS(0x4000000000),
+        SS(0x20000000000),
+        SS(0x50000000000),
+        SS(0xa0000000000),
+        SS(0x140000000000),
+        SS(0x280000000000),
+        SS(0x500000000000),
+        SS(0xa00000000000),
+        SS(0x400000000000),
+        SS(0x2000000000000),
+        SS(0x5000000000000),
+        SS(0xa000000000000),
+        SS(0x14000000000000),
+        SS(0x28000000000000),
+        SS(0x50000000000000),
+        SS(0xa0000000000000),
+        SS(0x40000000000000),
+        SS(0x200000000000000),
+        SS(0x500000000000000),
+        SS(0xa00000000000000),
+        SS(0x1400000000000000),
+        SS(0x2800000000000000),
+        SS(0x5000000000000000),
+        SS(0xa000000000000000),
+        SS(0x4000000000000000),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+    ],
+    [
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x0),
+        SS(0x2),
+        SS(0x5),
+        SS(0xa),
+        SS(0x14),
+        SS(0x28),
+        SS(0x50),
+        SS(0xa0),
+        SS(0x40),
+        SS(0x200),
+        SS(0x500),
+        SS(0xa00),
+        SS(0x1400),
+        SS(0x2800),
+        SS(0x5000),
+        SS(0xa000),
+        SS(0x4000),
+        SS(0x20000),
+        SS(0x50000),
+        SS(0xa0000),
+        SS(0x140000),
+        SS(0x280000),
+        SS(0x500000),
+        SS(0xa00000),
+        SS(0x400000),
+        SS(0x2000000),
+        SS(0x5000000),
+        SS(0xa000000),
+        SS(0x14000000),
+        SS(0x28000000),
+        SS(0x50000000),
+        SS(0xa0000000),
+        SS(0x40000000),
+        SS(0x200000000),
+        SS(0x500000000),
+        SS(0xa00000000),
+        SS(0x1400000000),
+        SS(0x2800000000),
+        SS(0x5000000000),
+        SS(0xa000000000),
+        SS(0x4000000000),
+        SS(0x20000000000),
+        SS(0x50000000000),
+        SS(0xa0000000000),
+        SS(0x140000000000),
+        SS(0x280000000000),
+        SS(0x500000000000),
+        SS(0xa00000000000),
+        SS(0x400000000000),
+        SS(0x2000000000000),
+        SS(0x5000000000000),
+        SS(0xa000000000000),
+        SS(0x14000000000000),
+        SS(0x28000000000000),
+        SS(0x50000000000000),
+        SS(0xa0000000000000),
+        SS(0x40000000000000),
+    ],
+)
+
+
+def _magics(table, offsets, masks, magic_nums, shifts) -> List[Magic]:
+    res = []
+    for i in range(64):
+        lo = offsets[i]
+        hi = offsets[i + 1] if i < 63 else len(table)
+        res.append(Magic(masks[i], table[lo:hi], lo, magic_nums[i], shifts[i], i))
+    return res
+
+
+class _SliderTables:
+    def load(self):
+        self.bishop_magics = _magics(magics.BISHOP_ATTACK_TABLE, magics.BISHOP_OFFSETS, magics.BISHOP_MASKS,
+                                     magics.BISHOP_MAGIC_NUMS, magics.BISHOP_SHIFTS)
+        self.bishop_masks = [m.attack_mask for m in self.bishop_magics]
+        self.bishop_magic_nums = [m.magic_num for m in self.bishop_magics]
+        self.bishop_shifts = [64 - m.shift for m in self.bishop_magics]
+        self.bishop_offsets = [m.offset for m in self.bishop_magics]
+        self.bishop_table = magics.BISHOP_ATTACK_TABLE
+
+        self.rook_magics = _magics(magics.ROOK_ATTACK_TABLE, magics.ROOK_OFFSETS, magics.ROOK_MASKS,
+                                   magics.ROOK_MAGIC_NUMS, magics.ROOK_SHIFTS)
+        self.rook_masks = [m.attack_mask for m in self.rook_magics]
+        self.rook_magic_nums = [m.magic_num for m in self.rook_magics]
+        self.rook_shifts = [64 - m.shift for m in self.rook_magics]
+        self.rook_offsets = [m.offset for m in self.rook_magics]
+        self.rook_table = magics.ROOK_ATTACK_TABLE
+
+        self.between = magics.BETWEEN_TABLE
+        self.line = magics.LINE_TABLE
+
+    def is_loaded(self) -> bool:
+        return type(self) is _SliderTables
+
+
+class _UnloadedSliderTables(_SliderTables):
+    # a class with __getattr__ takes a slower attribute lookup path, so once the tables are built the instance
+    # is switched over to the plain class and lookups in the hot functions cost a dict hit
+    def __getattr__(self, name: str):
+        self.load()
+        self.__class__ = _SliderTables
+        return getattr(self, name)
+
+
+_sliders = _UnloadedSliderTables()
+
+_KNIGHT_ATTACKS = [a.value for a in KNIGHT_ATTACKS]
+_KING_ATTACKS = [a.value for a in KING_ATTACKS]
+_PAWN_ATTACKS = tuple([a.value for a in attacks] for attacks in PAWN_ATTACKS)
+
+_PUSH_RANKS = (ss.ranks.r3.value, ss.ranks.r6.value)
+
+
+_engine = MAGIC_ENGINE
+
+
+def set_slider_engine(engine: str) -> None:
+    global _engine
+    if engine not in (MAGIC_ENGINE, FILL_ENGINE):
+        raise ValueError(f"slider engine must be {MAGIC_ENGINE} or {FILL_ENGINE}, got: '{engine}'")
+    _engine = engine
+
+
+def slider_engine() -> str:
+    return _engine
+
+
+set_slider_engine(getenv(SLIDER_ENGINE, MAGIC_ENGINE))
+
+
+def __getattr__(name: str):
+    if name == "BISHOP_MAGICS":
+        return _sliders.bishop_magics
+    if name == "ROOK_MAGICS":
+        return _sliders.rook_magics
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def knight_attacks_bb(sq_idx: int) -> int:
+    return _KNIGHT_ATTACKS[sq_idx]
+
+
+def king_attacks_bb(sq_idx: int) -> int:
+    return _KING_ATTACKS[sq_idx]
+
+
+def pawn_attacks_bb(sq_idx: int, color: int) -> int:
+    return _PAWN_ATTACKS[color][sq_idx]
+
+
+def pawn_pushes_bb(pawns: int, empty: int, color: int) -> int:
+    if color == WHITE_IDX:
+        return north_bb(pawns) & empty
+    return south_bb(pawns) & empty
+
+
+def pawn_double_pushes_bb(pawns: int, empty: int, color: int) -> int:
+    single = pawn_pushes_bb(pawns, empty, color) & _PUSH_RANKS[color]
+    return pawn_pushes_bb(single, empty, color)
+
+
+# left and right are as seen from white's side of the board for both colors: left captures head towards the a file
+def pawn_captures_left_bb(pawns: int, targets: int, color: int) -> int:
+    if color == WHITE_IDX:
+        return north_west_bb(pawns) & targets
+    return south_west_bb(pawns) & targets
+
+
+def pawn_captures_right_bb(pawns: int, targets: int, color: int) -> int:
+    if color == WHITE_IDX:
+        return north_east_bb(pawns) & targets
+    return south_east_bb(pawns) & targets
+
+
+def pawn_attacked_bb(pawns: int, color: int) -> int:
+    return pawn_captures_left_bb(pawns, MASK64, color) | pawn_captures_right_bb(pawns, MASK64, color)
+
+
+def ep_candidates_bb(pawns: int, ep_idx: int, color: int) -> int:
+    return _PAWN_ATTACKS[color ^ 1][ep_idx] & pawns
+
+
+def bishop_attacks_bb(sq_idx: int, occ: int) -> int:
+    t = _sliders
+    index = ((occ & t.bishop_masks[sq_idx]) * t.bishop_magic_nums[sq_idx] & MASK64) >> t.bishop_shifts[sq_idx]
+    return t.bishop_table[t.bishop_offsets[sq_idx] + index]
+
+
+def rook_attacks_bb(sq_idx: int, occ: int) -> int:
+    t = _sliders
+    index = ((occ & t.rook_masks[sq_idx]) * t.rook_magic_nums[sq_idx] & MASK64) >> t.rook_shifts[sq_idx]
+    return t.rook_table[t.rook_offsets[sq_idx] + index]
+
+
+def queen_attacks_bb(sq_idx: int, occ: int) -> int:
+    return bishop_attacks_bb(sq_idx, occ) | rook_attacks_bb(sq_idx, occ)
+
+
+def between_bb(a_idx: int, b_idx: int) -> int:
+    return _sliders.between[a_idx << 6 | b_idx]
+
+
+def line_bb(a_idx: int, b_idx: int) -> int:
+    return _sliders.line[a_idx << 6 | b_idx]
+
+
+def aligned_bb(a_idx: int, b_idx: int, c_idx: int) -> bool:
+    return bool(_sliders.line[a_idx << 6 | b_idx] >> c_idx & 1)
+
+
+def pinned_bb(king_idx: int, occ: int, own: int, enemy_orthogonal: int, enemy_diagonal: int) -> int:
+    snipers = (rook_attacks_bb(king_idx, 0) & enemy_orthogonal) | (bishop_attacks_bb(king_idx, 0) & enemy_diagonal)
+    pinned = 0
+    while snipers:
+        sniper = snipers & -snipers
+        blockers = between_bb(king_idx, sniper.bit_length() - 1) & occ
+        if blockers and not blockers & (blockers - 1):
+            pinned |= blockers & own
+        snipers ^= sniper
+    return pinned
+
+
+def sliders_attacks_magic(diagonal: int, orthogonal: int, occ: int) -> int:
+    res = 0
+    while diagonal:
+        bit = diagonal & -diagonal
+        res |= bishop_attacks_bb(bit.bit_length() - 1, occ)
+        diagonal ^= bit
+    while orthogonal:
+        bit = orthogonal & -orthogonal
+        res |= rook_attacks_bb(bit.bit_length() - 1, occ)
+        orthogonal ^= bit
+    return res
+
+
+def sliders_attacks_bb(diagonal: int, orthogonal: int, occ: int) -> int:
+    if _engine == FILL_ENGINE:
+        return sliders_attacks_fill(diagonal, orthogonal, occ)
+    return sliders_attacks_magic(diagonal, orthogonal, occ)
+
+
+def attacked_by_bb(color: int, pawns: int, knights: int, diagonal: int, orthogonal: int, kings: int,
+                   occ: int) -> int:
+    res = pawn_attacked_bb(pawns, color) | sliders_attacks_bb(diagonal, orthogonal, occ)
+    while knights:
+        bit = knights & -knights
+        res |= _KNIGHT_ATTACKS[bit.bit_length() - 1]
+        knights ^= bit
+    while kings:
+        bit = kings & -kings
+        res |= _KING_ATTACKS[bit.bit_length() - 1]
+        kings ^= bit
+    return res
+
+
+def knight_attacks(location: SQ) -> SS:
+    return KNIGHT_ATTACKS[location.idx]
+
+
+def king_attacks(location: SQ) -> SS:
+    return KING_ATTACKS[location.idx]
+
+
+def pawn_attacks(location: SQ, color: int) -> SS:
+    return PAWN_ATTACKS[color][location.idx]
+
+
+def pawn_pushes(pawns: SS, occupied: SS, color: int) -> SS:
+    return SS(pawn_pushes_bb(pawns.value, ~occupied.value & MASK64, color))
+
+
+def pawn_double_pushes(pawns: SS, occupied: SS, color: int) -> SS:
+    return SS(pawn_double_pushes_bb(pawns.value, ~occupied.value & MASK64, color))
+
+
+def pawn_captures_left(pawns: SS, targets: SS, color: int) -> SS:
+    return SS(pawn_captures_left_bb(pawns.value, targets.value, color))
+
+
+def pawn_captures_right(pawns: SS, targets: SS, color: int) -> SS:
+    return SS(pawn_captures_right_bb(pawns.value, targets.value, color))
+
+
+def pawn_attacked(pawns: SS, color: int) -> SS:
+    return SS(pawn_attacked_bb(pawns.value, color))
+
+
+def ep_candidates(pawns: SS, ep_square: SQ, color: int) -> SS:
+    return SS(ep_candidates_bb(pawns.value, ep_square.idx, color))
+
+
+def bishop_attacks(location: SQ, occupied: SS) -> SS:
+    return SS(bishop_attacks_bb(location.idx, occupied.value))
+
+
+def rook_attacks(location: SQ, occupied: SS) -> SS:
+    return SS(rook_attacks_bb(location.idx, occupied.value))
+
+
+def queen_attacks(location: SQ, occupied: SS) -> SS:
+    return SS(queen_attacks_bb(location.idx, occupied.value))
+
+
+def between(a: SQ, b: SQ) -> SS:
+    return SS(between_bb(a.idx, b.idx))
+
+
+def line(a: SQ, b: SQ) -> SS:
+    return SS(line_bb(a.idx, b.idx))
+
+
+def aligned(a: SQ, b: SQ, c: SQ) -> bool:
+    return aligned_bb(a.idx, b.idx, c.idx)
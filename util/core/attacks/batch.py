@@ -0,0 +1,58 @@
+import numpy as np
+
+from core.attacks import KING_ATTACKS, KNIGHT_ATTACKS, PAWN_ATTACKS
+from core.magics import *
+from core.piece import BLACK_IDX, WHITE_IDX
+
+ArrayLike = np.ndarray | int
+
+
+class _SliderTable:
+    def __init__(self, table, offsets, masks, magic_nums, shifts):
+        self.table = np.frombuffer(table, dtype=np.uint64)
+        self.offsets = np.array(offsets, dtype=np.uint64)
+        self.masks = np.array(masks, dtype=np.uint64)
+        self.magic_nums = np.array(magic_nums, dtype=np.uint64)
+        self.shifts = np.uint64(64) - np.array(shifts, dtype=np.uint64)
+
+    def lookup(self, squares: ArrayLike, occupied: ArrayLike) -> np.ndarray:
+        squares = np.asarray(squares, dtype=np.intp)
+        occupied = np.asarray(occupied, dtype=np.uint64)
+        # the magic multiply is meant to wrap; numpy only warns about that for scalars
+        with np.errstate(over="ignore"):
+            index = ((occupied & self.masks[squares]) * self.magic_nums[squares]) >> self.shifts[squares]
+        return self.table[(self.offsets[squares] + index).astype(np.intp)]
+
+
+_BISHOPS = _SliderTable(BISHOP_ATTACK_TABLE, BISHOP_OFFSETS, BISHOP_MASKS, BISHOP_MAGIC_NUMS, BISHOP_SHIFTS)
+_ROOKS = _SliderTable(ROOK_ATTACK_TABLE, ROOK_OFFSETS, ROOK_MASKS, ROOK_MAGIC_NUMS, ROOK_SHIFTS)
+
+KNIGHT_TABLE = np.array([a.value for a in KNIGHT_ATTACKS], dtype=np.uint64)
+KING_TABLE = np.array([a.value for a in KING_ATTACKS], dtype=np.uint64)
+
+# indexed by [color, square]
+PAWN_TABLE = np.array([[a.value for a in PAWN_ATTACKS[color]] for color in (WHITE_IDX, BLACK_IDX)], dtype=np.uint64)
+
+
+def bishop_attacks(squares: ArrayLike, occupied: ArrayLike) -> np.ndarray:
+    return _BISHOPS.lookup(squares, occupied)
+
+
+def rook_attacks(squares: ArrayLike, occupied: ArrayLike) -> np.ndarray:
+    return _ROOKS.lookup(squares, occupied)
+
+
+def queen_attacks(squares: ArrayLike, occupied: ArrayLike) -> np.ndarray:
+    return _BISHOPS.lookup(squares, occupied) | _ROOKS.lookup(squares, occupied)
+
+
+def knight_attacks(squares: ArrayLike) -> np.ndarray:
+    return KNIGHT_TABLE[np.asarray(squares, dtype=np.intp)]
+
+
+def king_attacks(squares: ArrayLike) -> np.ndarray:
+    return KING_TABLE[np.asarray(squares, dtype=np.intp)]
+
+
+def pawn_attacks(squares: ArrayLike, color: ArrayLike) -> np.ndarray:
+    return PAWN_TABLE[np.asarray(color, dtype=np.intp), np.asarray(squares, dtype=np.intp)]
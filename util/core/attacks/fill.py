@@ -0,0 +1,41 @@
+from core.square import MASK64, NOT_FILE_A_BB, NOT_FILE_H_BB
+
+
+def _fill_up(gen: int, empty: int, shift: int, wrap: int) -> int:
+    pro = empty & wrap
+    gen |= pro & (gen << shift)
+    pro &= pro << shift
+    gen |= pro & (gen << 2 * shift)
+    pro &= pro << 2 * shift
+    gen |= pro & (gen << 4 * shift)
+    return (gen << shift) & wrap & MASK64
+
+
+def _fill_down(gen: int, empty: int, shift: int, wrap: int) -> int:
+    pro = empty & wrap
+    gen |= pro & (gen >> shift)
+    pro &= pro >> shift
+    gen |= pro & (gen >> 2 * shift)
+    pro &= pro >> 2 * shift
+    gen |= pro & (gen >> 4 * shift)
+    return (gen >> shift) & wrap
+
+
+def rook_attacks_fill(rooks: int, occ: int) -> int:
+    empty = ~occ & MASK64
+    return (_fill_up(rooks, empty, 8, MASK64) |
+            _fill_down(rooks, empty, 8, MASK64) |
+            _fill_up(rooks, empty, 1, NOT_FILE_A_BB) |
+            _fill_down(rooks, empty, 1, NOT_FILE_H_BB))
+
+
+def bishop_attacks_fill(bishops: int, occ: int) -> int:
+    empty = ~occ & MASK64
+    return (_fill_up(bishops, empty, 9, NOT_FILE_A_BB) |
+            _fill_up(bishops, empty, 7, NOT_FILE_H_BB) |
+            _fill_down(bishops, empty, 7, NOT_FILE_A_BB) |
+            _fill_down(bishops, empty, 9, NOT_FILE_H_BB))
+
+
+def sliders_attacks_fill(diagonal: int, orthogonal: int, occ: int) -> int:
+    return bishop_attacks_fill(diagonal, occ) | rook_attacks_fill(orthogonal, occ)
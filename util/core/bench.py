@@ -0,0 +1,133 @@
+import os
+import random
+import subprocess
+import sys
+import timeit
+from dataclasses import dataclass
+from os import path
+from typing import *
+
+import chess
+
+from core import attacks
+from core.attacks.fill import sliders_attacks_fill
+from core.move import Move
+from core.piece import WHITE_IDX
+from core.position import Position, clear_fen_caches
+from core.square import SQ
+
+UTIL_DIR = path.dirname(path.dirname(__file__))
+
+
+@dataclass
+class SideSample:
+    name: str
+    pawns: int
+    knights: int
+    diagonal: int
+    orthogonal: int
+    kings: int
+    occupied: int
+
+
+# white's pieces in a handful of typical positions, from the opening through to a rook ending
+SIDE_SAMPLES = [
+    SideSample("starting", 0xff00, 0x42, 0x2c, 0x89, 0x10, 0xffff00000000ffff),
+    SideSample("italian", 0x1008e700, 0x240000, 0x400000c, 0x89, 0x10, 0x9def2414142ce79d),
+    SideSample("middlegame", 0xc11e200, 0x240000, 0x80008, 0x29, 0x40, 0x6cf336080c3de269),
+    SideSample("endgame", 0x80402000, 0x0, 0x0, 0x800000000, 0x4000, 0x60400882406000),
+]
+
+# 1. e4 e5 2. Nf3 Nc6 3. Bc4 Bc5 4. c3 Nf6 5. d4 exd4 6. cxd4 Bb4+ 7. Nc3 Nxe4 8. O-O Nxc3 9. bxc3 Bxc3
+SAMPLE_LINE = ["e2e4", "e7e5", "g1f3", "b8c6", "f1c4", "f8c5", "c2c3", "g8f6", "d2d4", "e5d4", "c3d4", "c5b4", "b1c3",
+               "f6e4", "e1g1", "e4c3", "b2c3", "b4c3"]
+
+
+def per_call_ns(fn: Callable[[], any], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+
+def bench_attacked_squares(number: int = 2000) -> Dict[str, Dict[str, float]]:
+    attacks.rook_attacks_bb(0, 0)
+    res = dict()
+    for s in SIDE_SAMPLES:
+        res[s.name] = {
+            "magic sliders": per_call_ns(lambda: attacks.sliders_attacks_magic(s.diagonal, s.orthogonal, s.occupied),
+                                         number),
+            "fill sliders": per_call_ns(lambda: sliders_attacks_fill(s.diagonal, s.orthogonal, s.occupied), number),
+            "all attacks": per_call_ns(lambda: attacks.attacked_by_bb(WHITE_IDX, s.pawns, s.knights, s.diagonal,
+                                                                      s.orthogonal, s.kings, s.occupied), number),
+        }
+    return res
+
+
+def bench_make_unmake(number: int = 200) -> Dict[str, float]:
+    line = [Move(SQ(m[:2]), SQ(m[2:]), None) for m in SAMPLE_LINE]
+    start = Position.starting()
+
+    def make_unmake():
+        for move in line:
+            start.push(move)
+        for _ in line:
+            start.pop()
+
+    def copy_make():
+        position = start
+        for move in line:
+            position = position.apply(move)
+
+    return {
+        "push + pop": per_call_ns(make_unmake, number) / len(line),
+        "apply": per_call_ns(copy_make, number) / len(line),
+    }
+
+
+def random_game_fens(count: int, seed: int = 23) -> List[str]:
+    # distinct positions from random legal games, so the per-rank FEN caches see realistic variety
+    rng = random.Random(seed)
+    res = dict()
+    while len(res) < count:
+        board = chess.Board()
+        while not board.is_game_over() and len(res) < count:
+            board.push(rng.choice(list(board.legal_moves)))
+            res[board.fen()] = None
+    return list(res)
+
+
+def bench_fen(count: int = 20_000) -> Dict[str, float]:
+    fens = random_game_fens(count)
+    positions = list(Position.from_fens(fens))
+
+    def cold(fn: Callable[[], any]) -> float:
+        return count / min(timeit.repeat(fn, setup=clear_fen_caches, number=1, repeat=5))
+
+    def warm(fn: Callable[[], any]) -> float:
+        fn()
+        return count / min(timeit.repeat(fn, number=1, repeat=5))
+
+    parse = lambda: list(Position.from_fens(fens))
+    write = lambda: [p.to_fen() for p in positions]
+    return {"from_fens cold": cold(parse), "from_fens warm": warm(parse), "to_fen cold": cold(write),
+            "to_fen warm": warm(write)}
+
+
+def import_profile(statement: str) -> Tuple[str, Dict[str, Tuple[int, int]]]:
+    # bytecode is allowed so that the timings match a normal install rather than a fresh compile
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True,
+                            check=True, cwd=UTIL_DIR, env=env)
+    timings = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumul, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(own), int(cumul))
+    return result.stdout, timings
+
+
+def import_time_us(module: str, runs: int = 20) -> Tuple[int, int]:
+    statement = f"import {module}"
+    # the first run writes the bytecode
+    import_profile(statement)
+    timings = [import_profile(statement)[1][module] for _ in range(runs)]
+    return min(own for own, _ in timings), min(cumulative for _, cumulative in timings)
@@ -1,12 +1,49 @@
-from core.magics.bishop_attack_table import BISHOP_ATTACK_TABLE
-from core.magics.bishop_magics import BISHOP_MAGIC_NUMS
-from core.magics.bishop_masks import BISHOP_MASKS
-from core.magics.bishop_offsets import BISHOP_OFFSETS
-from core.magics.bishop_shifts import BISHOP_SHIFTS
-
-ROOK_ATTACK_TABLE = []
-from core.magics.rook_attack_table import *
-from core.magics.rook_magics import ROOK_MAGIC_NUMS
-from core.magics.rook_masks import ROOK_MASKS
-from core.magics.rook_offsets import ROOK_OFFSETS
-from core.magics.rook_shifts import ROOK_SHIFTS
+from typing import *
+
+from core.magics.store import Sections
+
+_SECTIONS = {
+    "BETWEEN_TABLE": "between",
+    "LINE_TABLE": "line",
+    "BISHOP_ATTACK_TABLE": "battack",
+    "BISHOP_MAGIC_NUMS": "bmagic",
+    "BISHOP_MASKS": "bmask",
+    "BISHOP_OFFSETS": "boffset",
+    "BISHOP_SHIFTS": "bshift",
+    "ROOK_ATTACK_TABLE": "rattack",
+    "ROOK_MAGIC_NUMS": "rmagic",
+    "ROOK_MASKS": "rmask",
+    "ROOK_OFFSETS": "roffset",
+    "ROOK_SHIFTS": "rshift",
+}
+
+__all__ = list(_SECTIONS)
+
+_tables: Optional[Sections] = None
+_tables_path: Optional[str] = None
+
+
+def load_tables() -> Sections:
+    global _tables, _tables_path
+    if _tables is None:
+        # imported here so that importing core.magics stays cheap for commands that never look up a slider
+        from core.magics.generate import ensure_tables
+        _tables_path, _tables = ensure_tables()
+    return _tables
+
+
+def tables_path() -> str:
+    load_tables()
+    return _tables_path
+
+
+def is_loaded() -> bool:
+    return _tables is not None
+
+
+def __getattr__(name: str):
+    if name not in _SECTIONS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    table = load_tables()[_SECTIONS[name]]
+    globals()[name] = table
+    return table
@@ -1,1315 +0,0 @@
-from core.square import SS
-BISHOP_ATTACK_TABLE = [
-    SS(0x8040201008040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0040201008040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000008040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000001008040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000008040200),    SS(0x0000201008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000001008040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000008040200),    SS(0x0000201008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000000008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000008040200),    SS(0x0000001008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000000008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000001008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000000008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000000008040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0000000000040200),    SS(0x0000000000040200),    SS(0x0000000000000200),    SS(0x0000000000000200),
-    SS(0x0080402010080500),    SS(0x0000002010080500),    SS(0x0000000000080500),    SS(0x0000000000080500),
-    SS(0x0000000010080500),    SS(0x0000000010080500),    SS(0x0000000000080500),    SS(0x0000000000080500),
-    SS(0x0000402010080500),    SS(0x0000002010080500),    SS(0x0000000000080500),    SS(0x0000000000080500),
-    SS(0x0000000010080500),    SS(0x0000000010080500),    SS(0x0000000000080500),    SS(0x0000000000080500),
-    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),
-    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),
-    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),
-    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),    SS(0x0000000000000500),
-    SS(0x0000804020110a00),    SS(0x0000004020110a00),    SS(0x0000000000110a00),    SS(0x0000000000110a00),
-    SS(0x0000804020100a00),    SS(0x0000004020100a00),    SS(0x0000000000100a00),    SS(0x0000000000100a00),
-    SS(0x0000000020110a00),    SS(0x0000000020110a00),    SS(0x0000000000110a00),    SS(0x0000000000110a00),
-    SS(0x0000000020100a00),    SS(0x0000000020100a00),    SS(0x0000000000100a00),    SS(0x0000000000100a00),
-    SS(0x0000000000010a00),    SS(0x0000000000010a00),    SS(0x0000000000010a00),    SS(0x0000000000010a00),
-    SS(0x0000000000000a00),    SS(0x0000000000000a00),    SS(0x0000000000000a00),    SS(0x0000000000000a00),
-    SS(0x0000000000010a00),    SS(0x0000000000010a00),    SS(0x0000000000010a00),    SS(0x0000000000010a00),
-    SS(0x0000000000000a00),    SS(0x0000000000000a00),    SS(0x0000000000000a00),    SS(0x0000000000000a00),
-    SS(0x0000008041221400),    SS(0x0000008040221400),    SS(0x0000008040201400),    SS(0x0000008040201400),
-    SS(0x0000000041221400),    SS(0x0000000040221400),    SS(0x0000000040201400),    SS(0x0000000040201400),
-    SS(0x0000000001021400),    SS(0x0000000000021400),    SS(0x0000000000001400),    SS(0x0000000000001400),
-    SS(0x0000000001021400),    SS(0x0000000000021400),    SS(0x0000000000001400),    SS(0x0000000000001400),
-    SS(0x0000000001221400),    SS(0x0000000000221400),    SS(0x0000000000201400),    SS(0x0000000000201400),
-    SS(0x0000000001221400),    SS(0x0000000000221400),    SS(0x0000000000201400),    SS(0x0000000000201400),
-    SS(0x0000000001021400),    SS(0x0000000000021400),    SS(0x0000000000001400),    SS(0x0000000000001400),
-    SS(0x0000000001021400),    SS(0x0000000000021400),    SS(0x0000000000001400),    SS(0x0000000000001400),
-    SS(0x0000000182442800),    SS(0x0000000102042800),    SS(0x0000000000002800),    SS(0x0000000000402800),
-    SS(0x0000000082442800),    SS(0x0000000002042800),    SS(0x0000000080402800),    SS(0x0000000000002800),
-    SS(0x0000000102442800),    SS(0x0000000000042800),    SS(0x0000000080402800),    SS(0x0000000000002800),
-    SS(0x0000000002442800),    SS(0x0000000000042800),    SS(0x0000000000402800),    SS(0x0000000000002800),
-    SS(0x0000000080442800),    SS(0x0000000000042800),    SS(0x0000000000402800),    SS(0x0000000000002800),
-    SS(0x0000000080442800),    SS(0x0000000000042800),    SS(0x0000000080402800),    SS(0x0000000000002800),
-    SS(0x0000000102042800),    SS(0x0000000000442800),    SS(0x0000000080402800),    SS(0x0000000000002800),
-    SS(0x0000000002042800),    SS(0x0000000000442800),    SS(0x0000000000002800),    SS(0x0000000000402800),
-    SS(0x0000010204885000),    SS(0x0000000004885000),    SS(0x0000000000805000),    SS(0x0000000000805000),
-    SS(0x0000000000885000),    SS(0x0000000000885000),    SS(0x0000000000805000),    SS(0x0000000000805000),
-    SS(0x0000010204085000),    SS(0x0000000004085000),    SS(0x0000000000005000),    SS(0x0000000000005000),
-    SS(0x0000000000085000),    SS(0x0000000000085000),    SS(0x0000000000005000),    SS(0x0000000000005000),
-    SS(0x0000000204885000),    SS(0x0000000004885000),    SS(0x0000000000805000),    SS(0x0000000000805000),
-    SS(0x0000000000885000),    SS(0x0000000000885000),    SS(0x0000000000805000),    SS(0x0000000000805000),
-    SS(0x0000000204085000),    SS(0x0000000004085000),    SS(0x0000000000005000),    SS(0x0000000000005000),
-    SS(0x0000000000085000),    SS(0x0000000000085000),    SS(0x0000000000005000),    SS(0x0000000000005000),
-    SS(0x000102040810a000),    SS(0x000000000010a000),    SS(0x000002040810a000),    SS(0x000000000010a000),
-    SS(0x000000040810a000),    SS(0x000000000010a000),    SS(0x000000040810a000),    SS(0x000000000010a000),
-    SS(0x000000000000a000),    SS(0x000000000010a000),    SS(0x000000000000a000),    SS(0x000000000010a000),
-    SS(0x000000000000a000),    SS(0x000000000000a000),    SS(0x000000000000a000),    SS(0xffffffffffffffff),
-    SS(0x000000000000a000),    SS(0x000000000000a000),    SS(0x000000000000a000),    SS(0xffffffffffffffff),
-    SS(0x000000000000a000),    SS(0x000000000000a000),    SS(0x000000000000a000),    SS(0x000000000000a000),
-    SS(0x000000000810a000),    SS(0x000000000000a000),    SS(0x000000000810a000),    SS(0x000000000000a000),
-    SS(0x000000000810a000),    SS(0x000000000010a000),    SS(0x000000000810a000),    SS(0x000000000010a000),
-    SS(0x0102040810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0002040810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000040810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000040810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000810204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x0000000010204000),    SS(0x0000000000204000),    SS(0x0000000000004000),    SS(0x0000000000004000),
-    SS(0x4020100804020002),    SS(0x0000000000020002),    SS(0x0020100804020002),    SS(0x0000000000020002),
-    SS(0x0000100804020002),    SS(0x0000000000020002),    SS(0x0000100804020002),    SS(0x0000000000020002),
-    SS(0x0000000004020002),    SS(0x0000000000020002),    SS(0x0000000004020002),    SS(0x0000000000020002),
-    SS(0x0000000004020002),    SS(0x0000000000020002),    SS(0x0000000004020002),    SS(0x0000000000020002),
-    SS(0x0000000004020002),    SS(0x0000000000020002),    SS(0x0000000004020002),    SS(0x0000000000020002),
-    SS(0x0000000004020002),    SS(0x0000000000020002),    SS(0x0000000004020002),    SS(0x0000000000020002),
-    SS(0x0000000804020002),    SS(0x0000000000020002),    SS(0x0000000804020002),    SS(0x0000000000020002),
-    SS(0x0000000804020002),    SS(0x0000000000020002),    SS(0x0000000804020002),    SS(0x0000000000020002),
-    SS(0x8040201008050005),    SS(0x0000000000050005),    SS(0x0000001008050005),    SS(0x0000000000050005),
-    SS(0x0000201008050005),    SS(0x0000000000050005),    SS(0x0000001008050005),    SS(0x0000000000050005),
-    SS(0x0040201008050005),    SS(0x0000000000050005),    SS(0x0000001008050005),    SS(0x0000000000050005),
-    SS(0x0000201008050005),    SS(0x0000000000050005),    SS(0x0000001008050005),    SS(0x0000000000050005),
-    SS(0x0000000008050005),    SS(0x0000000000050005),    SS(0x0000000008050005),    SS(0x0000000000050005),
-    SS(0x0000000008050005),    SS(0x0000000000050005),    SS(0x0000000008050005),    SS(0x0000000000050005),
-    SS(0x0000000008050005),    SS(0x0000000000050005),    SS(0x0000000008050005),    SS(0x0000000000050005),
-    SS(0x0000000008050005),    SS(0x0000000000050005),    SS(0x0000000008050005),    SS(0x0000000000050005),
-    SS(0x00804020110a000a),    SS(0x00804020100a000a),    SS(0x00000000110a000a),    SS(0x00000000100a000a),
-    SS(0x00000000010a000a),    SS(0x00000000000a000a),    SS(0x00000000010a000a),    SS(0x00000000000a000a),
-    SS(0x00000020110a000a),    SS(0x00000020100a000a),    SS(0x00000000110a000a),    SS(0x00000000100a000a),
-    SS(0x00000000010a000a),    SS(0x00000000000a000a),    SS(0x00000000010a000a),    SS(0x00000000000a000a),
-    SS(0x00000020110a000a),    SS(0x00000020100a000a),    SS(0x00000000110a000a),    SS(0x00000000100a000a),
-    SS(0x00000000010a000a),    SS(0x00000000000a000a),    SS(0x00000000010a000a),    SS(0x00000000000a000a),
-    SS(0x00004020110a000a),    SS(0x00004020100a000a),    SS(0x00000000110a000a),    SS(0x00000000100a000a),
-    SS(0x00000000010a000a),    SS(0x00000000000a000a),    SS(0x00000000010a000a),    SS(0x00000000000a000a),
-    SS(0x0000804122140014),    SS(0x0000804022140014),    SS(0x0000000000140014),    SS(0x0000000000140014),
-    SS(0x0000004122140014),    SS(0x0000004022140014),    SS(0x0000804020140014),    SS(0x0000804020140014),
-    SS(0x0000000102140014),    SS(0x0000000002140014),    SS(0x0000004020140014),    SS(0x0000004020140014),
-    SS(0x0000000102140014),    SS(0x0000000002140014),    SS(0x0000000000140014),    SS(0x0000000000140014),
-    SS(0x0000000122140014),    SS(0x0000000022140014),    SS(0x0000000000140014),    SS(0x0000000000140014),
-    SS(0x0000000122140014),    SS(0x0000000022140014),    SS(0x0000000020140014),    SS(0x0000000020140014),
-    SS(0x0000000102140014),    SS(0x0000000002140014),    SS(0x0000000020140014),    SS(0x0000000020140014),
-    SS(0x0000000102140014),    SS(0x0000000002140014),    SS(0x0000000000140014),    SS(0x0000000000140014),
-    SS(0x0000018244280028),    SS(0x0000008040280028),    SS(0x0000010244280028),    SS(0x0000000040280028),
-    SS(0x0000010204280028),    SS(0x0000000000280028),    SS(0x0000010204280028),    SS(0x0000000000280028),
-    SS(0x0000008044280028),    SS(0x0000008040280028),    SS(0x0000000044280028),    SS(0x0000000040280028),
-    SS(0x0000000004280028),    SS(0x0000000000280028),    SS(0x0000000004280028),    SS(0x0000000000280028),
-    SS(0x0000008244280028),    SS(0x0000008040280028),    SS(0x0000000244280028),    SS(0x0000000040280028),
-    SS(0x0000000204280028),    SS(0x0000000000280028),    SS(0x0000000204280028),    SS(0x0000000000280028),
-    SS(0x0000008044280028),    SS(0x0000008040280028),    SS(0x0000000044280028),    SS(0x0000000040280028),
-    SS(0x0000000004280028),    SS(0x0000000000280028),    SS(0x0000000004280028),    SS(0x0000000000280028),
-    SS(0x0001020488500050),    SS(0x0000000080500050),    SS(0x0000000080500050),    SS(0x0000000008500050),
-    SS(0x0000020488500050),    SS(0x0000000000500050),    SS(0x0000000080500050),    SS(0x0000000008500050),
-    SS(0x0001020408500050),    SS(0x0000000000500050),    SS(0x0000000000500050),    SS(0x0000000488500050),
-    SS(0x0000020408500050),    SS(0x0000000080500050),    SS(0x0000000000500050),    SS(0x0000000488500050),
-    SS(0x0000000088500050),    SS(0x0000000080500050),    SS(0x0000000080500050),    SS(0x0000000408500050),
-    SS(0x0000000088500050),    SS(0x0000000000500050),    SS(0x0000000080500050),    SS(0x0000000408500050),
-    SS(0x0000000008500050),    SS(0x0000000000500050),    SS(0x0000000000500050),    SS(0x0000000088500050),
-    SS(0x0000000008500050),    SS(0x0000000080500050),    SS(0x0000000000500050),    SS(0x0000000088500050),
-    SS(0x0102040810a000a0),    SS(0x0000000010a000a0),    SS(0x0000000000a000a0),    SS(0x0000040810a000a0),
-    SS(0x0002040810a000a0),    SS(0x0000000000a000a0),    SS(0x0000000000a000a0),    SS(0x0000040810a000a0),
-    SS(0x0000000000a000a0),    SS(0x0000000000a000a0),    SS(0x0000000010a000a0),    SS(0x0000000000a000a0),
-    SS(0x0000000000a000a0),    SS(0x0000000010a000a0),    SS(0x0000000010a000a0),    SS(0x0000000000a000a0),
-    SS(0x0000000810a000a0),    SS(0x0000000010a000a0),    SS(0x0000000000a000a0),    SS(0x0000000810a000a0),
-    SS(0x0000000810a000a0),    SS(0x0000000000a000a0),    SS(0x0000000000a000a0),    SS(0x0000000810a000a0),
-    SS(0x0000000000a000a0),    SS(0x0000000000a000a0),    SS(0x0000000010a000a0),    SS(0x0000000000a000a0),
-    SS(0x0000000000a000a0),    SS(0x0000000010a000a0),    SS(0x0000000010a000a0),    SS(0x0000000000a000a0),
-    SS(0x0204081020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x0004081020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x0000081020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x0000081020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x0000001020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x0000001020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x0000001020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x0000001020400040),    SS(0x0000000000400040),    SS(0x0000000020400040),    SS(0x0000000000400040),
-    SS(0x2010080402000204),    SS(0x0000000402000204),    SS(0x0000000002000204),    SS(0x0000000002000204),
-    SS(0x0000080402000200),    SS(0x0000000402000200),    SS(0x0000000002000200),    SS(0x0000000002000200),
-    SS(0x0000080402000204),    SS(0x0000000402000204),    SS(0x0000000002000204),    SS(0x0000000002000204),
-    SS(0x0010080402000204),    SS(0x0000000402000204),    SS(0x0000000002000204),    SS(0x0000000002000204),
-    SS(0x2010080402000200),    SS(0x0000000402000200),    SS(0x0000000002000200),    SS(0x0000000002000200),
-    SS(0x0000080402000204),    SS(0x0000000402000204),    SS(0x0000000002000204),    SS(0x0000000002000204),
-    SS(0x0000080402000200),    SS(0x0000000402000200),    SS(0x0000000002000200),    SS(0x0000000002000200),
-    SS(0x0010080402000200),    SS(0x0000000402000200),    SS(0x0000000002000200),    SS(0x0000000002000200),
-    SS(0x4020100805000508),    SS(0x0020100805000508),    SS(0x0000000005000508),    SS(0x0000000005000508),
-    SS(0x4020100805000500),    SS(0x0020100805000500),    SS(0x0000000005000500),    SS(0x0000000005000500),
-    SS(0x0000000805000508),    SS(0x0000000805000508),    SS(0x0000000005000508),    SS(0x0000000005000508),
-    SS(0x0000000805000500),    SS(0x0000000805000500),    SS(0x0000000005000500),    SS(0x0000000005000500),
-    SS(0x0000100805000508),    SS(0x0000100805000508),    SS(0x0000000005000508),    SS(0x0000000005000508),
-    SS(0x0000100805000500),    SS(0x0000100805000500),    SS(0x0000000005000500),    SS(0x0000000005000500),
-    SS(0x0000000805000508),    SS(0x0000000805000508),    SS(0x0000000005000508),    SS(0x0000000005000508),
-    SS(0x0000000805000500),    SS(0x0000000805000500),    SS(0x0000000005000500),    SS(0x0000000005000500),
-    SS(0x804020110a000a11),    SS(0x000000110a000a00),    SS(0x000000000a000a10),    SS(0x000000100a000a00),
-    SS(0x000000010a000a01),    SS(0x000000110a000a11),    SS(0x000000000a000a01),    SS(0x000000000a000a10),
-    SS(0x000000010a000a00),    SS(0x000000010a000a01),    SS(0x000020100a000a00),    SS(0x000000000a000a01),
-    SS(0x004020110a000a11),    SS(0x000000010a000a00),    SS(0x804020100a000a11),    SS(0x000000100a000a00),
-    SS(0x804020110a000a10),    SS(0x000000110a000a11),    SS(0x000000000a000a01),    SS(0x000000100a000a11),
-    SS(0x000000010a000a00),    SS(0x000000110a000a10),    SS(0x000000000a000a00),    SS(0x000000000a000a01),
-    SS(0x000000010a000a01),    SS(0x000000010a000a00),    SS(0x004020100a000a11),    SS(0x000000000a000a00),
-    SS(0x004020110a000a10),    SS(0x000000010a000a01),    SS(0x804020100a000a10),    SS(0x000000100a000a11),
-    SS(0x000020110a000a11),    SS(0x000000110a000a10),    SS(0x000000000a000a00),    SS(0x000000100a000a10),
-    SS(0x000000010a000a01),    SS(0x000000110a000a11),    SS(0x000000000a000a01),    SS(0x000000000a000a00),
-    SS(0x000000010a000a00),    SS(0x000000010a000a01),    SS(0x004020100a000a10),    SS(0x000000000a000a01),
-    SS(0x000020110a000a11),    SS(0x000000010a000a00),    SS(0x000020100a000a11),    SS(0x000000100a000a10),
-    SS(0x000020110a000a10),    SS(0x000000110a000a11),    SS(0x000000000a000a01),    SS(0x000000100a000a11),
-    SS(0x000000010a000a00),    SS(0x000000110a000a10),    SS(0x000000000a000a00),    SS(0x000000000a000a01),
-    SS(0x000000010a000a11),    SS(0x000000010a000a00),    SS(0x000020100a000a11),    SS(0x000000000a000a00),
-    SS(0x000020110a000a10),    SS(0x000000010a000a11),    SS(0x000020100a000a10),    SS(0x000000100a000a11),
-    SS(0x804020110a000a01),    SS(0x000000110a000a10),    SS(0x000000000a000a00),    SS(0x000000100a000a10),
-    SS(0x000000010a000a11),    SS(0x000000110a000a01),    SS(0x000000000a000a11),    SS(0x000000000a000a00),
-    SS(0x000000010a000a10),    SS(0x000000010a000a11),    SS(0x000020100a000a10),    SS(0x000000000a000a11),
-    SS(0x004020110a000a01),    SS(0x000000010a000a10),    SS(0x804020100a000a01),    SS(0x000000100a000a10),
-    SS(0x804020110a000a00),    SS(0x000000110a000a01),    SS(0x000000000a000a11),    SS(0x000000100a000a01),
-    SS(0x000000010a000a10),    SS(0x000000110a000a00),    SS(0x000000000a000a10),    SS(0x000000000a000a11),
-    SS(0x000000010a000a11),    SS(0x000000010a000a10),    SS(0x004020100a000a01),    SS(0x000000000a000a10),
-    SS(0x004020110a000a00),    SS(0x000000010a000a11),    SS(0x804020100a000a00),    SS(0x000000100a000a01),
-    SS(0x000020110a000a01),    SS(0x000000110a000a00),    SS(0x000000000a000a10),    SS(0x000000100a000a00),
-    SS(0x000000010a000a11),    SS(0x000000110a000a01),    SS(0x000000000a000a11),    SS(0x000000000a000a10),
-    SS(0x000000010a000a10),    SS(0x000000010a000a11),    SS(0x004020100a000a00),    SS(0x000000000a000a11),
-    SS(0x000020110a000a01),    SS(0x000000010a000a10),    SS(0x000020100a000a01),    SS(0x000000100a000a00),
-    SS(0x000020110a000a00),    SS(0x000000110a000a01),    SS(0x000000000a000a11),    SS(0x000000100a000a01),
-    SS(0x000000010a000a10),    SS(0x000000110a000a00),    SS(0x000000000a000a10),    SS(0x000000000a000a11),
-    SS(0x000000010a000a01),    SS(0x000000010a000a10),    SS(0x000020100a000a01),    SS(0x000000000a000a10),
-    SS(0x000020110a000a00),    SS(0x000000010a000a01),    SS(0x000020100a000a00),    SS(0x000000100a000a01),
-    SS(0x0080412214001422),    SS(0x0000000014001400),    SS(0x0000000014001402),    SS(0x0000000214001400),
-    SS(0x0000000014001402),    SS(0x0000000214001400),    SS(0x0000010214001402),    SS(0x0000000014001420),
-    SS(0x0080412214001420),    SS(0x0080402214001422),    SS(0x0000000014001400),    SS(0x0000000014001402),
-    SS(0x0000000014001400),    SS(0x0000000014001402),    SS(0x0000010214001400),    SS(0x0000000214001402),
-    SS(0x0080402014001422),    SS(0x0080402214001420),    SS(0x0000412214001422),    SS(0x0000000014001400),
-    SS(0x0000012214001422),    SS(0x0000000014001400),    SS(0x0000000014001402),    SS(0x0000000214001400),
-    SS(0x0080402014001420),    SS(0x0080402014001422),    SS(0x0000412214001420),    SS(0x0000402214001422),
-    SS(0x0000012214001420),    SS(0x0000002214001422),    SS(0x0000000014001400),    SS(0x0000000014001402),
-    SS(0x0080412214001402),    SS(0x0080402014001420),    SS(0x0000402014001422),    SS(0x0000402214001420),
-    SS(0x0000002014001422),    SS(0x0000002214001420),    SS(0x0000012214001422),    SS(0x0000000014001400),
-    SS(0x0080412214001400),    SS(0x0080402214001402),    SS(0x0000402014001420),    SS(0x0000402014001422),
-    SS(0x0000002014001420),    SS(0x0000002014001422),    SS(0x0000012214001420),    SS(0x0000002214001422),
-    SS(0x0080402014001402),    SS(0x0080402214001400),    SS(0x0000412214001402),    SS(0x0000402014001420),
-    SS(0x0000012214001402),    SS(0x0000002014001420),    SS(0x0000002014001422),    SS(0x0000002214001420),
-    SS(0x0080402014001400),    SS(0x0080402014001402),    SS(0x0000412214001400),    SS(0x0000402214001402),
-    SS(0x0000012214001400),    SS(0x0000002214001402),    SS(0x0000002014001420),    SS(0x0000002014001422),
-    SS(0x0000010214001422),    SS(0x0080402014001400),    SS(0x0000402014001402),    SS(0x0000402214001400),
-    SS(0x0000002014001402),    SS(0x0000002214001400),    SS(0x0000012214001402),    SS(0x0000002014001420),
-    SS(0x0000010214001420),    SS(0x0000000214001422),    SS(0x0000402014001400),    SS(0x0000402014001402),
-    SS(0x0000002014001400),    SS(0x0000002014001402),    SS(0x0000012214001400),    SS(0x0000002214001402),
-    SS(0x0000000014001422),    SS(0x0000000214001420),    SS(0x0000010214001422),    SS(0x0000402014001400),
-    SS(0x0000010214001422),    SS(0x0000002014001400),    SS(0x0000002014001402),    SS(0x0000002214001400),
-    SS(0x0000000014001420),    SS(0x0000000014001422),    SS(0x0000010214001420),    SS(0x0000000214001422),
-    SS(0x0000010214001420),    SS(0x0000000214001422),    SS(0x0000002014001400),    SS(0x0000002014001402),
-    SS(0x0000010214001402),    SS(0x0000000014001420),    SS(0x0000000014001422),    SS(0x0000000214001420),
-    SS(0x0000000014001422),    SS(0x0000000214001420),    SS(0x0000010214001422),    SS(0x0000002014001400),
-    SS(0x0000010214001400),    SS(0x0000000214001402),    SS(0x0000000014001420),    SS(0x0000000014001422),
-    SS(0x0000000014001420),    SS(0x0000000014001422),    SS(0x0000010214001420),    SS(0x0000000214001422),
-    SS(0x0000000014001402),    SS(0x0000000214001400),    SS(0x0000010214001402),    SS(0x0000000014001420),
-    SS(0x0000010214001402),    SS(0x0000000014001420),    SS(0x0000000014001422),    SS(0x0000000214001420),
-    SS(0x0000000014001400),    SS(0x0000000014001402),    SS(0x0000010214001400),    SS(0x0000000214001402),
-    SS(0x0000010214001400),    SS(0x0000000214001402),    SS(0x0000000014001420),    SS(0x0000000014001422),
-    SS(0x0001824428002844),    SS(0x0000000428002804),    SS(0x0000804028002844),    SS(0x0000000028002804),
-    SS(0x0001824428002840),    SS(0x0000000428002800),    SS(0x0000804028002840),    SS(0x0000000028002800),
-    SS(0x0001024428002844),    SS(0x0001020428002844),    SS(0x0000004028002844),    SS(0x0000000028002844),
-    SS(0x0001024428002840),    SS(0x0001020428002840),    SS(0x0000004028002840),    SS(0x0000000028002840),
-    SS(0x0001824428002804),    SS(0x0001020428002844),    SS(0x0000804028002804),    SS(0x0000000028002844),
-    SS(0x0001824428002800),    SS(0x0001020428002840),    SS(0x0000804028002800),    SS(0x0000000028002840),
-    SS(0x0001024428002804),    SS(0x0001020428002804),    SS(0x0000004028002804),    SS(0x0000000028002804),
-    SS(0x0001024428002800),    SS(0x0001020428002800),    SS(0x0000004028002800),    SS(0x0000000028002800),
-    SS(0x0000804428002844),    SS(0x0001020428002804),    SS(0x0000804028002844),    SS(0x0000000028002804),
-    SS(0x0000804428002840),    SS(0x0001020428002800),    SS(0x0000804028002840),    SS(0x0000000028002800),
-    SS(0x0000004428002844),    SS(0x0000000428002844),    SS(0x0000004028002844),    SS(0x0000000028002844),
-    SS(0x0000004428002840),    SS(0x0000000428002840),    SS(0x0000004028002840),    SS(0x0000000028002840),
-    SS(0x0000804428002804),    SS(0x0000000428002844),    SS(0x0000804028002804),    SS(0x0000000028002844),
-    SS(0x0000804428002800),    SS(0x0000000428002840),    SS(0x0000804028002800),    SS(0x0000000028002840),
-    SS(0x0000004428002804),    SS(0x0000000428002804),    SS(0x0000004028002804),    SS(0x0000000028002804),
-    SS(0x0000004428002800),    SS(0x0000000428002800),    SS(0x0000004028002800),    SS(0x0000000028002800),
-    SS(0x0000824428002844),    SS(0x0000000428002804),    SS(0x0000804028002844),    SS(0x0000000028002804),
-    SS(0x0000824428002840),    SS(0x0000000428002800),    SS(0x0000804028002840),    SS(0x0000000028002800),
-    SS(0x0000024428002844),    SS(0x0000020428002844),    SS(0x0000004028002844),    SS(0x0000000028002844),
-    SS(0x0000024428002840),    SS(0x0000020428002840),    SS(0x0000004028002840),    SS(0x0000000028002840),
-    SS(0x0000824428002804),    SS(0x0000020428002844),    SS(0x0000804028002804),    SS(0x0000000028002844),
-    SS(0x0000824428002800),    SS(0x0000020428002840),    SS(0x0000804028002800),    SS(0x0000000028002840),
-    SS(0x0000024428002804),    SS(0x0000020428002804),    SS(0x0000004028002804),    SS(0x0000000028002804),
-    SS(0x0000024428002800),    SS(0x0000020428002800),    SS(0x0000004028002800),    SS(0x0000000028002800),
-    SS(0x0000804428002844),    SS(0x0000020428002804),    SS(0x0000804028002844),    SS(0x0000000028002804),
-    SS(0x0000804428002840),    SS(0x0000020428002800),    SS(0x0000804028002840),    SS(0x0000000028002800),
-    SS(0x0000004428002844),    SS(0x0000000428002844),    SS(0x0000004028002844),    SS(0x0000000028002844),
-    SS(0x0000004428002840),    SS(0x0000000428002840),    SS(0x0000004028002840),    SS(0x0000000028002840),
-    SS(0x0000804428002804),    SS(0x0000000428002844),    SS(0x0000804028002804),    SS(0x0000000028002844),
-    SS(0x0000804428002800),    SS(0x0000000428002840),    SS(0x0000804028002800),    SS(0x0000000028002840),
-    SS(0x0000004428002804),    SS(0x0000000428002804),    SS(0x0000004028002804),    SS(0x0000000028002804),
-    SS(0x0000004428002800),    SS(0x0000000428002800),    SS(0x0000004028002800),    SS(0x0000000028002800),
-    SS(0x0102048850005088),    SS(0x0000008050005008),    SS(0x0000008850005088),    SS(0x0000008050005008),
-    SS(0x0102040850005088),    SS(0x0000000050005008),    SS(0x0000000850005088),    SS(0x0000000050005008),
-    SS(0x0000048850005088),    SS(0x0000008050005008),    SS(0x0000008850005088),    SS(0x0000008050005008),
-    SS(0x0000040850005088),    SS(0x0000000050005008),    SS(0x0000000850005088),    SS(0x0000000050005008),
-    SS(0x0102048850005080),    SS(0x0000008050005000),    SS(0x0000008850005080),    SS(0x0000008050005000),
-    SS(0x0102040850005080),    SS(0x0000000050005000),    SS(0x0000000850005080),    SS(0x0000000050005000),
-    SS(0x0000048850005080),    SS(0x0000008050005000),    SS(0x0000008850005080),    SS(0x0000008050005000),
-    SS(0x0000040850005080),    SS(0x0000000050005000),    SS(0x0000000850005080),    SS(0x0000000050005000),
-    SS(0x0002048850005088),    SS(0x0000008050005088),    SS(0x0000008850005088),    SS(0x0000008050005088),
-    SS(0x0002040850005088),    SS(0x0000000050005088),    SS(0x0000000850005088),    SS(0x0000000050005088),
-    SS(0x0000048850005088),    SS(0x0000008050005088),    SS(0x0000008850005088),    SS(0x0000008050005088),
-    SS(0x0000040850005088),    SS(0x0000000050005088),    SS(0x0000000850005088),    SS(0x0000000050005088),
-    SS(0x0002048850005080),    SS(0x0000008050005080),    SS(0x0000008850005080),    SS(0x0000008050005080),
-    SS(0x0002040850005080),    SS(0x0000000050005080),    SS(0x0000000850005080),    SS(0x0000000050005080),
-    SS(0x0000048850005080),    SS(0x0000008050005080),    SS(0x0000008850005080),    SS(0x0000008050005080),
-    SS(0x0000040850005080),    SS(0x0000000050005080),    SS(0x0000000850005080),    SS(0x0000000050005080),
-    SS(0x0102048850005008),    SS(0x0000008050005088),    SS(0x0000008850005008),    SS(0x0000008050005088),
-    SS(0x0102040850005008),    SS(0x0000000050005088),    SS(0x0000000850005008),    SS(0x0000000050005088),
-    SS(0x0000048850005008),    SS(0x0000008050005088),    SS(0x0000008850005008),    SS(0x0000008050005088),
-    SS(0x0000040850005008),    SS(0x0000000050005088),    SS(0x0000000850005008),    SS(0x0000000050005088),
-    SS(0x0102048850005000),    SS(0x0000008050005080),    SS(0x0000008850005000),    SS(0x0000008050005080),
-    SS(0x0102040850005000),    SS(0x0000000050005080),    SS(0x0000000850005000),    SS(0x0000000050005080),
-    SS(0x0000048850005000),    SS(0x0000008050005080),    SS(0x0000008850005000),    SS(0x0000008050005080),
-    SS(0x0000040850005000),    SS(0x0000000050005080),    SS(0x0000000850005000),    SS(0x0000000050005080),
-    SS(0x0002048850005008),    SS(0x0000008050005008),    SS(0x0000008850005008),    SS(0x0000008050005008),
-    SS(0x0002040850005008),    SS(0x0000000050005008),    SS(0x0000000850005008),    SS(0x0000000050005008),
-    SS(0x0000048850005008),    SS(0x0000008050005008),    SS(0x0000008850005008),    SS(0x0000008050005008),
-    SS(0x0000040850005008),    SS(0x0000000050005008),    SS(0x0000000850005008),    SS(0x0000000050005008),
-    SS(0x0002048850005000),    SS(0x0000008050005000),    SS(0x0000008850005000),    SS(0x0000008050005000),
-    SS(0x0002040850005000),    SS(0x0000000050005000),    SS(0x0000000850005000),    SS(0x0000000050005000),
-    SS(0x0000048850005000),    SS(0x0000008050005000),    SS(0x0000008850005000),    SS(0x0000008050005000),
-    SS(0x0000040850005000),    SS(0x0000000050005000),    SS(0x0000000850005000),    SS(0x0000000050005000),
-    SS(0x02040810a000a010),    SS(0x00000000a000a000),    SS(0x00040810a000a010),    SS(0x00000000a000a000),
-    SS(0x00000000a000a010),    SS(0x00000010a000a000),    SS(0x00000000a000a010),    SS(0x00000010a000a000),
-    SS(0x02040810a000a000),    SS(0x00000810a000a010),    SS(0x00040810a000a000),    SS(0x00000810a000a010),
-    SS(0x00000000a000a000),    SS(0x00000000a000a010),    SS(0x00000000a000a000),    SS(0x00000000a000a010),
-    SS(0x00000000a000a010),    SS(0x00000810a000a000),    SS(0x00000000a000a010),    SS(0x00000810a000a000),
-    SS(0x00000010a000a010),    SS(0x00000000a000a000),    SS(0x00000010a000a010),    SS(0xffffffffffffffff),
-    SS(0x00000000a000a000),    SS(0x00000000a000a010),    SS(0x00000000a000a000),    SS(0x00000000a000a010),
-    SS(0x00000010a000a000),    SS(0x00000010a000a010),    SS(0x00000010a000a000),    SS(0x00000010a000a010),
-    SS(0x0408102040004020),    SS(0x0000000040004000),    SS(0x0008102040004020),    SS(0x0000000040004000),
-    SS(0x0000102040004020),    SS(0x0000000040004020),    SS(0x0000102040004020),    SS(0x0000000040004020),
-    SS(0x0408102040004000),    SS(0x0000000040004020),    SS(0x0008102040004000),    SS(0x0000000040004020),
-    SS(0x0000102040004000),    SS(0x0000000040004000),    SS(0x0000102040004000),    SS(0x0000000040004000),
-    SS(0x0000002040004020),    SS(0x0000000040004000),    SS(0x0000002040004020),    SS(0x0000000040004000),
-    SS(0x0000002040004020),    SS(0x0000000040004020),    SS(0x0000002040004020),    SS(0x0000000040004020),
-    SS(0x0000002040004000),    SS(0x0000000040004020),    SS(0x0000002040004000),    SS(0x0000000040004020),
-    SS(0x0000002040004000),    SS(0x0000000040004000),    SS(0x0000002040004000),    SS(0x0000000040004000),
-    SS(0x1008040200020408),    SS(0x0000000200020408),    SS(0x0008040200020000),    SS(0x0000000200020000),
-    SS(0x0000040200020000),    SS(0x0000000200020000),    SS(0x0008040200020408),    SS(0x0000000200020408),
-    SS(0x0000040200020408),    SS(0x0000000200020408),    SS(0x0000040200020000),    SS(0x0000000200020000),
-    SS(0x1008040200020400),    SS(0x0000000200020400),    SS(0x0000040200020408),    SS(0x0000000200020408),
-    SS(0x1008040200020000),    SS(0x0000000200020000),    SS(0x0008040200020400),    SS(0x0000000200020400),
-    SS(0x0000040200020400),    SS(0x0000000200020400),    SS(0x0008040200020000),    SS(0x0000000200020000),
-    SS(0x0000040200020000),    SS(0x0000000200020000),    SS(0x0000040200020400),    SS(0x0000000200020400),
-    SS(0x1008040200020000),    SS(0x0000000200020000),    SS(0x0000040200020000),    SS(0x0000000200020000),
-    SS(0x2010080500050810),    SS(0x0000080500050000),    SS(0x2010080500050000),    SS(0x2010080500050800),
-    SS(0x0000080500050810),    SS(0x2010080500050000),    SS(0x0000080500050000),    SS(0x0000080500050800),
-    SS(0x0000000500050810),    SS(0x0000080500050000),    SS(0x0000000500050000),    SS(0x0000000500050800),
-    SS(0x0000000500050810),    SS(0x0000000500050000),    SS(0x0000000500050000),    SS(0x0000000500050800),
-    SS(0x0000000500050810),    SS(0x0000000500050000),    SS(0x0000000500050000),    SS(0x0000000500050800),
-    SS(0x0000000500050810),    SS(0x0000000500050000),    SS(0x0000000500050000),    SS(0x0000000500050800),
-    SS(0x0010080500050810),    SS(0x0000000500050000),    SS(0x0010080500050000),    SS(0x0010080500050800),
-    SS(0x0000080500050810),    SS(0x0010080500050000),    SS(0x0000080500050000),    SS(0x0000080500050800),
-    SS(0x4020110a000a1120),    SS(0x4020110a000a1020),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x0000010a000a1100),    SS(0x0000010a000a1000),    SS(0x4020110a000a0100),    SS(0x4020110a000a0000),
-    SS(0x4020100a000a1120),    SS(0x4020100a000a1020),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1100),    SS(0x0000000a000a1000),    SS(0x4020100a000a0100),    SS(0x4020100a000a0000),
-    SS(0x0000110a000a1120),    SS(0x0000110a000a1020),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x0020110a000a1120),    SS(0x0020110a000a1020),    SS(0x0000110a000a0100),    SS(0x0000110a000a0000),
-    SS(0x0000100a000a1120),    SS(0x0000100a000a1020),    SS(0x0020110a000a0100),    SS(0x0020110a000a0000),
-    SS(0x0020100a000a1120),    SS(0x0020100a000a1020),    SS(0x0000100a000a0100),    SS(0x0000100a000a0000),
-    SS(0x0000010a000a1120),    SS(0x0000010a000a1020),    SS(0x0020100a000a0100),    SS(0x0020100a000a0000),
-    SS(0x0000110a000a1120),    SS(0x0000110a000a1020),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1120),    SS(0x0000000a000a1020),    SS(0x0000110a000a0100),    SS(0x0000110a000a0000),
-    SS(0x0000100a000a1120),    SS(0x0000100a000a1020),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x0000010a000a1120),    SS(0x0000010a000a1020),    SS(0x0000100a000a0100),    SS(0x0000100a000a0000),
-    SS(0x0000010a000a1120),    SS(0x0000010a000a1020),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1120),    SS(0x0000000a000a1020),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1120),    SS(0x0000000a000a1020),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x4020110a000a1100),    SS(0x4020110a000a1000),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x0000010a000a1120),    SS(0x0000010a000a1020),    SS(0x4020110a000a0100),    SS(0x4020110a000a0000),
-    SS(0x4020100a000a1100),    SS(0x4020100a000a1000),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1120),    SS(0x0000000a000a1020),    SS(0x4020100a000a0100),    SS(0x4020100a000a0000),
-    SS(0x0000110a000a1100),    SS(0x0000110a000a1000),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x0020110a000a1100),    SS(0x0020110a000a1000),    SS(0x0000110a000a0100),    SS(0x0000110a000a0000),
-    SS(0x0000100a000a1100),    SS(0x0000100a000a1000),    SS(0x0020110a000a0100),    SS(0x0020110a000a0000),
-    SS(0x0020100a000a1100),    SS(0x0020100a000a1000),    SS(0x0000100a000a0100),    SS(0x0000100a000a0000),
-    SS(0x0000010a000a1100),    SS(0x0000010a000a1000),    SS(0x0020100a000a0100),    SS(0x0020100a000a0000),
-    SS(0x0000110a000a1100),    SS(0x0000110a000a1000),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1100),    SS(0x0000000a000a1000),    SS(0x0000110a000a0100),    SS(0x0000110a000a0000),
-    SS(0x0000100a000a1100),    SS(0x0000100a000a1000),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x0000010a000a1100),    SS(0x0000010a000a1000),    SS(0x0000100a000a0100),    SS(0x0000100a000a0000),
-    SS(0x0000010a000a1100),    SS(0x0000010a000a1000),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1100),    SS(0x0000000a000a1000),    SS(0x0000010a000a0100),    SS(0x0000010a000a0000),
-    SS(0x0000000a000a1100),    SS(0x0000000a000a1000),    SS(0x0000000a000a0100),    SS(0x0000000a000a0000),
-    SS(0x8041221400142241),    SS(0x0000001400142200),    SS(0x8041221400142040),    SS(0x0000001400142000),
-    SS(0x8040221400142241),    SS(0x0000001400142200),    SS(0x8040221400142040),    SS(0x0000001400142000),
-    SS(0x8041221400140201),    SS(0x0000001400140200),    SS(0x8041221400140000),    SS(0x0000001400140000),
-    SS(0x8040221400140201),    SS(0x0000001400140200),    SS(0x8040221400140000),    SS(0x0000001400140000),
-    SS(0x0041221400142201),    SS(0x8041221400142240),    SS(0x0041221400142000),    SS(0x8041221400142040),
-    SS(0x0040221400142201),    SS(0x8040221400142240),    SS(0x0040221400142000),    SS(0x8040221400142040),
-    SS(0x0041221400140201),    SS(0x8041221400140200),    SS(0x0041221400140000),    SS(0x8041221400140000),
-    SS(0x0040221400140201),    SS(0x8040221400140200),    SS(0x0040221400140000),    SS(0x8040221400140000),
-    SS(0x8040201400142241),    SS(0x0041221400142200),    SS(0x8040201400142040),    SS(0x0041221400142000),
-    SS(0x8040201400142241),    SS(0x0040221400142200),    SS(0x8040201400142040),    SS(0x0040221400142000),
-    SS(0x8040201400140201),    SS(0x0041221400140200),    SS(0x8040201400140000),    SS(0x0041221400140000),
-    SS(0x8040201400140201),    SS(0x0040221400140200),    SS(0x8040201400140000),    SS(0x0040221400140000),
-    SS(0x0040201400142201),    SS(0x8040201400142240),    SS(0x0040201400142000),    SS(0x8040201400142040),
-    SS(0x0040201400142201),    SS(0x8040201400142240),    SS(0x0040201400142000),    SS(0x8040201400142040),
-    SS(0x0040201400140201),    SS(0x8040201400140200),    SS(0x0040201400140000),    SS(0x8040201400140000),
-    SS(0x0040201400140201),    SS(0x8040201400140200),    SS(0x0040201400140000),    SS(0x8040201400140000),
-    SS(0x0001221400142241),    SS(0x0040201400142200),    SS(0x0001221400142040),    SS(0x0040201400142000),
-    SS(0x0000221400142241),    SS(0x0040201400142200),    SS(0x0000221400142040),    SS(0x0040201400142000),
-    SS(0x0001221400140201),    SS(0x0040201400140200),    SS(0x0001221400140000),    SS(0x0040201400140000),
-    SS(0x0000221400140201),    SS(0x0040201400140200),    SS(0x0000221400140000),    SS(0x0040201400140000),
-    SS(0x0001221400142201),    SS(0x0001221400142240),    SS(0x0001221400142000),    SS(0x0001221400142040),
-    SS(0x0000221400142201),    SS(0x0000221400142240),    SS(0x0000221400142000),    SS(0x0000221400142040),
-    SS(0x0001221400140201),    SS(0x0001221400140200),    SS(0x0001221400140000),    SS(0x0001221400140000),
-    SS(0x0000221400140201),    SS(0x0000221400140200),    SS(0x0000221400140000),    SS(0x0000221400140000),
-    SS(0x0000201400142241),    SS(0x0001221400142200),    SS(0x0000201400142040),    SS(0x0001221400142000),
-    SS(0x0000201400142241),    SS(0x0000221400142200),    SS(0x0000201400142040),    SS(0x0000221400142000),
-    SS(0x0000201400140201),    SS(0x0001221400140200),    SS(0x0000201400140000),    SS(0x0001221400140000),
-    SS(0x0000201400140201),    SS(0x0000221400140200),    SS(0x0000201400140000),    SS(0x0000221400140000),
-    SS(0x0000201400142201),    SS(0x0000201400142240),    SS(0x0000201400142000),    SS(0x0000201400142040),
-    SS(0x0000201400142201),    SS(0x0000201400142240),    SS(0x0000201400142000),    SS(0x0000201400142040),
-    SS(0x0000201400140201),    SS(0x0000201400140200),    SS(0x0000201400140000),    SS(0x0000201400140000),
-    SS(0x0000201400140201),    SS(0x0000201400140200),    SS(0x0000201400140000),    SS(0x0000201400140000),
-    SS(0x0001021400142241),    SS(0x0000201400142200),    SS(0x0001021400142040),    SS(0x0000201400142000),
-    SS(0x0000021400142241),    SS(0x0000201400142200),    SS(0x0000021400142040),    SS(0x0000201400142000),
-    SS(0x0001021400140201),    SS(0x0000201400140200),    SS(0x0001021400140000),    SS(0x0000201400140000),
-    SS(0x0000021400140201),    SS(0x0000201400140200),    SS(0x0000021400140000),    SS(0x0000201400140000),
-    SS(0x0001021400142201),    SS(0x0001021400142240),    SS(0x0001021400142000),    SS(0x0001021400142040),
-    SS(0x0000021400142201),    SS(0x0000021400142240),    SS(0x0000021400142000),    SS(0x0000021400142040),
-    SS(0x0001021400140201),    SS(0x0001021400140200),    SS(0x0001021400140000),    SS(0x0001021400140000),
-    SS(0x0000021400140201),    SS(0x0000021400140200),    SS(0x0000021400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142241),    SS(0x0001021400142200),    SS(0x0000001400142040),    SS(0x0001021400142000),
-    SS(0x0000001400142241),    SS(0x0000021400142200),    SS(0x0000001400142040),    SS(0x0000021400142000),
-    SS(0x0000001400140201),    SS(0x0001021400140200),    SS(0x0000001400140000),    SS(0x0001021400140000),
-    SS(0x0000001400140201),    SS(0x0000021400140200),    SS(0x0000001400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0001021400142241),    SS(0x0000001400142200),    SS(0x0001021400142040),    SS(0x0000001400142000),
-    SS(0x0000021400142241),    SS(0x0000001400142200),    SS(0x0000021400142040),    SS(0x0000001400142000),
-    SS(0x0001021400140201),    SS(0x0000001400140200),    SS(0x0001021400140000),    SS(0x0000001400140000),
-    SS(0x0000021400140201),    SS(0x0000001400140200),    SS(0x0000021400140000),    SS(0x0000001400140000),
-    SS(0x0001021400142201),    SS(0x0001021400142240),    SS(0x0001021400142000),    SS(0x0001021400142040),
-    SS(0x0000021400142201),    SS(0x0000021400142240),    SS(0x0000021400142000),    SS(0x0000021400142040),
-    SS(0x0001021400140201),    SS(0x0001021400140200),    SS(0x0001021400140000),    SS(0x0001021400140000),
-    SS(0x0000021400140201),    SS(0x0000021400140200),    SS(0x0000021400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142241),    SS(0x0001021400142200),    SS(0x0000001400142040),    SS(0x0001021400142000),
-    SS(0x0000001400142241),    SS(0x0000021400142200),    SS(0x0000001400142040),    SS(0x0000021400142000),
-    SS(0x0000001400140201),    SS(0x0001021400140200),    SS(0x0000001400140000),    SS(0x0001021400140000),
-    SS(0x0000001400140201),    SS(0x0000021400140200),    SS(0x0000001400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0041221400142241),    SS(0x0000001400142200),    SS(0x0041221400142040),    SS(0x0000001400142000),
-    SS(0x0040221400142241),    SS(0x0000001400142200),    SS(0x0040221400142040),    SS(0x0000001400142000),
-    SS(0x0041221400140201),    SS(0x0000001400140200),    SS(0x0041221400140000),    SS(0x0000001400140000),
-    SS(0x0040221400140201),    SS(0x0000001400140200),    SS(0x0040221400140000),    SS(0x0000001400140000),
-    SS(0x8041221400142201),    SS(0x0041221400142240),    SS(0x8041221400142000),    SS(0x0041221400142040),
-    SS(0x8040221400142201),    SS(0x0040221400142240),    SS(0x8040221400142000),    SS(0x0040221400142040),
-    SS(0x8041221400140201),    SS(0x0041221400140200),    SS(0x8041221400140000),    SS(0x0041221400140000),
-    SS(0x8040221400140201),    SS(0x0040221400140200),    SS(0x8040221400140000),    SS(0x0040221400140000),
-    SS(0x0040201400142241),    SS(0x8041221400142200),    SS(0x0040201400142040),    SS(0x8041221400142000),
-    SS(0x0040201400142241),    SS(0x8040221400142200),    SS(0x0040201400142040),    SS(0x8040221400142000),
-    SS(0x0040201400140201),    SS(0x8041221400140200),    SS(0x0040201400140000),    SS(0x8041221400140000),
-    SS(0x0040201400140201),    SS(0x8040221400140200),    SS(0x0040201400140000),    SS(0x8040221400140000),
-    SS(0x8040201400142201),    SS(0x0040201400142240),    SS(0x8040201400142000),    SS(0x0040201400142040),
-    SS(0x8040201400142201),    SS(0x0040201400142240),    SS(0x8040201400142000),    SS(0x0040201400142040),
-    SS(0x8040201400140201),    SS(0x0040201400140200),    SS(0x8040201400140000),    SS(0x0040201400140000),
-    SS(0x8040201400140201),    SS(0x0040201400140200),    SS(0x8040201400140000),    SS(0x0040201400140000),
-    SS(0x0001221400142241),    SS(0x8040201400142200),    SS(0x0001221400142040),    SS(0x8040201400142000),
-    SS(0x0000221400142241),    SS(0x8040201400142200),    SS(0x0000221400142040),    SS(0x8040201400142000),
-    SS(0x0001221400140201),    SS(0x8040201400140200),    SS(0x0001221400140000),    SS(0x8040201400140000),
-    SS(0x0000221400140201),    SS(0x8040201400140200),    SS(0x0000221400140000),    SS(0x8040201400140000),
-    SS(0x0001221400142201),    SS(0x0001221400142240),    SS(0x0001221400142000),    SS(0x0001221400142040),
-    SS(0x0000221400142201),    SS(0x0000221400142240),    SS(0x0000221400142000),    SS(0x0000221400142040),
-    SS(0x0001221400140201),    SS(0x0001221400140200),    SS(0x0001221400140000),    SS(0x0001221400140000),
-    SS(0x0000221400140201),    SS(0x0000221400140200),    SS(0x0000221400140000),    SS(0x0000221400140000),
-    SS(0x0000201400142241),    SS(0x0001221400142200),    SS(0x0000201400142040),    SS(0x0001221400142000),
-    SS(0x0000201400142241),    SS(0x0000221400142200),    SS(0x0000201400142040),    SS(0x0000221400142000),
-    SS(0x0000201400140201),    SS(0x0001221400140200),    SS(0x0000201400140000),    SS(0x0001221400140000),
-    SS(0x0000201400140201),    SS(0x0000221400140200),    SS(0x0000201400140000),    SS(0x0000221400140000),
-    SS(0x0000201400142201),    SS(0x0000201400142240),    SS(0x0000201400142000),    SS(0x0000201400142040),
-    SS(0x0000201400142201),    SS(0x0000201400142240),    SS(0x0000201400142000),    SS(0x0000201400142040),
-    SS(0x0000201400140201),    SS(0x0000201400140200),    SS(0x0000201400140000),    SS(0x0000201400140000),
-    SS(0x0000201400140201),    SS(0x0000201400140200),    SS(0x0000201400140000),    SS(0x0000201400140000),
-    SS(0x0001021400142241),    SS(0x0000201400142200),    SS(0x0001021400142040),    SS(0x0000201400142000),
-    SS(0x0000021400142241),    SS(0x0000201400142200),    SS(0x0000021400142040),    SS(0x0000201400142000),
-    SS(0x0001021400140201),    SS(0x0000201400140200),    SS(0x0001021400140000),    SS(0x0000201400140000),
-    SS(0x0000021400140201),    SS(0x0000201400140200),    SS(0x0000021400140000),    SS(0x0000201400140000),
-    SS(0x0001021400142201),    SS(0x0001021400142240),    SS(0x0001021400142000),    SS(0x0001021400142040),
-    SS(0x0000021400142201),    SS(0x0000021400142240),    SS(0x0000021400142000),    SS(0x0000021400142040),
-    SS(0x0001021400140201),    SS(0x0001021400140200),    SS(0x0001021400140000),    SS(0x0001021400140000),
-    SS(0x0000021400140201),    SS(0x0000021400140200),    SS(0x0000021400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142241),    SS(0x0001021400142200),    SS(0x0000001400142040),    SS(0x0001021400142000),
-    SS(0x0000001400142241),    SS(0x0000021400142200),    SS(0x0000001400142040),    SS(0x0000021400142000),
-    SS(0x0000001400140201),    SS(0x0001021400140200),    SS(0x0000001400140000),    SS(0x0001021400140000),
-    SS(0x0000001400140201),    SS(0x0000021400140200),    SS(0x0000001400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0001021400142241),    SS(0x0000001400142200),    SS(0x0001021400142040),    SS(0x0000001400142000),
-    SS(0x0000021400142241),    SS(0x0000001400142200),    SS(0x0000021400142040),    SS(0x0000001400142000),
-    SS(0x0001021400140201),    SS(0x0000001400140200),    SS(0x0001021400140000),    SS(0x0000001400140000),
-    SS(0x0000021400140201),    SS(0x0000001400140200),    SS(0x0000021400140000),    SS(0x0000001400140000),
-    SS(0x0001021400142201),    SS(0x0001021400142240),    SS(0x0001021400142000),    SS(0x0001021400142040),
-    SS(0x0000021400142201),    SS(0x0000021400142240),    SS(0x0000021400142000),    SS(0x0000021400142040),
-    SS(0x0001021400140201),    SS(0x0001021400140200),    SS(0x0001021400140000),    SS(0x0001021400140000),
-    SS(0x0000021400140201),    SS(0x0000021400140200),    SS(0x0000021400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142241),    SS(0x0001021400142200),    SS(0x0000001400142040),    SS(0x0001021400142000),
-    SS(0x0000001400142241),    SS(0x0000021400142200),    SS(0x0000001400142040),    SS(0x0000021400142000),
-    SS(0x0000001400140201),    SS(0x0001021400140200),    SS(0x0000001400140000),    SS(0x0001021400140000),
-    SS(0x0000001400140201),    SS(0x0000021400140200),    SS(0x0000001400140000),    SS(0x0000021400140000),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400142201),    SS(0x0000001400142240),    SS(0x0000001400142000),    SS(0x0000001400142040),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0000001400140201),    SS(0x0000001400140200),    SS(0x0000001400140000),    SS(0x0000001400140000),
-    SS(0x0182442800284482),    SS(0x0080442800284482),    SS(0x0082442800280000),    SS(0x0080442800280000),
-    SS(0x0102042800284080),    SS(0x0000042800284080),    SS(0x0102042800284400),    SS(0x0000042800284400),
-    SS(0x0080402800280000),    SS(0x0080402800280000),    SS(0x0080402800280402),    SS(0x0080402800280402),
-    SS(0x0000002800284480),    SS(0x0000002800284480),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0102442800284482),    SS(0x0000442800284482),    SS(0x0002442800280000),    SS(0x0000442800280000),
-    SS(0x0102042800284080),    SS(0x0000042800284080),    SS(0x0102042800284400),    SS(0x0000042800284400),
-    SS(0x0000402800280000),    SS(0x0000402800280000),    SS(0x0000402800280402),    SS(0x0000402800280402),
-    SS(0x0000002800284480),    SS(0x0000002800284480),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0102042800280402),    SS(0x0000042800280402),    SS(0x0002042800284000),    SS(0x0000042800284000),
-    SS(0x0082442800280400),    SS(0x0080442800280400),    SS(0x0182442800280000),    SS(0x0080442800280000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284402),    SS(0x0000002800284402),
-    SS(0x0080402800280000),    SS(0x0080402800280000),    SS(0x0080402800280400),    SS(0x0080402800280400),
-    SS(0x0102042800280402),    SS(0x0000042800280402),    SS(0x0002042800284000),    SS(0x0000042800284000),
-    SS(0x0002442800280400),    SS(0x0000442800280400),    SS(0x0102442800280000),    SS(0x0000442800280000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284402),    SS(0x0000002800284402),
-    SS(0x0000402800280000),    SS(0x0000402800280000),    SS(0x0000402800280400),    SS(0x0000402800280400),
-    SS(0x0182442800284080),    SS(0x0080442800284080),    SS(0x0182442800284402),    SS(0x0080442800284402),
-    SS(0x0002042800284480),    SS(0x0000042800284480),    SS(0x0102042800284000),    SS(0x0000042800284000),
-    SS(0x0080402800284482),    SS(0x0080402800284482),    SS(0x0080402800280000),    SS(0x0080402800280000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284400),    SS(0x0000002800284400),
-    SS(0x0102442800284080),    SS(0x0000442800284080),    SS(0x0102442800284402),    SS(0x0000442800284402),
-    SS(0x0002042800284480),    SS(0x0000042800284480),    SS(0x0102042800284000),    SS(0x0000042800284000),
-    SS(0x0000402800284482),    SS(0x0000402800284482),    SS(0x0000402800280000),    SS(0x0000402800280000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284400),    SS(0x0000002800284400),
-    SS(0x0102042800280000),    SS(0x0000042800280000),    SS(0x0102042800280402),    SS(0x0000042800280402),
-    SS(0x0082442800280000),    SS(0x0080442800280000),    SS(0x0082442800280400),    SS(0x0080442800280400),
-    SS(0x0000002800280402),    SS(0x0000002800280402),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0080402800280400),    SS(0x0080402800280400),    SS(0x0080402800280000),    SS(0x0080402800280000),
-    SS(0x0102042800280000),    SS(0x0000042800280000),    SS(0x0102042800280402),    SS(0x0000042800280402),
-    SS(0x0002442800280000),    SS(0x0000442800280000),    SS(0x0002442800280400),    SS(0x0000442800280400),
-    SS(0x0000002800280402),    SS(0x0000002800280402),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0000402800280400),    SS(0x0000402800280400),    SS(0x0000402800280000),    SS(0x0000402800280000),
-    SS(0x0082442800284482),    SS(0x0080442800284482),    SS(0x0182442800284000),    SS(0x0080442800284000),
-    SS(0x0002042800284080),    SS(0x0000042800284080),    SS(0x0002042800284400),    SS(0x0000042800284400),
-    SS(0x0080402800284080),    SS(0x0080402800284080),    SS(0x0080402800284402),    SS(0x0080402800284402),
-    SS(0x0000002800284480),    SS(0x0000002800284480),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0002442800284482),    SS(0x0000442800284482),    SS(0x0102442800284000),    SS(0x0000442800284000),
-    SS(0x0002042800284080),    SS(0x0000042800284080),    SS(0x0002042800284400),    SS(0x0000042800284400),
-    SS(0x0000402800284080),    SS(0x0000402800284080),    SS(0x0000402800284402),    SS(0x0000402800284402),
-    SS(0x0000002800284480),    SS(0x0000002800284480),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0002042800280402),    SS(0x0000042800280402),    SS(0x0102042800280000),    SS(0x0000042800280000),
-    SS(0x0182442800284480),    SS(0x0080442800284480),    SS(0x0082442800280000),    SS(0x0080442800280000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280402),    SS(0x0000002800280402),
-    SS(0x0080402800280000),    SS(0x0080402800280000),    SS(0x0080402800280400),    SS(0x0080402800280400),
-    SS(0x0002042800280402),    SS(0x0000042800280402),    SS(0x0102042800280000),    SS(0x0000042800280000),
-    SS(0x0102442800284480),    SS(0x0000442800284480),    SS(0x0002442800280000),    SS(0x0000442800280000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280402),    SS(0x0000002800280402),
-    SS(0x0000402800280000),    SS(0x0000402800280000),    SS(0x0000402800280400),    SS(0x0000402800280400),
-    SS(0x0082442800284080),    SS(0x0080442800284080),    SS(0x0082442800284402),    SS(0x0080442800284402),
-    SS(0x0102042800280400),    SS(0x0000042800280400),    SS(0x0002042800284000),    SS(0x0000042800284000),
-    SS(0x0080402800284482),    SS(0x0080402800284482),    SS(0x0080402800284000),    SS(0x0080402800284000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284400),    SS(0x0000002800284400),
-    SS(0x0002442800284080),    SS(0x0000442800284080),    SS(0x0002442800284402),    SS(0x0000442800284402),
-    SS(0x0102042800280400),    SS(0x0000042800280400),    SS(0x0002042800284000),    SS(0x0000042800284000),
-    SS(0x0000402800284482),    SS(0x0000402800284482),    SS(0x0000402800284000),    SS(0x0000402800284000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284400),    SS(0x0000002800284400),
-    SS(0x0002042800280000),    SS(0x0000042800280000),    SS(0x0002042800280402),    SS(0x0000042800280402),
-    SS(0x0182442800284080),    SS(0x0080442800284080),    SS(0x0182442800284400),    SS(0x0080442800284400),
-    SS(0x0000002800280402),    SS(0x0000002800280402),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0080402800284480),    SS(0x0080402800284480),    SS(0x0080402800280000),    SS(0x0080402800280000),
-    SS(0x0002042800280000),    SS(0x0000042800280000),    SS(0x0002042800280402),    SS(0x0000042800280402),
-    SS(0x0102442800284080),    SS(0x0000442800284080),    SS(0x0102442800284400),    SS(0x0000442800284400),
-    SS(0x0000002800280402),    SS(0x0000002800280402),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0000402800284480),    SS(0x0000402800284480),    SS(0x0000402800280000),    SS(0x0000402800280000),
-    SS(0x0182442800280402),    SS(0x0080442800280402),    SS(0x0082442800284000),    SS(0x0080442800284000),
-    SS(0x0102042800280000),    SS(0x0000042800280000),    SS(0x0102042800280400),    SS(0x0000042800280400),
-    SS(0x0080402800284080),    SS(0x0080402800284080),    SS(0x0080402800284402),    SS(0x0080402800284402),
-    SS(0x0000002800280400),    SS(0x0000002800280400),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0102442800280402),    SS(0x0000442800280402),    SS(0x0002442800284000),    SS(0x0000442800284000),
-    SS(0x0102042800280000),    SS(0x0000042800280000),    SS(0x0102042800280400),    SS(0x0000042800280400),
-    SS(0x0000402800284080),    SS(0x0000402800284080),    SS(0x0000402800284402),    SS(0x0000402800284402),
-    SS(0x0000002800280400),    SS(0x0000002800280400),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0102042800284482),    SS(0x0000042800284482),    SS(0x0002042800280000),    SS(0x0000042800280000),
-    SS(0x0082442800284480),    SS(0x0080442800284480),    SS(0x0182442800284000),    SS(0x0080442800284000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280402),    SS(0x0000002800280402),
-    SS(0x0080402800284080),    SS(0x0080402800284080),    SS(0x0080402800284400),    SS(0x0080402800284400),
-    SS(0x0102042800284482),    SS(0x0000042800284482),    SS(0x0002042800280000),    SS(0x0000042800280000),
-    SS(0x0002442800284480),    SS(0x0000442800284480),    SS(0x0102442800284000),    SS(0x0000442800284000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280402),    SS(0x0000002800280402),
-    SS(0x0000402800284080),    SS(0x0000402800284080),    SS(0x0000402800284400),    SS(0x0000402800284400),
-    SS(0x0182442800280000),    SS(0x0080442800280000),    SS(0x0182442800280402),    SS(0x0080442800280402),
-    SS(0x0002042800280400),    SS(0x0000042800280400),    SS(0x0102042800280000),    SS(0x0000042800280000),
-    SS(0x0080402800280402),    SS(0x0080402800280402),    SS(0x0080402800284000),    SS(0x0080402800284000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280400),    SS(0x0000002800280400),
-    SS(0x0102442800280000),    SS(0x0000442800280000),    SS(0x0102442800280402),    SS(0x0000442800280402),
-    SS(0x0002042800280400),    SS(0x0000042800280400),    SS(0x0102042800280000),    SS(0x0000042800280000),
-    SS(0x0000402800280402),    SS(0x0000402800280402),    SS(0x0000402800284000),    SS(0x0000402800284000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280400),    SS(0x0000002800280400),
-    SS(0x0102042800284080),    SS(0x0000042800284080),    SS(0x0102042800284402),    SS(0x0000042800284402),
-    SS(0x0082442800284080),    SS(0x0080442800284080),    SS(0x0082442800284400),    SS(0x0080442800284400),
-    SS(0x0000002800284482),    SS(0x0000002800284482),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0080402800284480),    SS(0x0080402800284480),    SS(0x0080402800284000),    SS(0x0080402800284000),
-    SS(0x0102042800284080),    SS(0x0000042800284080),    SS(0x0102042800284402),    SS(0x0000042800284402),
-    SS(0x0002442800284080),    SS(0x0000442800284080),    SS(0x0002442800284400),    SS(0x0000442800284400),
-    SS(0x0000002800284482),    SS(0x0000002800284482),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0000402800284480),    SS(0x0000402800284480),    SS(0x0000402800284000),    SS(0x0000402800284000),
-    SS(0x0082442800280402),    SS(0x0080442800280402),    SS(0x0182442800280000),    SS(0x0080442800280000),
-    SS(0x0002042800280000),    SS(0x0000042800280000),    SS(0x0002042800280400),    SS(0x0000042800280400),
-    SS(0x0080402800280000),    SS(0x0080402800280000),    SS(0x0080402800280402),    SS(0x0080402800280402),
-    SS(0x0000002800280400),    SS(0x0000002800280400),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0002442800280402),    SS(0x0000442800280402),    SS(0x0102442800280000),    SS(0x0000442800280000),
-    SS(0x0002042800280000),    SS(0x0000042800280000),    SS(0x0002042800280400),    SS(0x0000042800280400),
-    SS(0x0000402800280000),    SS(0x0000402800280000),    SS(0x0000402800280402),    SS(0x0000402800280402),
-    SS(0x0000002800280400),    SS(0x0000002800280400),    SS(0x0000002800280000),    SS(0x0000002800280000),
-    SS(0x0002042800284482),    SS(0x0000042800284482),    SS(0x0102042800284000),    SS(0x0000042800284000),
-    SS(0x0182442800280400),    SS(0x0080442800280400),    SS(0x0082442800284000),    SS(0x0080442800284000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284402),    SS(0x0000002800284402),
-    SS(0x0080402800284080),    SS(0x0080402800284080),    SS(0x0080402800284400),    SS(0x0080402800284400),
-    SS(0x0002042800284482),    SS(0x0000042800284482),    SS(0x0102042800284000),    SS(0x0000042800284000),
-    SS(0x0102442800280400),    SS(0x0000442800280400),    SS(0x0002442800284000),    SS(0x0000442800284000),
-    SS(0x0000002800284080),    SS(0x0000002800284080),    SS(0x0000002800284402),    SS(0x0000002800284402),
-    SS(0x0000402800284080),    SS(0x0000402800284080),    SS(0x0000402800284400),    SS(0x0000402800284400),
-    SS(0x0082442800280000),    SS(0x0080442800280000),    SS(0x0082442800280402),    SS(0x0080442800280402),
-    SS(0x0102042800284480),    SS(0x0000042800284480),    SS(0x0002042800280000),    SS(0x0000042800280000),
-    SS(0x0080402800280402),    SS(0x0080402800280402),    SS(0x0080402800280000),    SS(0x0080402800280000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280400),    SS(0x0000002800280400),
-    SS(0x0002442800280000),    SS(0x0000442800280000),    SS(0x0002442800280402),    SS(0x0000442800280402),
-    SS(0x0102042800284480),    SS(0x0000042800284480),    SS(0x0002042800280000),    SS(0x0000042800280000),
-    SS(0x0000402800280402),    SS(0x0000402800280402),    SS(0x0000402800280000),    SS(0x0000402800280000),
-    SS(0x0000002800280000),    SS(0x0000002800280000),    SS(0x0000002800280400),    SS(0x0000002800280400),
-    SS(0x0002042800284080),    SS(0x0000042800284080),    SS(0x0002042800284402),    SS(0x0000042800284402),
-    SS(0x0182442800280000),    SS(0x0080442800280000),    SS(0x0182442800280400),    SS(0x0080442800280400),
-    SS(0x0000002800284482),    SS(0x0000002800284482),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0080402800280400),    SS(0x0080402800280400),    SS(0x0080402800284000),    SS(0x0080402800284000),
-    SS(0x0002042800284080),    SS(0x0000042800284080),    SS(0x0002042800284402),    SS(0x0000042800284402),
-    SS(0x0102442800280000),    SS(0x0000442800280000),    SS(0x0102442800280400),    SS(0x0000442800280400),
-    SS(0x0000002800284482),    SS(0x0000002800284482),    SS(0x0000002800284000),    SS(0x0000002800284000),
-    SS(0x0000402800280400),    SS(0x0000402800280400),    SS(0x0000402800284000),    SS(0x0000402800284000),
-    SS(0x0204885000508804),    SS(0x0000085000500000),    SS(0x0204085000508804),    SS(0x0000805000508000),
-    SS(0x0000885000500800),    SS(0x0000005000508000),    SS(0x0000085000500800),    SS(0x0000885000500000),
-    SS(0x0004885000508804),    SS(0x0000085000500000),    SS(0x0004085000508804),    SS(0x0204885000508000),
-    SS(0x0000805000500804),    SS(0x0204085000508000),    SS(0x0000005000500804),    SS(0x0000885000500000),
-    SS(0x0204885000508800),    SS(0x0000085000500000),    SS(0x0204085000508800),    SS(0x0004885000508000),
-    SS(0x0000805000500804),    SS(0x0004085000508000),    SS(0x0000005000500804),    SS(0x0000805000500000),
-    SS(0x0004885000508800),    SS(0x0000005000500000),    SS(0x0004085000508800),    SS(0x0204885000508000),
-    SS(0x0000805000500800),    SS(0x0204085000508000),    SS(0x0000005000500800),    SS(0x0000805000500000),
-    SS(0x0000805000508804),    SS(0x0000005000500000),    SS(0x0000005000508804),    SS(0x0004885000508000),
-    SS(0x0000805000500800),    SS(0x0004085000508000),    SS(0x0000005000500800),    SS(0x0000805000500000),
-    SS(0x0000805000508804),    SS(0x0000005000500000),    SS(0x0000005000508804),    SS(0x0000805000508000),
-    SS(0x0204885000500804),    SS(0x0000005000508000),    SS(0x0204085000500804),    SS(0x0000805000500000),
-    SS(0x0000805000508800),    SS(0x0000005000500000),    SS(0x0000005000508800),    SS(0x0000805000508000),
-    SS(0x0004885000500804),    SS(0x0000005000508000),    SS(0x0004085000500804),    SS(0x0204885000500000),
-    SS(0x0000805000508800),    SS(0x0204085000500000),    SS(0x0000005000508800),    SS(0x0000805000508000),
-    SS(0x0204885000500800),    SS(0x0000005000508000),    SS(0x0204085000500800),    SS(0x0004885000500000),
-    SS(0x0000885000508804),    SS(0x0004085000500000),    SS(0x0000085000508804),    SS(0x0000805000508000),
-    SS(0x0004885000500800),    SS(0x0000005000508000),    SS(0x0004085000500800),    SS(0x0204885000500000),
-    SS(0x0000885000508804),    SS(0x0204085000500000),    SS(0x0000085000508804),    SS(0x0000885000508000),
-    SS(0x0000805000500804),    SS(0x0000085000508000),    SS(0x0000005000500804),    SS(0x0004885000500000),
-    SS(0x0000885000508800),    SS(0x0004085000500000),    SS(0x0000085000508800),    SS(0x0000885000508000),
-    SS(0x0000805000500804),    SS(0x0000085000508000),    SS(0x0000005000500804),    SS(0x0000805000500000),
-    SS(0x0000885000508800),    SS(0x0000005000500000),    SS(0x0000085000508800),    SS(0x0000885000508000),
-    SS(0x0000805000500800),    SS(0x0000085000508000),    SS(0x0000005000500800),    SS(0x0000805000500000),
-    SS(0x0000805000508804),    SS(0x0000005000500000),    SS(0x0000005000508804),    SS(0x0000885000508000),
-    SS(0x0000805000500800),    SS(0x0000085000508000),    SS(0x0000005000500800),    SS(0x0000805000500000),
-    SS(0x0000805000508804),    SS(0x0000005000500000),    SS(0x0000005000508804),    SS(0x0000805000508000),
-    SS(0x0000885000500804),    SS(0x0000005000508000),    SS(0x0000085000500804),    SS(0x0000805000500000),
-    SS(0x0000805000508800),    SS(0x0000005000500000),    SS(0x0000005000508800),    SS(0x0000805000508000),
-    SS(0x0000885000500804),    SS(0x0000005000508000),    SS(0x0000085000500804),    SS(0x0000885000500000),
-    SS(0x0000805000508800),    SS(0x0000085000500000),    SS(0x0000005000508800),    SS(0x0000805000508000),
-    SS(0x0000885000500800),    SS(0x0000005000508000),    SS(0x0000085000500800),    SS(0x0000885000500000),
-    SS(0x040810a000a01008),    SS(0x000000a000a00000),    SS(0x000010a000a00000),    SS(0x000000a000a01000),
-    SS(0x040810a000a01000),    SS(0x000000a000a01008),    SS(0x000010a000a00000),    SS(0x000000a000a00000),
-    SS(0x040810a000a00000),    SS(0x000000a000a01000),    SS(0x000010a000a01008),    SS(0x000000a000a00000),
-    SS(0x040810a000a00000),    SS(0x000000a000a00000),    SS(0x000010a000a01000),    SS(0x000000a000a01008),
-    SS(0x000810a000a01008),    SS(0x000000a000a00000),    SS(0x000010a000a00000),    SS(0x000000a000a01000),
-    SS(0x000810a000a01000),    SS(0x000000a000a01008),    SS(0x000010a000a00000),    SS(0x000000a000a00000),
-    SS(0x000810a000a00000),    SS(0x000000a000a01000),    SS(0x000010a000a01008),    SS(0x000000a000a00000),
-    SS(0x000810a000a00000),    SS(0x000000a000a00000),    SS(0x000010a000a01000),    SS(0x000000a000a01008),
-    SS(0x0810204000402010),    SS(0x0810204000400000),    SS(0x0000004000402010),    SS(0x0000004000400000),
-    SS(0x0000204000402010),    SS(0x0000204000400000),    SS(0x0000004000402000),    SS(0x0000004000400000),
-    SS(0x0010204000402010),    SS(0x0010204000400000),    SS(0x0000004000402000),    SS(0x0000004000400000),
-    SS(0x0000204000402010),    SS(0x0000204000400000),    SS(0x0000004000402000),    SS(0x0000004000400000),
-    SS(0x0810204000402000),    SS(0x0810204000400000),    SS(0x0000004000402000),    SS(0x0000004000400000),
-    SS(0x0000204000402000),    SS(0x0000204000400000),    SS(0x0000004000402010),    SS(0x0000004000400000),
-    SS(0x0010204000402000),    SS(0x0010204000400000),    SS(0x0000004000402010),    SS(0x0000004000400000),
-    SS(0x0000204000402000),    SS(0x0000204000400000),    SS(0x0000004000402010),    SS(0x0000004000400000),
-    SS(0x0804020002040810),    SS(0x0004020002040810),    SS(0x0804020002040000),    SS(0x0004020002040000),
-    SS(0x0804020002000000),    SS(0x0004020002000000),    SS(0x0804020002000000),    SS(0x0004020002000000),
-    SS(0x0000020002040810),    SS(0x0000020002040810),    SS(0x0000020002040000),    SS(0x0000020002040000),
-    SS(0x0000020002000000),    SS(0x0000020002000000),    SS(0x0000020002000000),    SS(0x0000020002000000),
-    SS(0x0804020002040000),    SS(0x0004020002040000),    SS(0x0804020002040800),    SS(0x0004020002040800),
-    SS(0x0804020002000000),    SS(0x0004020002000000),    SS(0x0804020002000000),    SS(0x0004020002000000),
-    SS(0x0000020002040000),    SS(0x0000020002040000),    SS(0x0000020002040800),    SS(0x0000020002040800),
-    SS(0x0000020002000000),    SS(0x0000020002000000),    SS(0x0000020002000000),    SS(0x0000020002000000),
-    SS(0x1008050005081020),    SS(0x0000050005081020),    SS(0x0008050005081020),    SS(0x0000050005081020),
-    SS(0x1008050005081000),    SS(0x0000050005081000),    SS(0x0008050005081000),    SS(0x0000050005081000),
-    SS(0x1008050005000000),    SS(0x0000050005000000),    SS(0x0008050005000000),    SS(0x0000050005000000),
-    SS(0x1008050005000000),    SS(0x0000050005000000),    SS(0x0008050005000000),    SS(0x0000050005000000),
-    SS(0x1008050005080000),    SS(0x0000050005080000),    SS(0x0008050005080000),    SS(0x0000050005080000),
-    SS(0x1008050005080000),    SS(0x0000050005080000),    SS(0x0008050005080000),    SS(0x0000050005080000),
-    SS(0x1008050005000000),    SS(0x0000050005000000),    SS(0x0008050005000000),    SS(0x0000050005000000),
-    SS(0x1008050005000000),    SS(0x0000050005000000),    SS(0x0008050005000000),    SS(0x0000050005000000),
-    SS(0x20110a000a112040),    SS(0x00000a000a102040),    SS(0x20110a000a112000),    SS(0x00000a000a102000),
-    SS(0x20110a000a102040),    SS(0x00110a000a112040),    SS(0x20110a000a102000),    SS(0x00110a000a112000),
-    SS(0x00000a000a010000),    SS(0x00110a000a102040),    SS(0x00000a000a010000),    SS(0x00110a000a102000),
-    SS(0x00000a000a000000),    SS(0x00000a000a010000),    SS(0x00000a000a000000),    SS(0x00000a000a010000),
-    SS(0x20110a000a010000),    SS(0x00000a000a000000),    SS(0x20110a000a010000),    SS(0x00000a000a000000),
-    SS(0x20110a000a000000),    SS(0x00110a000a010000),    SS(0x20110a000a000000),    SS(0x00110a000a010000),
-    SS(0x20100a000a112040),    SS(0x00110a000a000000),    SS(0x20100a000a112000),    SS(0x00110a000a000000),
-    SS(0x20100a000a102040),    SS(0x00100a000a112040),    SS(0x20100a000a102000),    SS(0x00100a000a112000),
-    SS(0x00010a000a110000),    SS(0x00100a000a102040),    SS(0x00010a000a110000),    SS(0x00100a000a102000),
-    SS(0x00010a000a100000),    SS(0x00010a000a110000),    SS(0x00010a000a100000),    SS(0x00010a000a110000),
-    SS(0x20100a000a010000),    SS(0x00010a000a100000),    SS(0x20100a000a010000),    SS(0x00010a000a100000),
-    SS(0x20100a000a000000),    SS(0x00100a000a010000),    SS(0x20100a000a000000),    SS(0x00100a000a010000),
-    SS(0x00010a000a010000),    SS(0x00100a000a000000),    SS(0x00010a000a010000),    SS(0x00100a000a000000),
-    SS(0x00010a000a000000),    SS(0x00010a000a010000),    SS(0x00010a000a000000),    SS(0x00010a000a010000),
-    SS(0x00000a000a110000),    SS(0x00010a000a000000),    SS(0x00000a000a110000),    SS(0x00010a000a000000),
-    SS(0x00000a000a100000),    SS(0x00000a000a110000),    SS(0x00000a000a100000),    SS(0x00000a000a110000),
-    SS(0x20110a000a110000),    SS(0x00000a000a100000),    SS(0x20110a000a110000),    SS(0x00000a000a100000),
-    SS(0x20110a000a100000),    SS(0x00110a000a110000),    SS(0x20110a000a100000),    SS(0x00110a000a110000),
-    SS(0x00000a000a010000),    SS(0x00110a000a100000),    SS(0x00000a000a010000),    SS(0x00110a000a100000),
-    SS(0x00000a000a000000),    SS(0x00000a000a010000),    SS(0x00000a000a000000),    SS(0x00000a000a010000),
-    SS(0x20110a000a010000),    SS(0x00000a000a000000),    SS(0x20110a000a010000),    SS(0x00000a000a000000),
-    SS(0x20110a000a000000),    SS(0x00110a000a010000),    SS(0x20110a000a000000),    SS(0x00110a000a010000),
-    SS(0x20100a000a110000),    SS(0x00110a000a000000),    SS(0x20100a000a110000),    SS(0x00110a000a000000),
-    SS(0x20100a000a100000),    SS(0x00100a000a110000),    SS(0x20100a000a100000),    SS(0x00100a000a110000),
-    SS(0x00010a000a112040),    SS(0x00100a000a100000),    SS(0x00010a000a112000),    SS(0x00100a000a100000),
-    SS(0x00010a000a102040),    SS(0x00010a000a112040),    SS(0x00010a000a102000),    SS(0x00010a000a112000),
-    SS(0x20100a000a010000),    SS(0x00010a000a102040),    SS(0x20100a000a010000),    SS(0x00010a000a102000),
-    SS(0x20100a000a000000),    SS(0x00100a000a010000),    SS(0x20100a000a000000),    SS(0x00100a000a010000),
-    SS(0x00010a000a010000),    SS(0x00100a000a000000),    SS(0x00010a000a010000),    SS(0x00100a000a000000),
-    SS(0x00010a000a000000),    SS(0x00010a000a010000),    SS(0x00010a000a000000),    SS(0x00010a000a010000),
-    SS(0x00000a000a112040),    SS(0x00010a000a000000),    SS(0x00000a000a112000),    SS(0x00010a000a000000),
-    SS(0x00000a000a102040),    SS(0x00000a000a112040),    SS(0x00000a000a102000),    SS(0x00000a000a112000),
-    SS(0x4122140014224180),    SS(0x0102140014000000),    SS(0x4122140014220100),    SS(0x0102140014000000),
-    SS(0x4122140014020100),    SS(0x0102140014204000),    SS(0x4122140014020100),    SS(0x0102140014200000),
-    SS(0x0022140014000000),    SS(0x0002140014020000),    SS(0x0022140014000000),    SS(0x0002140014020000),
-    SS(0x0022140014204000),    SS(0x0002140014224000),    SS(0x0022140014200000),    SS(0x0002140014220000),
-    SS(0x0020140014000000),    SS(0x0000140014020000),    SS(0x0020140014000000),    SS(0x0000140014020000),
-    SS(0x0020140014204000),    SS(0x0000140014224000),    SS(0x0020140014200000),    SS(0x0000140014220000),
-    SS(0x0020140014000000),    SS(0x0000140014020100),    SS(0x0020140014000000),    SS(0x0000140014020100),
-    SS(0x0020140014204000),    SS(0x0000140014224100),    SS(0x0020140014200000),    SS(0x0000140014220100),
-    SS(0x4122140014224080),    SS(0x0102140014000000),    SS(0x4122140014220000),    SS(0x0102140014000000),
-    SS(0x4122140014020000),    SS(0x0102140014204000),    SS(0x4122140014020000),    SS(0x0102140014200000),
-    SS(0x4022140014224180),    SS(0x0002140014000000),    SS(0x4022140014220100),    SS(0x0002140014000000),
-    SS(0x4022140014020100),    SS(0x0002140014204000),    SS(0x4022140014020100),    SS(0x0002140014200000),
-    SS(0x4020140014224180),    SS(0x0000140014000000),    SS(0x4020140014220100),    SS(0x0000140014000000),
-    SS(0x4020140014020100),    SS(0x0000140014204000),    SS(0x4020140014020100),    SS(0x0000140014200000),
-    SS(0x0020140014000000),    SS(0x0000140014020000),    SS(0x0020140014000000),    SS(0x0000140014020000),
-    SS(0x0020140014204000),    SS(0x0000140014224000),    SS(0x0020140014200000),    SS(0x0000140014220000),
-    SS(0x4122140014204080),    SS(0x0102140014020100),    SS(0x4122140014200000),    SS(0x0102140014020100),
-    SS(0x4122140014000000),    SS(0x0102140014224100),    SS(0x4122140014000000),    SS(0x0102140014220100),
-    SS(0x4022140014224080),    SS(0x0002140014000000),    SS(0x4022140014220000),    SS(0x0002140014000000),
-    SS(0x4022140014020000),    SS(0x0002140014204000),    SS(0x4022140014020000),    SS(0x0002140014200000),
-    SS(0x4020140014224080),    SS(0x0000140014000000),    SS(0x4020140014220000),    SS(0x0000140014000000),
-    SS(0x4020140014020000),    SS(0x0000140014204000),    SS(0x4020140014020000),    SS(0x0000140014200000),
-    SS(0x4020140014224180),    SS(0x0000140014000000),    SS(0x4020140014220100),    SS(0x0000140014000000),
-    SS(0x4020140014020100),    SS(0x0000140014204000),    SS(0x4020140014020100),    SS(0x0000140014200000),
-    SS(0x4122140014204080),    SS(0x0102140014020000),    SS(0x4122140014200000),    SS(0x0102140014020000),
-    SS(0x4122140014000000),    SS(0x0102140014224000),    SS(0x4122140014000000),    SS(0x0102140014220000),
-    SS(0x4022140014204080),    SS(0x0002140014020100),    SS(0x4022140014200000),    SS(0x0002140014020100),
-    SS(0x4022140014000000),    SS(0x0002140014224100),    SS(0x4022140014000000),    SS(0x0002140014220100),
-    SS(0x4020140014204080),    SS(0x0000140014020100),    SS(0x4020140014200000),    SS(0x0000140014020100),
-    SS(0x4020140014000000),    SS(0x0000140014224100),    SS(0x4020140014000000),    SS(0x0000140014220100),
-    SS(0x4020140014224080),    SS(0x0000140014000000),    SS(0x4020140014220000),    SS(0x0000140014000000),
-    SS(0x4020140014020000),    SS(0x0000140014204000),    SS(0x4020140014020000),    SS(0x0000140014200000),
-    SS(0x0122140014224180),    SS(0x0102140014000000),    SS(0x0122140014220100),    SS(0x0102140014000000),
-    SS(0x0122140014020100),    SS(0x0102140014204000),    SS(0x0122140014020100),    SS(0x0102140014200000),
-    SS(0x4022140014204080),    SS(0x0002140014020000),    SS(0x4022140014200000),    SS(0x0002140014020000),
-    SS(0x4022140014000000),    SS(0x0002140014224000),    SS(0x4022140014000000),    SS(0x0002140014220000),
-    SS(0x4020140014204080),    SS(0x0000140014020000),    SS(0x4020140014200000),    SS(0x0000140014020000),
-    SS(0x4020140014000000),    SS(0x0000140014224000),    SS(0x4020140014000000),    SS(0x0000140014220000),
-    SS(0x4020140014204080),    SS(0x0000140014020100),    SS(0x4020140014200000),    SS(0x0000140014020100),
-    SS(0x4020140014000000),    SS(0x0000140014224100),    SS(0x4020140014000000),    SS(0x0000140014220100),
-    SS(0x0122140014224080),    SS(0x0102140014000000),    SS(0x0122140014220000),    SS(0x0102140014000000),
-    SS(0x0122140014020000),    SS(0x0102140014204000),    SS(0x0122140014020000),    SS(0x0102140014200000),
-    SS(0x0022140014224180),    SS(0x0002140014000000),    SS(0x0022140014220100),    SS(0x0002140014000000),
-    SS(0x0022140014020100),    SS(0x0002140014204000),    SS(0x0022140014020100),    SS(0x0002140014200000),
-    SS(0x0020140014224180),    SS(0x0000140014000000),    SS(0x0020140014220100),    SS(0x0000140014000000),
-    SS(0x0020140014020100),    SS(0x0000140014204000),    SS(0x0020140014020100),    SS(0x0000140014200000),
-    SS(0x4020140014204080),    SS(0x0000140014020000),    SS(0x4020140014200000),    SS(0x0000140014020000),
-    SS(0x4020140014000000),    SS(0x0000140014224000),    SS(0x4020140014000000),    SS(0x0000140014220000),
-    SS(0x0122140014204080),    SS(0x0102140014224180),    SS(0x0122140014200000),    SS(0x0102140014220100),
-    SS(0x0122140014000000),    SS(0x0102140014020100),    SS(0x0122140014000000),    SS(0x0102140014020100),
-    SS(0x0022140014224080),    SS(0x0002140014000000),    SS(0x0022140014220000),    SS(0x0002140014000000),
-    SS(0x0022140014020000),    SS(0x0002140014204000),    SS(0x0022140014020000),    SS(0x0002140014200000),
-    SS(0x0020140014224080),    SS(0x0000140014000000),    SS(0x0020140014220000),    SS(0x0000140014000000),
-    SS(0x0020140014020000),    SS(0x0000140014204000),    SS(0x0020140014020000),    SS(0x0000140014200000),
-    SS(0x0020140014224180),    SS(0x0000140014000000),    SS(0x0020140014220100),    SS(0x0000140014000000),
-    SS(0x0020140014020100),    SS(0x0000140014204000),    SS(0x0020140014020100),    SS(0x0000140014200000),
-    SS(0x0122140014204080),    SS(0x0102140014224080),    SS(0x0122140014200000),    SS(0x0102140014220000),
-    SS(0x0122140014000000),    SS(0x0102140014020000),    SS(0x0122140014000000),    SS(0x0102140014020000),
-    SS(0x0022140014204080),    SS(0x0002140014224180),    SS(0x0022140014200000),    SS(0x0002140014220100),
-    SS(0x0022140014000000),    SS(0x0002140014020100),    SS(0x0022140014000000),    SS(0x0002140014020100),
-    SS(0x0020140014204080),    SS(0x0000140014224180),    SS(0x0020140014200000),    SS(0x0000140014220100),
-    SS(0x0020140014000000),    SS(0x0000140014020100),    SS(0x0020140014000000),    SS(0x0000140014020100),
-    SS(0x0020140014224080),    SS(0x0000140014000000),    SS(0x0020140014220000),    SS(0x0000140014000000),
-    SS(0x0020140014020000),    SS(0x0000140014204000),    SS(0x0020140014020000),    SS(0x0000140014200000),
-    SS(0x4122140014020100),    SS(0x0102140014204080),    SS(0x4122140014020100),    SS(0x0102140014200000),
-    SS(0x4122140014224100),    SS(0x0102140014000000),    SS(0x4122140014220100),    SS(0x0102140014000000),
-    SS(0x0022140014204080),    SS(0x0002140014224080),    SS(0x0022140014200000),    SS(0x0002140014220000),
-    SS(0x0022140014000000),    SS(0x0002140014020000),    SS(0x0022140014000000),    SS(0x0002140014020000),
-    SS(0x0020140014204080),    SS(0x0000140014224080),    SS(0x0020140014200000),    SS(0x0000140014220000),
-    SS(0x0020140014000000),    SS(0x0000140014020000),    SS(0x0020140014000000),    SS(0x0000140014020000),
-    SS(0x0020140014204080),    SS(0x0000140014224180),    SS(0x0020140014200000),    SS(0x0000140014220100),
-    SS(0x0020140014000000),    SS(0x0000140014020100),    SS(0x0020140014000000),    SS(0x0000140014020100),
-    SS(0x4122140014020000),    SS(0x0102140014204080),    SS(0x4122140014020000),    SS(0x0102140014200000),
-    SS(0x4122140014224000),    SS(0x0102140014000000),    SS(0x4122140014220000),    SS(0x0102140014000000),
-    SS(0x4022140014020100),    SS(0x0002140014204080),    SS(0x4022140014020100),    SS(0x0002140014200000),
-    SS(0x4022140014224100),    SS(0x0002140014000000),    SS(0x4022140014220100),    SS(0x0002140014000000),
-    SS(0x4020140014020100),    SS(0x0000140014204080),    SS(0x4020140014020100),    SS(0x0000140014200000),
-    SS(0x4020140014224100),    SS(0x0000140014000000),    SS(0x4020140014220100),    SS(0x0000140014000000),
-    SS(0x0020140014204080),    SS(0x0000140014224080),    SS(0x0020140014200000),    SS(0x0000140014220000),
-    SS(0x0020140014000000),    SS(0x0000140014020000),    SS(0x0020140014000000),    SS(0x0000140014020000),
-    SS(0x4122140014000000),    SS(0x0102140014224180),    SS(0x4122140014000000),    SS(0x0102140014220100),
-    SS(0x4122140014204000),    SS(0x0102140014020100),    SS(0x4122140014200000),    SS(0x0102140014020100),
-    SS(0x4022140014020000),    SS(0x0002140014204080),    SS(0x4022140014020000),    SS(0x0002140014200000),
-    SS(0x4022140014224000),    SS(0x0002140014000000),    SS(0x4022140014220000),    SS(0x0002140014000000),
-    SS(0x4020140014020000),    SS(0x0000140014204080),    SS(0x4020140014020000),    SS(0x0000140014200000),
-    SS(0x4020140014224000),    SS(0x0000140014000000),    SS(0x4020140014220000),    SS(0x0000140014000000),
-    SS(0x4020140014020100),    SS(0x0000140014204080),    SS(0x4020140014020100),    SS(0x0000140014200000),
-    SS(0x4020140014224100),    SS(0x0000140014000000),    SS(0x4020140014220100),    SS(0x0000140014000000),
-    SS(0x4122140014000000),    SS(0x0102140014224080),    SS(0x4122140014000000),    SS(0x0102140014220000),
-    SS(0x4122140014204000),    SS(0x0102140014020000),    SS(0x4122140014200000),    SS(0x0102140014020000),
-    SS(0x4022140014000000),    SS(0x0002140014224180),    SS(0x4022140014000000),    SS(0x0002140014220100),
-    SS(0x4022140014204000),    SS(0x0002140014020100),    SS(0x4022140014200000),    SS(0x0002140014020100),
-    SS(0x4020140014000000),    SS(0x0000140014224180),    SS(0x4020140014000000),    SS(0x0000140014220100),
-    SS(0x4020140014204000),    SS(0x0000140014020100),    SS(0x4020140014200000),    SS(0x0000140014020100),
-    SS(0x4020140014020000),    SS(0x0000140014204080),    SS(0x4020140014020000),    SS(0x0000140014200000),
-    SS(0x4020140014224000),    SS(0x0000140014000000),    SS(0x4020140014220000),    SS(0x0000140014000000),
-    SS(0x0122140014020100),    SS(0x0102140014204080),    SS(0x0122140014020100),    SS(0x0102140014200000),
-    SS(0x0122140014224100),    SS(0x0102140014000000),    SS(0x0122140014220100),    SS(0x0102140014000000),
-    SS(0x4022140014000000),    SS(0x0002140014224080),    SS(0x4022140014000000),    SS(0x0002140014220000),
-    SS(0x4022140014204000),    SS(0x0002140014020000),    SS(0x4022140014200000),    SS(0x0002140014020000),
-    SS(0x4020140014000000),    SS(0x0000140014224080),    SS(0x4020140014000000),    SS(0x0000140014220000),
-    SS(0x4020140014204000),    SS(0x0000140014020000),    SS(0x4020140014200000),    SS(0x0000140014020000),
-    SS(0x4020140014000000),    SS(0x0000140014224180),    SS(0x4020140014000000),    SS(0x0000140014220100),
-    SS(0x4020140014204000),    SS(0x0000140014020100),    SS(0x4020140014200000),    SS(0x0000140014020100),
-    SS(0x0122140014020000),    SS(0x0102140014204080),    SS(0x0122140014020000),    SS(0x0102140014200000),
-    SS(0x0122140014224000),    SS(0x0102140014000000),    SS(0x0122140014220000),    SS(0x0102140014000000),
-    SS(0x0022140014020100),    SS(0x0002140014204080),    SS(0x0022140014020100),    SS(0x0002140014200000),
-    SS(0x0022140014224100),    SS(0x0002140014000000),    SS(0x0022140014220100),    SS(0x0002140014000000),
-    SS(0x0020140014020100),    SS(0x0000140014204080),    SS(0x0020140014020100),    SS(0x0000140014200000),
-    SS(0x0020140014224100),    SS(0x0000140014000000),    SS(0x0020140014220100),    SS(0x0000140014000000),
-    SS(0x4020140014000000),    SS(0x0000140014224080),    SS(0x4020140014000000),    SS(0x0000140014220000),
-    SS(0x4020140014204000),    SS(0x0000140014020000),    SS(0x4020140014200000),    SS(0x0000140014020000),
-    SS(0x0122140014000000),    SS(0x0102140014020100),    SS(0x0122140014000000),    SS(0x0102140014020100),
-    SS(0x0122140014204000),    SS(0x0102140014224100),    SS(0x0122140014200000),    SS(0x0102140014220100),
-    SS(0x0022140014020000),    SS(0x0002140014204080),    SS(0x0022140014020000),    SS(0x0002140014200000),
-    SS(0x0022140014224000),    SS(0x0002140014000000),    SS(0x0022140014220000),    SS(0x0002140014000000),
-    SS(0x0020140014020000),    SS(0x0000140014204080),    SS(0x0020140014020000),    SS(0x0000140014200000),
-    SS(0x0020140014224000),    SS(0x0000140014000000),    SS(0x0020140014220000),    SS(0x0000140014000000),
-    SS(0x0020140014020100),    SS(0x0000140014204080),    SS(0x0020140014020100),    SS(0x0000140014200000),
-    SS(0x0020140014224100),    SS(0x0000140014000000),    SS(0x0020140014220100),    SS(0x0000140014000000),
-    SS(0x0122140014000000),    SS(0x0102140014020000),    SS(0x0122140014000000),    SS(0x0102140014020000),
-    SS(0x0122140014204000),    SS(0x0102140014224000),    SS(0x0122140014200000),    SS(0x0102140014220000),
-    SS(0x0022140014000000),    SS(0x0002140014020100),    SS(0x0022140014000000),    SS(0x0002140014020100),
-    SS(0x0022140014204000),    SS(0x0002140014224100),    SS(0x0022140014200000),    SS(0x0002140014220100),
-    SS(0x0020140014000000),    SS(0x0000140014020100),    SS(0x0020140014000000),    SS(0x0000140014020100),
-    SS(0x0020140014204000),    SS(0x0000140014224100),    SS(0x0020140014200000),    SS(0x0000140014220100),
-    SS(0x0020140014020000),    SS(0x0000140014204080),    SS(0x0020140014020000),    SS(0x0000140014200000),
-    SS(0x0020140014224000),    SS(0x0000140014000000),    SS(0x0020140014220000),    SS(0x0000140014000000),
-    SS(0x8244280028448201),    SS(0x0040280028440200),    SS(0x8244280028408000),    SS(0x0040280028400000),
-    SS(0x0040280028040000),    SS(0x8040280028040000),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x8244280028040201),    SS(0x0040280028040200),    SS(0x8244280028000000),    SS(0x0040280028000000),
-    SS(0x8244280028448000),    SS(0x0040280028440000),    SS(0x8244280028408000),    SS(0x0040280028400000),
-    SS(0x0244280028448200),    SS(0x8044280028448201),    SS(0x0244280028408000),    SS(0x8044280028408000),
-    SS(0x8244280028040000),    SS(0x0040280028040000),    SS(0x8244280028000000),    SS(0x0040280028000000),
-    SS(0x0244280028040200),    SS(0x8044280028040201),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x0244280028448000),    SS(0x8044280028448000),    SS(0x0244280028408000),    SS(0x8044280028408000),
-    SS(0x8040280028448200),    SS(0x0044280028448200),    SS(0x8040280028408000),    SS(0x0044280028408000),
-    SS(0x0244280028040000),    SS(0x8044280028040000),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x8040280028040200),    SS(0x0044280028040200),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x8040280028448000),    SS(0x0044280028448000),    SS(0x8040280028408000),    SS(0x0044280028408000),
-    SS(0x0040280028448201),    SS(0x8040280028448200),    SS(0x0040280028408000),    SS(0x8040280028408000),
-    SS(0x8040280028040000),    SS(0x0044280028040000),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x0040280028040201),    SS(0x8040280028040200),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x0040280028448000),    SS(0x8040280028448000),    SS(0x0040280028408000),    SS(0x8040280028408000),
-    SS(0x0204280028440200),    SS(0x0040280028448201),    SS(0x0204280028400000),    SS(0x0040280028408000),
-    SS(0x0040280028040000),    SS(0x8040280028040000),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x0204280028040200),    SS(0x0040280028040201),    SS(0x0204280028000000),    SS(0x0040280028000000),
-    SS(0x0204280028440000),    SS(0x0040280028448000),    SS(0x0204280028400000),    SS(0x0040280028408000),
-    SS(0x0204280028440201),    SS(0x0004280028440200),    SS(0x0204280028400000),    SS(0x0004280028400000),
-    SS(0x0204280028040000),    SS(0x0040280028040000),    SS(0x0204280028000000),    SS(0x0040280028000000),
-    SS(0x0204280028040201),    SS(0x0004280028040200),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0204280028440000),    SS(0x0004280028440000),    SS(0x0204280028400000),    SS(0x0004280028400000),
-    SS(0x0000280028440201),    SS(0x0004280028440201),    SS(0x0000280028400000),    SS(0x0004280028400000),
-    SS(0x0204280028040000),    SS(0x0004280028040000),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040201),    SS(0x0004280028040201),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028440000),    SS(0x0004280028440000),    SS(0x0000280028400000),    SS(0x0004280028400000),
-    SS(0x0000280028440200),    SS(0x0000280028440201),    SS(0x0000280028400000),    SS(0x0000280028400000),
-    SS(0x0000280028040000),    SS(0x0004280028040000),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040200),    SS(0x0000280028040201),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x0000280028440000),    SS(0x0000280028440000),    SS(0x0000280028400000),    SS(0x0000280028400000),
-    SS(0x0204280028448201),    SS(0x0000280028440200),    SS(0x0204280028408000),    SS(0x0000280028400000),
-    SS(0x0000280028040000),    SS(0x0000280028040000),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x0204280028040201),    SS(0x0000280028040200),    SS(0x0204280028000000),    SS(0x0000280028000000),
-    SS(0x0204280028448000),    SS(0x0000280028440000),    SS(0x0204280028408000),    SS(0x0000280028400000),
-    SS(0x0204280028448200),    SS(0x0004280028448201),    SS(0x0204280028408000),    SS(0x0004280028408000),
-    SS(0x0204280028040000),    SS(0x0000280028040000),    SS(0x0204280028000000),    SS(0x0000280028000000),
-    SS(0x0204280028040200),    SS(0x0004280028040201),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0204280028448000),    SS(0x0004280028448000),    SS(0x0204280028408000),    SS(0x0004280028408000),
-    SS(0x0000280028448200),    SS(0x0004280028448200),    SS(0x0000280028408000),    SS(0x0004280028408000),
-    SS(0x0204280028040000),    SS(0x0004280028040000),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040200),    SS(0x0004280028040200),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028448000),    SS(0x0004280028448000),    SS(0x0000280028408000),    SS(0x0004280028408000),
-    SS(0x0000280028448201),    SS(0x0000280028448200),    SS(0x0000280028408000),    SS(0x0000280028408000),
-    SS(0x0000280028040000),    SS(0x0004280028040000),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040201),    SS(0x0000280028040200),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x0000280028448000),    SS(0x0000280028448000),    SS(0x0000280028408000),    SS(0x0000280028408000),
-    SS(0x8244280028440201),    SS(0x0000280028448201),    SS(0x8244280028400000),    SS(0x0000280028408000),
-    SS(0x0000280028040000),    SS(0x0000280028040000),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x8244280028040201),    SS(0x0000280028040201),    SS(0x8244280028000000),    SS(0x0000280028000000),
-    SS(0x8244280028440000),    SS(0x0000280028448000),    SS(0x8244280028400000),    SS(0x0000280028408000),
-    SS(0x0244280028440200),    SS(0x8044280028440201),    SS(0x0244280028400000),    SS(0x8044280028400000),
-    SS(0x8244280028040000),    SS(0x0000280028040000),    SS(0x8244280028000000),    SS(0x0000280028000000),
-    SS(0x0244280028040200),    SS(0x8044280028040201),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x0244280028440000),    SS(0x8044280028440000),    SS(0x0244280028400000),    SS(0x8044280028400000),
-    SS(0x8040280028440200),    SS(0x0044280028440200),    SS(0x8040280028400000),    SS(0x0044280028400000),
-    SS(0x0244280028040000),    SS(0x8044280028040000),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x8040280028040200),    SS(0x0044280028040200),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x8040280028440000),    SS(0x0044280028440000),    SS(0x8040280028400000),    SS(0x0044280028400000),
-    SS(0x0040280028440201),    SS(0x8040280028440200),    SS(0x0040280028400000),    SS(0x8040280028400000),
-    SS(0x8040280028040000),    SS(0x0044280028040000),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x0040280028040201),    SS(0x8040280028040200),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x0040280028440000),    SS(0x8040280028440000),    SS(0x0040280028400000),    SS(0x8040280028400000),
-    SS(0x8244280028448200),    SS(0x0040280028440201),    SS(0x8244280028408000),    SS(0x0040280028400000),
-    SS(0x0040280028040000),    SS(0x8040280028040000),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x8244280028040200),    SS(0x0040280028040201),    SS(0x8244280028000000),    SS(0x0040280028000000),
-    SS(0x8244280028448000),    SS(0x0040280028440000),    SS(0x8244280028408000),    SS(0x0040280028400000),
-    SS(0x0244280028448201),    SS(0x8044280028448200),    SS(0x0244280028408000),    SS(0x8044280028408000),
-    SS(0x8244280028040000),    SS(0x0040280028040000),    SS(0x8244280028000000),    SS(0x0040280028000000),
-    SS(0x0244280028040201),    SS(0x8044280028040200),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x0244280028448000),    SS(0x8044280028448000),    SS(0x0244280028408000),    SS(0x8044280028408000),
-    SS(0x8040280028448201),    SS(0x0044280028448201),    SS(0x8040280028408000),    SS(0x0044280028408000),
-    SS(0x0244280028040000),    SS(0x8044280028040000),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x8040280028040201),    SS(0x0044280028040201),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x8040280028448000),    SS(0x0044280028448000),    SS(0x8040280028408000),    SS(0x0044280028408000),
-    SS(0x0040280028448200),    SS(0x8040280028448201),    SS(0x0040280028408000),    SS(0x8040280028408000),
-    SS(0x8040280028040000),    SS(0x0044280028040000),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x0040280028040200),    SS(0x8040280028040201),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x0040280028448000),    SS(0x8040280028448000),    SS(0x0040280028408000),    SS(0x8040280028408000),
-    SS(0x0204280028440201),    SS(0x0040280028448200),    SS(0x0204280028400000),    SS(0x0040280028408000),
-    SS(0x0040280028040000),    SS(0x8040280028040000),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x0204280028040201),    SS(0x0040280028040200),    SS(0x0204280028000000),    SS(0x0040280028000000),
-    SS(0x0204280028440000),    SS(0x0040280028448000),    SS(0x0204280028400000),    SS(0x0040280028408000),
-    SS(0x0204280028440200),    SS(0x0004280028440201),    SS(0x0204280028400000),    SS(0x0004280028400000),
-    SS(0x0204280028040000),    SS(0x0040280028040000),    SS(0x0204280028000000),    SS(0x0040280028000000),
-    SS(0x0204280028040200),    SS(0x0004280028040201),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0204280028440000),    SS(0x0004280028440000),    SS(0x0204280028400000),    SS(0x0004280028400000),
-    SS(0x0000280028440200),    SS(0x0004280028440200),    SS(0x0000280028400000),    SS(0x0004280028400000),
-    SS(0x0204280028040000),    SS(0x0004280028040000),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040200),    SS(0x0004280028040200),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028440000),    SS(0x0004280028440000),    SS(0x0000280028400000),    SS(0x0004280028400000),
-    SS(0x0000280028440201),    SS(0x0000280028440200),    SS(0x0000280028400000),    SS(0x0000280028400000),
-    SS(0x0000280028040000),    SS(0x0004280028040000),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040201),    SS(0x0000280028040200),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x0000280028440000),    SS(0x0000280028440000),    SS(0x0000280028400000),    SS(0x0000280028400000),
-    SS(0x0204280028448200),    SS(0x0000280028440201),    SS(0x0204280028408000),    SS(0x0000280028400000),
-    SS(0x0000280028040000),    SS(0x0000280028040000),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x0204280028040200),    SS(0x0000280028040201),    SS(0x0204280028000000),    SS(0x0000280028000000),
-    SS(0x0204280028448000),    SS(0x0000280028440000),    SS(0x0204280028408000),    SS(0x0000280028400000),
-    SS(0x0204280028448201),    SS(0x0004280028448200),    SS(0x0204280028408000),    SS(0x0004280028408000),
-    SS(0x0204280028040000),    SS(0x0000280028040000),    SS(0x0204280028000000),    SS(0x0000280028000000),
-    SS(0x0204280028040201),    SS(0x0004280028040200),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0204280028448000),    SS(0x0004280028448000),    SS(0x0204280028408000),    SS(0x0004280028408000),
-    SS(0x0000280028448201),    SS(0x0004280028448201),    SS(0x0000280028408000),    SS(0x0004280028408000),
-    SS(0x0204280028040000),    SS(0x0004280028040000),    SS(0x0204280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040201),    SS(0x0004280028040201),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028448000),    SS(0x0004280028448000),    SS(0x0000280028408000),    SS(0x0004280028408000),
-    SS(0x0000280028448200),    SS(0x0000280028448201),    SS(0x0000280028408000),    SS(0x0000280028408000),
-    SS(0x0000280028040000),    SS(0x0004280028040000),    SS(0x0000280028000000),    SS(0x0004280028000000),
-    SS(0x0000280028040200),    SS(0x0000280028040201),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x0000280028448000),    SS(0x0000280028448000),    SS(0x0000280028408000),    SS(0x0000280028408000),
-    SS(0x8244280028440200),    SS(0x0000280028448200),    SS(0x8244280028400000),    SS(0x0000280028408000),
-    SS(0x0000280028040000),    SS(0x0000280028040000),    SS(0x0000280028000000),    SS(0x0000280028000000),
-    SS(0x8244280028040200),    SS(0x0000280028040200),    SS(0x8244280028000000),    SS(0x0000280028000000),
-    SS(0x8244280028440000),    SS(0x0000280028448000),    SS(0x8244280028400000),    SS(0x0000280028408000),
-    SS(0x0244280028440201),    SS(0x8044280028440200),    SS(0x0244280028400000),    SS(0x8044280028400000),
-    SS(0x8244280028040000),    SS(0x0000280028040000),    SS(0x8244280028000000),    SS(0x0000280028000000),
-    SS(0x0244280028040201),    SS(0x8044280028040200),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x0244280028440000),    SS(0x8044280028440000),    SS(0x0244280028400000),    SS(0x8044280028400000),
-    SS(0x8040280028440201),    SS(0x0044280028440201),    SS(0x8040280028400000),    SS(0x0044280028400000),
-    SS(0x0244280028040000),    SS(0x8044280028040000),    SS(0x0244280028000000),    SS(0x8044280028000000),
-    SS(0x8040280028040201),    SS(0x0044280028040201),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x8040280028440000),    SS(0x0044280028440000),    SS(0x8040280028400000),    SS(0x0044280028400000),
-    SS(0x0040280028440200),    SS(0x8040280028440201),    SS(0x0040280028400000),    SS(0x8040280028400000),
-    SS(0x8040280028040000),    SS(0x0044280028040000),    SS(0x8040280028000000),    SS(0x0044280028000000),
-    SS(0x0040280028040200),    SS(0x8040280028040201),    SS(0x0040280028000000),    SS(0x8040280028000000),
-    SS(0x0040280028440000),    SS(0x8040280028440000),    SS(0x0040280028400000),    SS(0x8040280028400000),
-    SS(0x0488500050880402),    SS(0x0408500050080400),    SS(0x0408500050080000),    SS(0x0408500050880000),
-    SS(0x0088500050880402),    SS(0x0008500050080400),    SS(0x0008500050080000),    SS(0x0008500050880000),
-    SS(0x0488500050800000),    SS(0x0408500050000000),    SS(0x0408500050000000),    SS(0x0408500050800000),
-    SS(0x0088500050800000),    SS(0x0008500050000000),    SS(0x0008500050000000),    SS(0x0008500050800000),
-    SS(0x0000500050880402),    SS(0x0080500050080400),    SS(0x0080500050080000),    SS(0x0080500050880000),
-    SS(0x0000500050880402),    SS(0x0080500050080400),    SS(0x0080500050080000),    SS(0x0080500050880000),
-    SS(0x0000500050800000),    SS(0x0080500050000000),    SS(0x0080500050000000),    SS(0x0080500050800000),
-    SS(0x0000500050800000),    SS(0x0080500050000000),    SS(0x0080500050000000),    SS(0x0080500050800000),
-    SS(0x0488500050080402),    SS(0x0488500050880400),    SS(0x0488500050880000),    SS(0x0408500050080000),
-    SS(0x0088500050080402),    SS(0x0088500050880400),    SS(0x0088500050880000),    SS(0x0008500050080000),
-    SS(0x0488500050000000),    SS(0x0488500050800000),    SS(0x0488500050800000),    SS(0x0408500050000000),
-    SS(0x0088500050000000),    SS(0x0088500050800000),    SS(0x0088500050800000),    SS(0x0008500050000000),
-    SS(0x0000500050080402),    SS(0x0000500050880400),    SS(0x0000500050880000),    SS(0x0080500050080000),
-    SS(0x0000500050080402),    SS(0x0000500050880400),    SS(0x0000500050880000),    SS(0x0080500050080000),
-    SS(0x0000500050000000),    SS(0x0000500050800000),    SS(0x0000500050800000),    SS(0x0080500050000000),
-    SS(0x0000500050000000),    SS(0x0000500050800000),    SS(0x0000500050800000),    SS(0x0080500050000000),
-    SS(0x0408500050880402),    SS(0x0488500050080400),    SS(0x0488500050080000),    SS(0x0488500050880000),
-    SS(0x0008500050880402),    SS(0x0088500050080400),    SS(0x0088500050080000),    SS(0x0088500050880000),
-    SS(0x0408500050800000),    SS(0x0488500050000000),    SS(0x0488500050000000),    SS(0x0488500050800000),
-    SS(0x0008500050800000),    SS(0x0088500050000000),    SS(0x0088500050000000),    SS(0x0088500050800000),
-    SS(0x0080500050880402),    SS(0x0000500050080400),    SS(0x0000500050080000),    SS(0x0000500050880000),
-    SS(0x0080500050880402),    SS(0x0000500050080400),    SS(0x0000500050080000),    SS(0x0000500050880000),
-    SS(0x0080500050800000),    SS(0x0000500050000000),    SS(0x0000500050000000),    SS(0x0000500050800000),
-    SS(0x0080500050800000),    SS(0x0000500050000000),    SS(0x0000500050000000),    SS(0x0000500050800000),
-    SS(0x0408500050080402),    SS(0x0408500050880400),    SS(0x0408500050880000),    SS(0x0488500050080000),
-    SS(0x0008500050080402),    SS(0x0008500050880400),    SS(0x0008500050880000),    SS(0x0088500050080000),
-    SS(0x0408500050000000),    SS(0x0408500050800000),    SS(0x0408500050800000),    SS(0x0488500050000000),
-    SS(0x0008500050000000),    SS(0x0008500050800000),    SS(0x0008500050800000),    SS(0x0088500050000000),
-    SS(0x0080500050080402),    SS(0x0080500050880400),    SS(0x0080500050880000),    SS(0x0000500050080000),
-    SS(0x0080500050080402),    SS(0x0080500050880400),    SS(0x0080500050880000),    SS(0x0000500050080000),
-    SS(0x0080500050000000),    SS(0x0080500050800000),    SS(0x0080500050800000),    SS(0x0000500050000000),
-    SS(0x0080500050000000),    SS(0x0080500050800000),    SS(0x0080500050800000),    SS(0x0000500050000000),
-    SS(0x0810a000a0100804),    SS(0x0000a000a0000000),    SS(0x0010a000a0000000),    SS(0x0000a000a0000000),
-    SS(0x0810a000a0000000),    SS(0x0000a000a0000000),    SS(0x0010a000a0000000),    SS(0x0000a000a0100000),
-    SS(0x0810a000a0100000),    SS(0x0000a000a0100804),    SS(0x0010a000a0100804),    SS(0x0000a000a0000000),
-    SS(0x0810a000a0100800),    SS(0x0000a000a0000000),    SS(0x0010a000a0000000),    SS(0x0000a000a0000000),
-    SS(0x0810a000a0000000),    SS(0x0000a000a0100000),    SS(0x0010a000a0100000),    SS(0x0000a000a0100804),
-    SS(0x0810a000a0100000),    SS(0x0000a000a0100800),    SS(0x0010a000a0100800),    SS(0x0000a000a0000000),
-    SS(0x0810a000a0000000),    SS(0x0000a000a0000000),    SS(0x0010a000a0000000),    SS(0x0000a000a0100000),
-    SS(0x0810a000a0000000),    SS(0x0000a000a0100000),    SS(0x0010a000a0100000),    SS(0x0000a000a0100800),
-    SS(0x1020400040201008),    SS(0x0000400040000000),    SS(0x1020400040201000),    SS(0x0000400040201008),
-    SS(0x1020400040000000),    SS(0x0000400040201000),    SS(0x1020400040000000),    SS(0x0000400040000000),
-    SS(0x1020400040200000),    SS(0x0000400040000000),    SS(0x1020400040200000),    SS(0x0000400040200000),
-    SS(0x1020400040000000),    SS(0x0000400040200000),    SS(0x1020400040000000),    SS(0x0000400040000000),
-    SS(0x0020400040201008),    SS(0x0000400040000000),    SS(0x0020400040201000),    SS(0x0000400040201008),
-    SS(0x0020400040000000),    SS(0x0000400040201000),    SS(0x0020400040000000),    SS(0x0000400040000000),
-    SS(0x0020400040200000),    SS(0x0000400040000000),    SS(0x0020400040200000),    SS(0x0000400040200000),
-    SS(0x0020400040000000),    SS(0x0000400040200000),    SS(0x0020400040000000),    SS(0x0000400040000000),
-    SS(0x0402000204081020),    SS(0x0402000200000000),    SS(0x0402000200000000),    SS(0x0402000200000000),
-    SS(0x0002000204081020),    SS(0x0002000200000000),    SS(0x0002000200000000),    SS(0x0002000200000000),
-    SS(0x0402000204000000),    SS(0x0402000204080000),    SS(0x0402000204081000),    SS(0x0402000200000000),
-    SS(0x0002000204000000),    SS(0x0002000204080000),    SS(0x0002000204081000),    SS(0x0002000200000000),
-    SS(0x0402000200000000),    SS(0x0402000204000000),    SS(0x0402000204000000),    SS(0x0402000204080000),
-    SS(0x0002000200000000),    SS(0x0002000204000000),    SS(0x0002000204000000),    SS(0x0002000204080000),
-    SS(0x0402000200000000),    SS(0x0402000200000000),    SS(0x0402000200000000),    SS(0x0402000204000000),
-    SS(0x0002000200000000),    SS(0x0002000200000000),    SS(0x0002000200000000),    SS(0x0002000204000000),
-    SS(0x0805000508102040),    SS(0x0805000508100000),    SS(0x0005000500000000),    SS(0x0005000500000000),
-    SS(0x0005000508000000),    SS(0x0005000508000000),    SS(0x0805000500000000),    SS(0x0805000500000000),
-    SS(0x0805000508102000),    SS(0x0805000508100000),    SS(0x0005000500000000),    SS(0x0005000500000000),
-    SS(0x0005000508102040),    SS(0x0005000508100000),    SS(0x0805000500000000),    SS(0x0805000500000000),
-    SS(0x0805000508000000),    SS(0x0805000508000000),    SS(0x0005000500000000),    SS(0x0005000500000000),
-    SS(0x0005000508102000),    SS(0x0005000508100000),    SS(0x0805000500000000),    SS(0x0805000500000000),
-    SS(0x0805000508000000),    SS(0x0805000508000000),    SS(0x0005000500000000),    SS(0x0005000500000000),
-    SS(0x0005000508000000),    SS(0x0005000508000000),    SS(0x0805000500000000),    SS(0x0805000500000000),
-    SS(0x110a000a11204080),    SS(0x110a000a11204000),    SS(0x110a000a11000000),    SS(0x110a000a11000000),
-    SS(0x110a000a11200000),    SS(0x110a000a11200000),    SS(0x110a000a11000000),    SS(0x110a000a11000000),
-    SS(0x010a000a10204080),    SS(0x010a000a10204000),    SS(0x010a000a10000000),    SS(0x010a000a10000000),
-    SS(0x010a000a10200000),    SS(0x010a000a10200000),    SS(0x010a000a10000000),    SS(0x010a000a10000000),
-    SS(0x100a000a11204080),    SS(0x100a000a11204000),    SS(0x100a000a11000000),    SS(0x100a000a11000000),
-    SS(0x100a000a11200000),    SS(0x100a000a11200000),    SS(0x100a000a11000000),    SS(0x100a000a11000000),
-    SS(0x000a000a10204080),    SS(0x000a000a10204000),    SS(0x000a000a10000000),    SS(0x000a000a10000000),
-    SS(0x000a000a10200000),    SS(0x000a000a10200000),    SS(0x000a000a10000000),    SS(0x000a000a10000000),
-    SS(0x110a000a01000000),    SS(0x110a000a01000000),    SS(0x110a000a01000000),    SS(0x110a000a01000000),
-    SS(0x110a000a01000000),    SS(0x110a000a01000000),    SS(0x110a000a01000000),    SS(0x110a000a01000000),
-    SS(0x010a000a00000000),    SS(0x010a000a00000000),    SS(0x010a000a00000000),    SS(0x010a000a00000000),
-    SS(0x010a000a00000000),    SS(0x010a000a00000000),    SS(0x010a000a00000000),    SS(0x010a000a00000000),
-    SS(0x100a000a01000000),    SS(0x100a000a01000000),    SS(0x100a000a01000000),    SS(0x100a000a01000000),
-    SS(0x100a000a01000000),    SS(0x100a000a01000000),    SS(0x100a000a01000000),    SS(0x100a000a01000000),
-    SS(0x000a000a00000000),    SS(0x000a000a00000000),    SS(0x000a000a00000000),    SS(0x000a000a00000000),
-    SS(0x000a000a00000000),    SS(0x000a000a00000000),    SS(0x000a000a00000000),    SS(0x000a000a00000000),
-    SS(0x010a000a11204080),    SS(0x010a000a11204000),    SS(0x010a000a11000000),    SS(0x010a000a11000000),
-    SS(0x010a000a11200000),    SS(0x010a000a11200000),    SS(0x010a000a11000000),    SS(0x010a000a11000000),
-    SS(0x110a000a10204080),    SS(0x110a000a10204000),    SS(0x110a000a10000000),    SS(0x110a000a10000000),
-    SS(0x110a000a10200000),    SS(0x110a000a10200000),    SS(0x110a000a10000000),    SS(0x110a000a10000000),
-    SS(0x000a000a11204080),    SS(0x000a000a11204000),    SS(0x000a000a11000000),    SS(0x000a000a11000000),
-    SS(0x000a000a11200000),    SS(0x000a000a11200000),    SS(0x000a000a11000000),    SS(0x000a000a11000000),
-    SS(0x100a000a10204080),    SS(0x100a000a10204000),    SS(0x100a000a10000000),    SS(0x100a000a10000000),
-    SS(0x100a000a10200000),    SS(0x100a000a10200000),    SS(0x100a000a10000000),    SS(0x100a000a10000000),
-    SS(0x010a000a01000000),    SS(0x010a000a01000000),    SS(0x010a000a01000000),    SS(0x010a000a01000000),
-    SS(0x010a000a01000000),    SS(0x010a000a01000000),    SS(0x010a000a01000000),    SS(0x010a000a01000000),
-    SS(0x110a000a00000000),    SS(0x110a000a00000000),    SS(0x110a000a00000000),    SS(0x110a000a00000000),
-    SS(0x110a000a00000000),    SS(0x110a000a00000000),    SS(0x110a000a00000000),    SS(0x110a000a00000000),
-    SS(0x000a000a01000000),    SS(0x000a000a01000000),    SS(0x000a000a01000000),    SS(0x000a000a01000000),
-    SS(0x000a000a01000000),    SS(0x000a000a01000000),    SS(0x000a000a01000000),    SS(0x000a000a01000000),
-    SS(0x100a000a00000000),    SS(0x100a000a00000000),    SS(0x100a000a00000000),    SS(0x100a000a00000000),
-    SS(0x100a000a00000000),    SS(0x100a000a00000000),    SS(0x100a000a00000000),    SS(0x100a000a00000000),
-    SS(0x2214001422418000),    SS(0x2214001420408000),    SS(0x0214001422408000),    SS(0x0214001420408000),
-    SS(0x2214001402010000),    SS(0x2214001400000000),    SS(0x0214001402000000),    SS(0x0214001400000000),
-    SS(0x0214001422410000),    SS(0x0214001420400000),    SS(0x2214001422400000),    SS(0x2214001420400000),
-    SS(0x0214001402010000),    SS(0x0214001400000000),    SS(0x2214001402000000),    SS(0x2214001400000000),
-    SS(0x2014001422418000),    SS(0x2014001420408000),    SS(0x0014001422408000),    SS(0x0014001420408000),
-    SS(0x2014001402010000),    SS(0x2014001400000000),    SS(0x0014001402000000),    SS(0x0014001400000000),
-    SS(0x0014001422410000),    SS(0x0014001420400000),    SS(0x2014001422400000),    SS(0x2014001420400000),
-    SS(0x0014001402010000),    SS(0x0014001400000000),    SS(0x2014001402000000),    SS(0x2014001400000000),
-    SS(0x2214001422010000),    SS(0x2214001420000000),    SS(0x0214001422000000),    SS(0x0214001420000000),
-    SS(0x2214001402010000),    SS(0x2214001400000000),    SS(0x0214001402000000),    SS(0x0214001400000000),
-    SS(0x0214001422010000),    SS(0x0214001420000000),    SS(0x2214001422000000),    SS(0x2214001420000000),
-    SS(0x0214001402010000),    SS(0x0214001400000000),    SS(0x2214001402000000),    SS(0x2214001400000000),
-    SS(0x2014001422010000),    SS(0x2014001420000000),    SS(0x0014001422000000),    SS(0x0014001420000000),
-    SS(0x2014001402010000),    SS(0x2014001400000000),    SS(0x0014001402000000),    SS(0x0014001400000000),
-    SS(0x0014001422010000),    SS(0x0014001420000000),    SS(0x2014001422000000),    SS(0x2014001420000000),
-    SS(0x0014001402010000),    SS(0x0014001400000000),    SS(0x2014001402000000),    SS(0x2014001400000000),
-    SS(0x0214001422418000),    SS(0x0214001420408000),    SS(0x2214001422408000),    SS(0x2214001420408000),
-    SS(0x0214001402010000),    SS(0x0214001400000000),    SS(0x2214001402000000),    SS(0x2214001400000000),
-    SS(0x2214001422410000),    SS(0x2214001420400000),    SS(0x0214001422400000),    SS(0x0214001420400000),
-    SS(0x2214001402010000),    SS(0x2214001400000000),    SS(0x0214001402000000),    SS(0x0214001400000000),
-    SS(0x0014001422418000),    SS(0x0014001420408000),    SS(0x2014001422408000),    SS(0x2014001420408000),
-    SS(0x0014001402010000),    SS(0x0014001400000000),    SS(0x2014001402000000),    SS(0x2014001400000000),
-    SS(0x2014001422410000),    SS(0x2014001420400000),    SS(0x0014001422400000),    SS(0x0014001420400000),
-    SS(0x2014001402010000),    SS(0x2014001400000000),    SS(0x0014001402000000),    SS(0x0014001400000000),
-    SS(0x0214001422010000),    SS(0x0214001420000000),    SS(0x2214001422000000),    SS(0x2214001420000000),
-    SS(0x0214001402010000),    SS(0x0214001400000000),    SS(0x2214001402000000),    SS(0x2214001400000000),
-    SS(0x2214001422010000),    SS(0x2214001420000000),    SS(0x0214001422000000),    SS(0x0214001420000000),
-    SS(0x2214001402010000),    SS(0x2214001400000000),    SS(0x0214001402000000),    SS(0x0214001400000000),
-    SS(0x0014001422010000),    SS(0x0014001420000000),    SS(0x2014001422000000),    SS(0x2014001420000000),
-    SS(0x0014001402010000),    SS(0x0014001400000000),    SS(0x2014001402000000),    SS(0x2014001400000000),
-    SS(0x2014001422010000),    SS(0x2014001420000000),    SS(0x0014001422000000),    SS(0x0014001420000000),
-    SS(0x2014001402010000),    SS(0x2014001400000000),    SS(0x0014001402000000),    SS(0x0014001400000000),
-    SS(0x4428002844820100),    SS(0x4428002844020100),    SS(0x4428002804020100),    SS(0x4428002804020100),
-    SS(0x4028002844820100),    SS(0x4028002844020100),    SS(0x4028002804020100),    SS(0x4028002804020100),
-    SS(0x4428002844800000),    SS(0x4428002844000000),    SS(0x4428002804000000),    SS(0x4428002804000000),
-    SS(0x4028002844800000),    SS(0x4028002844000000),    SS(0x4028002804000000),    SS(0x4028002804000000),
-    SS(0x0428002844820100),    SS(0x0428002844020100),    SS(0x0428002804020100),    SS(0x0428002804020100),
-    SS(0x0028002844820100),    SS(0x0028002844020100),    SS(0x0028002804020100),    SS(0x0028002804020100),
-    SS(0x0428002844800000),    SS(0x0428002844000000),    SS(0x0428002804000000),    SS(0x0428002804000000),
-    SS(0x0028002844800000),    SS(0x0028002844000000),    SS(0x0028002804000000),    SS(0x0028002804000000),
-    SS(0x4428002840800000),    SS(0x4428002840000000),    SS(0x4428002800000000),    SS(0x4428002800000000),
-    SS(0x4028002840800000),    SS(0x4028002840000000),    SS(0x4028002800000000),    SS(0x4028002800000000),
-    SS(0x4428002840800000),    SS(0x4428002840000000),    SS(0x4428002800000000),    SS(0x4428002800000000),
-    SS(0x4028002840800000),    SS(0x4028002840000000),    SS(0x4028002800000000),    SS(0x4028002800000000),
-    SS(0x0428002840800000),    SS(0x0428002840000000),    SS(0x0428002800000000),    SS(0x0428002800000000),
-    SS(0x0028002840800000),    SS(0x0028002840000000),    SS(0x0028002800000000),    SS(0x0028002800000000),
-    SS(0x0428002840800000),    SS(0x0428002840000000),    SS(0x0428002800000000),    SS(0x0428002800000000),
-    SS(0x0028002840800000),    SS(0x0028002840000000),    SS(0x0028002800000000),    SS(0x0028002800000000),
-    SS(0x4428002844820000),    SS(0x4428002844020000),    SS(0x4428002804020000),    SS(0x4428002804020000),
-    SS(0x4028002844820000),    SS(0x4028002844020000),    SS(0x4028002804020000),    SS(0x4028002804020000),
-    SS(0x4428002844800000),    SS(0x4428002844000000),    SS(0x4428002804000000),    SS(0x4428002804000000),
-    SS(0x4028002844800000),    SS(0x4028002844000000),    SS(0x4028002804000000),    SS(0x4028002804000000),
-    SS(0x0428002844820000),    SS(0x0428002844020000),    SS(0x0428002804020000),    SS(0x0428002804020000),
-    SS(0x0028002844820000),    SS(0x0028002844020000),    SS(0x0028002804020000),    SS(0x0028002804020000),
-    SS(0x0428002844800000),    SS(0x0428002844000000),    SS(0x0428002804000000),    SS(0x0428002804000000),
-    SS(0x0028002844800000),    SS(0x0028002844000000),    SS(0x0028002804000000),    SS(0x0028002804000000),
-    SS(0x4428002840800000),    SS(0x4428002840000000),    SS(0x4428002800000000),    SS(0x4428002800000000),
-    SS(0x4028002840800000),    SS(0x4028002840000000),    SS(0x4028002800000000),    SS(0x4028002800000000),
-    SS(0x4428002840800000),    SS(0x4428002840000000),    SS(0x4428002800000000),    SS(0x4428002800000000),
-    SS(0x4028002840800000),    SS(0x4028002840000000),    SS(0x4028002800000000),    SS(0x4028002800000000),
-    SS(0x0428002840800000),    SS(0x0428002840000000),    SS(0x0428002800000000),    SS(0x0428002800000000),
-    SS(0x0028002840800000),    SS(0x0028002840000000),    SS(0x0028002800000000),    SS(0x0028002800000000),
-    SS(0x0428002840800000),    SS(0x0428002840000000),    SS(0x0428002800000000),    SS(0x0428002800000000),
-    SS(0x0028002840800000),    SS(0x0028002840000000),    SS(0x0028002800000000),    SS(0x0028002800000000),
-    SS(0x8850005088040201),    SS(0x8850005080000000),    SS(0x0850005088040200),    SS(0x0850005080000000),
-    SS(0x8850005008040201),    SS(0x8850005000000000),    SS(0x0850005008040200),    SS(0x0850005000000000),
-    SS(0x0850005088040000),    SS(0x0850005080000000),    SS(0x8850005088040000),    SS(0x8850005080000000),
-    SS(0x0850005008040000),    SS(0x0850005000000000),    SS(0x8850005008040000),    SS(0x8850005000000000),
-    SS(0x8050005088040201),    SS(0x8050005080000000),    SS(0x0050005088040200),    SS(0x0050005080000000),
-    SS(0x8050005008040201),    SS(0x8050005000000000),    SS(0x0050005008040200),    SS(0x0050005000000000),
-    SS(0x0050005088040000),    SS(0x0050005080000000),    SS(0x8050005088040000),    SS(0x8050005080000000),
-    SS(0x0050005008040000),    SS(0x0050005000000000),    SS(0x8050005008040000),    SS(0x8050005000000000),
-    SS(0x8850005088000000),    SS(0x8850005080000000),    SS(0x0850005088000000),    SS(0x0850005080000000),
-    SS(0x8850005008000000),    SS(0x8850005000000000),    SS(0x0850005008000000),    SS(0x0850005000000000),
-    SS(0x0850005088000000),    SS(0x0850005080000000),    SS(0x8850005088000000),    SS(0x8850005080000000),
-    SS(0x0850005008000000),    SS(0x0850005000000000),    SS(0x8850005008000000),    SS(0x8850005000000000),
-    SS(0x8050005088000000),    SS(0x8050005080000000),    SS(0x0050005088000000),    SS(0x0050005080000000),
-    SS(0x8050005008000000),    SS(0x8050005000000000),    SS(0x0050005008000000),    SS(0x0050005000000000),
-    SS(0x0050005088000000),    SS(0x0050005080000000),    SS(0x8050005088000000),    SS(0x8050005080000000),
-    SS(0x0050005008000000),    SS(0x0050005000000000),    SS(0x8050005008000000),    SS(0x8050005000000000),
-    SS(0x0850005088040201),    SS(0x0850005080000000),    SS(0x8850005088040200),    SS(0x8850005080000000),
-    SS(0x0850005008040201),    SS(0x0850005000000000),    SS(0x8850005008040200),    SS(0x8850005000000000),
-    SS(0x8850005088040000),    SS(0x8850005080000000),    SS(0x0850005088040000),    SS(0x0850005080000000),
-    SS(0x8850005008040000),    SS(0x8850005000000000),    SS(0x0850005008040000),    SS(0x0850005000000000),
-    SS(0x0050005088040201),    SS(0x0050005080000000),    SS(0x8050005088040200),    SS(0x8050005080000000),
-    SS(0x0050005008040201),    SS(0x0050005000000000),    SS(0x8050005008040200),    SS(0x8050005000000000),
-    SS(0x8050005088040000),    SS(0x8050005080000000),    SS(0x0050005088040000),    SS(0x0050005080000000),
-    SS(0x8050005008040000),    SS(0x8050005000000000),    SS(0x0050005008040000),    SS(0x0050005000000000),
-    SS(0x0850005088000000),    SS(0x0850005080000000),    SS(0x8850005088000000),    SS(0x8850005080000000),
-    SS(0x0850005008000000),    SS(0x0850005000000000),    SS(0x8850005008000000),    SS(0x8850005000000000),
-    SS(0x8850005088000000),    SS(0x8850005080000000),    SS(0x0850005088000000),    SS(0x0850005080000000),
-    SS(0x8850005008000000),    SS(0x8850005000000000),    SS(0x0850005008000000),    SS(0x0850005000000000),
-    SS(0x0050005088000000),    SS(0x0050005080000000),    SS(0x8050005088000000),    SS(0x8050005080000000),
-    SS(0x0050005008000000),    SS(0x0050005000000000),    SS(0x8050005008000000),    SS(0x8050005000000000),
-    SS(0x8050005088000000),    SS(0x8050005080000000),    SS(0x0050005088000000),    SS(0x0050005080000000),
-    SS(0x8050005008000000),    SS(0x8050005000000000),    SS(0x0050005008000000),    SS(0x0050005000000000),
-    SS(0x10a000a010080402),    SS(0x10a000a010000000),    SS(0x00a000a010080000),    SS(0x00a000a010000000),
-    SS(0x10a000a000000000),    SS(0x10a000a000000000),    SS(0x00a000a000000000),    SS(0x00a000a000000000),
-    SS(0x10a000a010080000),    SS(0x10a000a010000000),    SS(0x10a000a010080400),    SS(0x10a000a010000000),
-    SS(0x10a000a000000000),    SS(0x10a000a000000000),    SS(0x10a000a000000000),    SS(0x10a000a000000000),
-    SS(0x00a000a010080402),    SS(0x00a000a010000000),    SS(0x10a000a010080000),    SS(0x10a000a010000000),
-    SS(0x00a000a000000000),    SS(0x00a000a000000000),    SS(0x10a000a000000000),    SS(0x10a000a000000000),
-    SS(0x00a000a010080000),    SS(0x00a000a010000000),    SS(0x00a000a010080400),    SS(0x00a000a010000000),
-    SS(0x00a000a000000000),    SS(0x00a000a000000000),    SS(0x00a000a000000000),    SS(0x00a000a000000000),
-    SS(0x2040004020100804),    SS(0x2040004020100800),    SS(0x2040004020100000),    SS(0x2040004020100000),
-    SS(0x0040004000000000),    SS(0x0040004000000000),    SS(0x0040004000000000),    SS(0x0040004000000000),
-    SS(0x2040004020000000),    SS(0x2040004020000000),    SS(0x2040004020000000),    SS(0x2040004020000000),
-    SS(0x0040004000000000),    SS(0x0040004000000000),    SS(0x0040004000000000),    SS(0x0040004000000000),
-    SS(0x2040004000000000),    SS(0x2040004000000000),    SS(0x2040004000000000),    SS(0x2040004000000000),
-    SS(0x0040004020100804),    SS(0x0040004020100800),    SS(0x0040004020100000),    SS(0x0040004020100000),
-    SS(0x2040004000000000),    SS(0x2040004000000000),    SS(0x2040004000000000),    SS(0x2040004000000000),
-    SS(0x0040004020000000),    SS(0x0040004020000000),    SS(0x0040004020000000),    SS(0x0040004020000000),
-    SS(0x0200020408102040),    SS(0x0200020400000000),    SS(0x0200020408102000),    SS(0x0200020400000000),
-    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),
-    SS(0x0200020408100000),    SS(0x0200020408000000),    SS(0x0200020408100000),    SS(0x0200020408000000),
-    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),
-    SS(0x0200020400000000),    SS(0x0200020408000000),    SS(0x0200020400000000),    SS(0x0200020408000000),
-    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),
-    SS(0x0200020400000000),    SS(0x0200020400000000),    SS(0x0200020400000000),    SS(0x0200020400000000),
-    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),    SS(0x0200020000000000),
-    SS(0x0500050810204080),    SS(0x0500050800000000),    SS(0x0500050810000000),    SS(0x0500050800000000),
-    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),
-    SS(0x0500050810200000),    SS(0x0500050800000000),    SS(0x0500050810000000),    SS(0x0500050800000000),
-    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),
-    SS(0x0500050810204000),    SS(0x0500050800000000),    SS(0x0500050810000000),    SS(0x0500050800000000),
-    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),
-    SS(0x0500050810200000),    SS(0x0500050800000000),    SS(0x0500050810000000),    SS(0x0500050800000000),
-    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),    SS(0x0500050000000000),
-    SS(0x0a000a1120408000),    SS(0x0a000a1120400000),    SS(0x0a000a1000000000),    SS(0x0a000a1000000000),
-    SS(0x0a000a1020408000),    SS(0x0a000a1020400000),    SS(0x0a000a1100000000),    SS(0x0a000a1100000000),
-    SS(0x0a000a0100000000),    SS(0x0a000a0100000000),    SS(0x0a000a1000000000),    SS(0x0a000a1000000000),
-    SS(0x0a000a0000000000),    SS(0x0a000a0000000000),    SS(0x0a000a0100000000),    SS(0x0a000a0100000000),
-    SS(0x0a000a0100000000),    SS(0x0a000a0100000000),    SS(0x0a000a0000000000),    SS(0x0a000a0000000000),
-    SS(0x0a000a0000000000),    SS(0x0a000a0000000000),    SS(0x0a000a0100000000),    SS(0x0a000a0100000000),
-    SS(0x0a000a1120000000),    SS(0x0a000a1120000000),    SS(0x0a000a0000000000),    SS(0x0a000a0000000000),
-    SS(0x0a000a1020000000),    SS(0x0a000a1020000000),    SS(0x0a000a1100000000),    SS(0x0a000a1100000000),
-    SS(0x1400142241800000),    SS(0x1400142240800000),    SS(0x1400142040800000),    SS(0x1400142040800000),
-    SS(0x1400142241000000),    SS(0x1400142240000000),    SS(0x1400142040000000),    SS(0x1400142040000000),
-    SS(0x1400140201000000),    SS(0x1400140200000000),    SS(0x1400140000000000),    SS(0x1400140000000000),
-    SS(0x1400140201000000),    SS(0x1400140200000000),    SS(0x1400140000000000),    SS(0x1400140000000000),
-    SS(0x1400142201000000),    SS(0x1400142200000000),    SS(0x1400142000000000),    SS(0x1400142000000000),
-    SS(0x1400142201000000),    SS(0x1400142200000000),    SS(0x1400142000000000),    SS(0x1400142000000000),
-    SS(0x1400140201000000),    SS(0x1400140200000000),    SS(0x1400140000000000),    SS(0x1400140000000000),
-    SS(0x1400140201000000),    SS(0x1400140200000000),    SS(0x1400140000000000),    SS(0x1400140000000000),
-    SS(0x2800284482010000),    SS(0x2800280000000000),    SS(0x2800284080000000),    SS(0x2800284480000000),
-    SS(0x2800284402000000),    SS(0x2800284080000000),    SS(0x2800284000000000),    SS(0x2800284400000000),
-    SS(0x2800280402010000),    SS(0x2800284000000000),    SS(0x2800280000000000),    SS(0x2800280400000000),
-    SS(0x2800280402000000),    SS(0x2800280000000000),    SS(0x2800280000000000),    SS(0x2800280400000000),
-    SS(0x2800284482000000),    SS(0x2800280000000000),    SS(0x2800284080000000),    SS(0x2800284480000000),
-    SS(0x2800284402010000),    SS(0x2800284080000000),    SS(0x2800284000000000),    SS(0x2800284400000000),
-    SS(0x2800280402000000),    SS(0x2800284000000000),    SS(0x2800280000000000),    SS(0x2800280400000000),
-    SS(0x2800280402010000),    SS(0x2800280000000000),    SS(0x2800280000000000),    SS(0x2800280400000000),
-    SS(0x5000508804020100),    SS(0x5000508000000000),    SS(0x5000508800000000),    SS(0x5000508804020000),
-    SS(0x5000500000000000),    SS(0x5000508800000000),    SS(0x5000500000000000),    SS(0x5000500000000000),
-    SS(0x5000508804000000),    SS(0x5000500000000000),    SS(0x5000508800000000),    SS(0x5000508804000000),
-    SS(0x5000500000000000),    SS(0x5000508800000000),    SS(0x5000500000000000),    SS(0x5000500000000000),
-    SS(0x5000500804020100),    SS(0x5000500000000000),    SS(0x5000500800000000),    SS(0x5000500804020000),
-    SS(0x5000508000000000),    SS(0x5000500800000000),    SS(0x5000508000000000),    SS(0x5000508000000000),
-    SS(0x5000500804000000),    SS(0x5000508000000000),    SS(0x5000500800000000),    SS(0x5000500804000000),
-    SS(0x5000508000000000),    SS(0x5000500800000000),    SS(0x5000508000000000),    SS(0x5000508000000000),
-    SS(0xa000a01008040201),    SS(0xa000a00000000000),    SS(0xa000a01008000000),    SS(0xa000a01008040200),
-    SS(0xa000a00000000000),    SS(0xa000a01008000000),    SS(0xa000a00000000000),    SS(0xa000a00000000000),
-    SS(0xa000a01000000000),    SS(0xa000a00000000000),    SS(0xa000a01000000000),    SS(0xa000a01000000000),
-    SS(0xa000a00000000000),    SS(0xa000a01000000000),    SS(0xa000a00000000000),    SS(0xa000a00000000000),
-    SS(0xa000a01008040000),    SS(0xa000a00000000000),    SS(0xa000a01008000000),    SS(0xa000a01008040000),
-    SS(0xa000a00000000000),    SS(0xa000a01008000000),    SS(0xa000a00000000000),    SS(0xa000a00000000000),
-    SS(0xa000a01000000000),    SS(0xa000a00000000000),    SS(0xa000a01000000000),    SS(0xa000a01000000000),
-    SS(0xa000a00000000000),    SS(0xa000a01000000000),    SS(0xa000a00000000000),    SS(0xa000a00000000000),
-    SS(0x4000402010080402),    SS(0x4000402010080000),    SS(0x4000402010080400),    SS(0x4000402010080000),
-    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),
-    SS(0x4000402000000000),    SS(0x4000402000000000),    SS(0x4000402000000000),    SS(0x4000402000000000),
-    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),
-    SS(0x4000402010000000),    SS(0x4000402010000000),    SS(0x4000402010000000),    SS(0x4000402010000000),
-    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),
-    SS(0x4000402000000000),    SS(0x4000402000000000),    SS(0x4000402000000000),    SS(0x4000402000000000),
-    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),    SS(0x4000400000000000),
-    SS(0x0002040810204080),    SS(0x0002040810200000),    SS(0x0002040800000000),    SS(0x0002040800000000),
-    SS(0x0002040810000000),    SS(0x0002040810000000),    SS(0x0002040800000000),    SS(0x0002040800000000),
-    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),
-    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0002040810204000),    SS(0x0002040810200000),    SS(0x0002040800000000),    SS(0x0002040800000000),
-    SS(0x0002040810000000),    SS(0x0002040810000000),    SS(0x0002040800000000),    SS(0x0002040800000000),
-    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),
-    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),    SS(0x0002040000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),    SS(0x0002000000000000),
-    SS(0x0005081020408000),    SS(0x0005000000000000),    SS(0x0005081020400000),    SS(0x0005000000000000),
-    SS(0x0005080000000000),    SS(0x0005000000000000),    SS(0x0005080000000000),    SS(0x0005000000000000),
-    SS(0x0005081020000000),    SS(0x0005000000000000),    SS(0x0005081020000000),    SS(0x0005000000000000),
-    SS(0x0005080000000000),    SS(0x0005000000000000),    SS(0x0005080000000000),    SS(0x0005000000000000),
-    SS(0x0005081000000000),    SS(0x0005000000000000),    SS(0x0005081000000000),    SS(0x0005000000000000),
-    SS(0x0005080000000000),    SS(0x0005000000000000),    SS(0x0005080000000000),    SS(0x0005000000000000),
-    SS(0x0005081000000000),    SS(0x0005000000000000),    SS(0x0005081000000000),    SS(0x0005000000000000),
-    SS(0x0005080000000000),    SS(0x0005000000000000),    SS(0x0005080000000000),    SS(0x0005000000000000),
-    SS(0x000a112040800000),    SS(0x000a110000000000),    SS(0x000a102040800000),    SS(0x000a100000000000),
-    SS(0x000a112000000000),    SS(0x000a110000000000),    SS(0x000a102000000000),    SS(0x000a100000000000),
-    SS(0x000a010000000000),    SS(0x000a010000000000),    SS(0x000a000000000000),    SS(0x000a000000000000),
-    SS(0x000a010000000000),    SS(0x000a010000000000),    SS(0x000a000000000000),    SS(0x000a000000000000),
-    SS(0x000a112040000000),    SS(0x000a110000000000),    SS(0x000a102040000000),    SS(0x000a100000000000),
-    SS(0x000a112000000000),    SS(0x000a110000000000),    SS(0x000a102000000000),    SS(0x000a100000000000),
-    SS(0x000a010000000000),    SS(0x000a010000000000),    SS(0x000a000000000000),    SS(0x000a000000000000),
-    SS(0x000a010000000000),    SS(0x000a010000000000),    SS(0x000a000000000000),    SS(0x000a000000000000),
-    SS(0x0014224180000000),    SS(0x0014204080000000),    SS(0x0014224100000000),    SS(0x0014204000000000),
-    SS(0x0014020100000000),    SS(0x0014000000000000),    SS(0x0014020100000000),    SS(0x0014000000000000),
-    SS(0x0014220100000000),    SS(0x0014200000000000),    SS(0x0014220100000000),    SS(0x0014200000000000),
-    SS(0x0014020100000000),    SS(0x0014000000000000),    SS(0x0014020100000000),    SS(0x0014000000000000),
-    SS(0x0014224080000000),    SS(0x0014204080000000),    SS(0x0014224000000000),    SS(0x0014204000000000),
-    SS(0x0014020000000000),    SS(0x0014000000000000),    SS(0x0014020000000000),    SS(0x0014000000000000),
-    SS(0x0014220000000000),    SS(0x0014200000000000),    SS(0x0014220000000000),    SS(0x0014200000000000),
-    SS(0x0014020000000000),    SS(0x0014000000000000),    SS(0x0014020000000000),    SS(0x0014000000000000),
-    SS(0x0028448201000000),    SS(0x0028448000000000),    SS(0x0028408000000000),    SS(0x0028408000000000),
-    SS(0x0028448200000000),    SS(0x0028448000000000),    SS(0x0028408000000000),    SS(0x0028408000000000),
-    SS(0x0028040201000000),    SS(0x0028040000000000),    SS(0x0028000000000000),    SS(0x0028000000000000),
-    SS(0x0028040200000000),    SS(0x0028040000000000),    SS(0x0028000000000000),    SS(0x0028000000000000),
-    SS(0x0028440201000000),    SS(0x0028440000000000),    SS(0x0028400000000000),    SS(0x0028400000000000),
-    SS(0x0028440200000000),    SS(0x0028440000000000),    SS(0x0028400000000000),    SS(0x0028400000000000),
-    SS(0x0028040201000000),    SS(0x0028040000000000),    SS(0x0028000000000000),    SS(0x0028000000000000),
-    SS(0x0028040200000000),    SS(0x0028040000000000),    SS(0x0028000000000000),    SS(0x0028000000000000),
-    SS(0x0050880402010000),    SS(0x0050000000000000),    SS(0x0050880402000000),    SS(0x0050800000000000),
-    SS(0x0050080000000000),    SS(0x0050800000000000),    SS(0x0050080000000000),    SS(0x0050000000000000),
-    SS(0x0050880400000000),    SS(0x0050000000000000),    SS(0x0050880400000000),    SS(0x0050800000000000),
-    SS(0x0050080402010000),    SS(0x0050800000000000),    SS(0x0050080402000000),    SS(0x0050000000000000),
-    SS(0x0050880000000000),    SS(0x0050000000000000),    SS(0x0050880000000000),    SS(0x0050800000000000),
-    SS(0x0050080400000000),    SS(0x0050800000000000),    SS(0x0050080400000000),    SS(0x0050000000000000),
-    SS(0x0050880000000000),    SS(0x0050000000000000),    SS(0x0050880000000000),    SS(0x0050800000000000),
-    SS(0x0050080000000000),    SS(0x0050800000000000),    SS(0x0050080000000000),    SS(0x0050000000000000),
-    SS(0x00a0100804020100),    SS(0x00a0100000000000),    SS(0x00a0100804020000),    SS(0x00a0100000000000),
-    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),
-    SS(0x00a0100804000000),    SS(0x00a0100000000000),    SS(0x00a0100804000000),    SS(0x00a0100000000000),
-    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),
-    SS(0x00a0100800000000),    SS(0x00a0100000000000),    SS(0x00a0100800000000),    SS(0x00a0100000000000),
-    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),
-    SS(0x00a0100800000000),    SS(0x00a0100000000000),    SS(0x00a0100800000000),    SS(0x00a0100000000000),
-    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),    SS(0x00a0000000000000),
-    SS(0x0040201008040201),    SS(0x0040201008040000),    SS(0x0040201008040200),    SS(0x0040201008040000),
-    SS(0x0040201000000000),    SS(0x0040201000000000),    SS(0x0040201000000000),    SS(0x0040201000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),
-    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-    SS(0x0040201008000000),    SS(0x0040201008000000),    SS(0x0040201008000000),    SS(0x0040201008000000),
-    SS(0x0040201000000000),    SS(0x0040201000000000),    SS(0x0040201000000000),    SS(0x0040201000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),
-    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),    SS(0x0040200000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),    SS(0x0040000000000000),
-]
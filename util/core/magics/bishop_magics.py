@@ -1,20 +0,0 @@
-from core.square import SS
-
-BISHOP_MAGIC_NUMS = [
-    SS(0x820420460402a080), SS(0x0020021200451400), SS(0x0010011200218000), SS(0x0004040888100800),
-    SS(0x0006211001000400), SS(0x0401042240021400), SS(0x0884029888090060), SS(0x0024202808080810),
-    SS(0x0020242038024080), SS(0x0080021081010102), SS(0x100004090c030120), SS(0x00210c0420814205),
-    SS(0x0408311040061010), SS(0x4900011016100900), SS(0x6841020d30461020), SS(0x0220112088080800),
-    SS(0x8040000802080628), SS(0x4a48000408480040), SS(0x2010000e00b20060), SS(0x1004020809409102),
-    SS(0x0001011090400801), SS(0x2002000420842000), SS(0xa01200443a090402), SS(0x01010082a4020221),
-    SS(0x7118c00204100682), SS(0x2223440021040c00), SS(0xa208018c08020142), SS(0x0004404004010200),
-    SS(0x0014840004802000), SS(0x0204016024100401), SS(0x23021a0005451020), SS(0x0204222022c10410),
-    SS(0x00122010002002b0), SS(0x0002501000022200), SS(0x84002804001800a1), SS(0x1002080800060a00),
-    SS(0x0040018020120220), SS(0x41108881004a0100), SS(0x800c041410224502), SS(0x4001020080006403),
-    SS(0x0205091140081002), SS(0x491210901c001808), SS(0x0400084048001000), SS(0x0008824200910800),
-    SS(0xca00400408228102), SS(0x2042240800221200), SS(0x0054082081000405), SS(0x0001010202004291),
-    SS(0x4040a40920100100), SS(0x4802060101082c10), SS(0x0208002623100105), SS(0x1000e2c084040010),
-    SS(0x202302400682008a), SS(0x20820c50024a0c10), SS(0x200c20020c090100), SS(0x0684010822028800),
-    SS(0x400e002101482012), SS(0x0800804218044242), SS(0x08a0040201008820), SS(0xc000000024420200),
-    SS(0x3404102090c20200), SS(0x8000840810104981), SS(0x80330810d0009101), SS(0x0004011001020084),
-]
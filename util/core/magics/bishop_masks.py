@@ -1,19 +0,0 @@
-from core.square import SS
-BISHOP_MASKS = [
-    SS(0x0040201008040200),    SS(0x0000402010080400),    SS(0x0000004020100a00),    SS(0x0000000040221400),
-    SS(0x0000000002442800),    SS(0x0000000204085000),    SS(0x0000020408102000),    SS(0x0002040810204000),
-    SS(0x0020100804020000),    SS(0x0040201008040000),    SS(0x00004020100a0000),    SS(0x0000004022140000),
-    SS(0x0000000244280000),    SS(0x0000020408500000),    SS(0x0002040810200000),    SS(0x0004081020400000),
-    SS(0x0010080402000200),    SS(0x0020100804000400),    SS(0x004020100a000a00),    SS(0x0000402214001400),
-    SS(0x0000024428002800),    SS(0x0002040850005000),    SS(0x0004081020002000),    SS(0x0008102040004000),
-    SS(0x0008040200020400),    SS(0x0010080400040800),    SS(0x0020100a000a1000),    SS(0x0040221400142200),
-    SS(0x0002442800284400),    SS(0x0004085000500800),    SS(0x0008102000201000),    SS(0x0010204000402000),
-    SS(0x0004020002040800),    SS(0x0008040004081000),    SS(0x00100a000a102000),    SS(0x0022140014224000),
-    SS(0x0044280028440200),    SS(0x0008500050080400),    SS(0x0010200020100800),    SS(0x0020400040201000),
-    SS(0x0002000204081000),    SS(0x0004000408102000),    SS(0x000a000a10204000),    SS(0x0014001422400000),
-    SS(0x0028002844020000),    SS(0x0050005008040200),    SS(0x0020002010080400),    SS(0x0040004020100800),
-    SS(0x0000020408102000),    SS(0x0000040810204000),    SS(0x00000a1020400000),    SS(0x0000142240000000),
-    SS(0x0000284402000000),    SS(0x0000500804020000),    SS(0x0000201008040200),    SS(0x0000402010080400),
-    SS(0x0002040810204000),    SS(0x0004081020400000),    SS(0x000a102040000000),    SS(0x0014224000000000),
-    SS(0x0028440200000000),    SS(0x0050080402000000),    SS(0x0020100804020000),    SS(0x0040201008040200),
-]
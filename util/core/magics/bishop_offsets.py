@@ -1,18 +0,0 @@
-BISHOP_OFFSETS = [
-    0x0000000000000000, 0x0000000000000040, 0x0000000000000060, 0x0000000000000080,
-    0x00000000000000a0, 0x00000000000000c0, 0x00000000000000e0, 0x0000000000000100,
-    0x0000000000000140, 0x0000000000000160, 0x0000000000000180, 0x00000000000001a0,
-    0x00000000000001c0, 0x00000000000001e0, 0x0000000000000200, 0x0000000000000220,
-    0x0000000000000240, 0x0000000000000260, 0x0000000000000280, 0x0000000000000300,
-    0x0000000000000380, 0x0000000000000400, 0x0000000000000480, 0x00000000000004a0,
-    0x00000000000004c0, 0x00000000000004e0, 0x0000000000000500, 0x0000000000000580,
-    0x0000000000000780, 0x0000000000000980, 0x0000000000000a00, 0x0000000000000a20,
-    0x0000000000000a40, 0x0000000000000a60, 0x0000000000000a80, 0x0000000000000b00,
-    0x0000000000000d00, 0x0000000000000f00, 0x0000000000000f80, 0x0000000000000fa0,
-    0x0000000000000fc0, 0x0000000000000fe0, 0x0000000000001000, 0x0000000000001080,
-    0x0000000000001100, 0x0000000000001180, 0x0000000000001200, 0x0000000000001220,
-    0x0000000000001240, 0x0000000000001260, 0x0000000000001280, 0x00000000000012a0,
-    0x00000000000012c0, 0x00000000000012e0, 0x0000000000001300, 0x0000000000001320,
-    0x0000000000001340, 0x0000000000001380, 0x00000000000013a0, 0x00000000000013c0,
-    0x00000000000013e0, 0x0000000000001400, 0x0000000000001420, 0x0000000000001440,
-]
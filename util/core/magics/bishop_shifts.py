@@ -1,19 +0,0 @@
-from core.square import SS
-BISHOP_SHIFTS = [
-    SS(0x0000000000000006),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000006),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000007),    SS(0x0000000000000007),
-    SS(0x0000000000000007),    SS(0x0000000000000007),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000007),    SS(0x0000000000000009),
-    SS(0x0000000000000009),    SS(0x0000000000000007),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000007),    SS(0x0000000000000009),
-    SS(0x0000000000000009),    SS(0x0000000000000007),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000007),    SS(0x0000000000000007),
-    SS(0x0000000000000007),    SS(0x0000000000000007),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000006),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),
-    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000005),    SS(0x0000000000000006),
-]
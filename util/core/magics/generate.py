@@ -0,0 +1,175 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from os import path
+from typing import *
+
+from core.magics import numbers
+from core.magics.store import VERSION, Sections, read_tables, write_tables
+from core.square import MASK64
+from env_vars import MAGICS_CACHE_DIR
+
+GENERATOR_VERSION = 2
+SHIPPED_PATH = path.join(path.dirname(__file__), "tables.bin")
+DEFAULT_CACHE_DIR = path.join(path.expanduser("~"), ".cache", "sidelines")
+
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+Directions = Tuple[Tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class MagicParams:
+    bishop_magic_nums: Tuple[int, ...]
+    bishop_shifts: Tuple[int, ...]
+    rook_magic_nums: Tuple[int, ...]
+    rook_shifts: Tuple[int, ...]
+
+    @classmethod
+    def default(cls) -> "MagicParams":
+        return MagicParams(
+            bishop_magic_nums=tuple(numbers.BISHOP_MAGIC_NUMS),
+            bishop_shifts=tuple(numbers.BISHOP_SHIFTS),
+            rook_magic_nums=tuple(numbers.ROOK_MAGIC_NUMS),
+            rook_shifts=tuple(numbers.ROOK_SHIFTS),
+        )
+
+    def digest(self) -> int:
+        h = hashlib.sha256(f"{GENERATOR_VERSION}:{VERSION}".encode("ascii"))
+        for values in [self.bishop_magic_nums, self.bishop_shifts, self.rook_magic_nums, self.rook_shifts]:
+            h.update(b"".join(v.to_bytes(8, "little") for v in values))
+        return int.from_bytes(h.digest()[:8], "little")
+
+
+def ray_attacks(sq_idx: int, occupied: int, directions: Directions) -> int:
+    row, col = divmod(sq_idx, 8)
+    res = 0
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            bit = 1 << (r * 8 + c)
+            res |= bit
+            if occupied & bit:
+                break
+            r, c = r + dr, c + dc
+    return res
+
+
+def relevant_mask(sq_idx: int, directions: Directions) -> int:
+    row, col = divmod(sq_idx, 8)
+    res = 0
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        # the last square of a ray never blocks anything behind it, so it does not take part in the index
+        while 0 <= r + dr < 8 and 0 <= c + dc < 8:
+            res |= 1 << (r * 8 + c)
+            r, c = r + dr, c + dc
+    return res
+
+
+def occupancies(mask: int) -> Iterator[int]:
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if subset == 0:
+            return
+
+
+def magic_index(occupied: int, magic_num: int, shift: int) -> int:
+    return (occupied * magic_num & MASK64) >> (64 - shift)
+
+
+def square_attacks(sq_idx: int, magic_num: int, shift: int, directions: Directions) -> Optional[List[int]]:
+    mask = relevant_mask(sq_idx, directions)
+    attacks = [None] * (1 << shift)
+    for occupied in occupancies(mask):
+        index = magic_index(occupied, magic_num, shift)
+        attack = ray_attacks(sq_idx, occupied, directions)
+        if attacks[index] is None:
+            attacks[index] = attack
+        elif attacks[index] != attack:
+            return None
+    return [0 if a is None else a for a in attacks]
+
+
+def generate_slider(prefix: str, magic_nums: Sequence[int], shifts: Sequence[int],
+                    directions: Directions) -> Sections:
+    masks, offsets, table = [], [], []
+    for i in range(64):
+        attacks = square_attacks(i, magic_nums[i], shifts[i], directions)
+        if attacks is None:
+            raise ValueError(f"{prefix} magic number {magic_nums[i]:#018x} collides on square {i}")
+        masks.append(relevant_mask(i, directions))
+        offsets.append(len(table))
+        table.extend(attacks)
+    return {
+        f"{prefix}mask": masks,
+        f"{prefix}magic": list(magic_nums),
+        f"{prefix}shift": list(shifts),
+        f"{prefix}offset": offsets,
+        f"{prefix}attack": table,
+    }
+
+
+def generate_lines() -> Sections:
+    between = [0] * 4096
+    line = [0] * 4096
+    for a in range(64):
+        for dr, dc in BISHOP_DIRECTIONS + ROOK_DIRECTIONS:
+            full = (1 << a) | ray_attacks(a, 0, ((dr, dc), (-dr, -dc)))
+            passed = 0
+            r, c = divmod(a, 8)
+            r, c = r + dr, c + dc
+            while 0 <= r < 8 and 0 <= c < 8:
+                b = r * 8 + c
+                between[a * 64 + b] = passed
+                line[a * 64 + b] = full
+                passed |= 1 << b
+                r, c = r + dr, c + dc
+    return {"between": between, "line": line}
+
+
+def generate_tables(params: MagicParams) -> Sections:
+    sections = dict()
+    sections.update(generate_slider("b", params.bishop_magic_nums, params.bishop_shifts, BISHOP_DIRECTIONS))
+    sections.update(generate_slider("r", params.rook_magic_nums, params.rook_shifts, ROOK_DIRECTIONS))
+    sections.update(generate_lines())
+    sections["phash"] = [params.digest()]
+    return sections
+
+
+def cache_path(params: MagicParams) -> str:
+    cache_dir = os.getenv(MAGICS_CACHE_DIR, DEFAULT_CACHE_DIR)
+    return path.join(cache_dir, f"magics-v{VERSION}-{params.digest():016x}.bin")
+
+
+def _read_matching(file: str, params: MagicParams) -> Optional[Sections]:
+    try:
+        tables = read_tables(file)
+    except (OSError, ValueError):
+        return None
+    digest = tables.get("phash")
+    return tables if digest is not None and list(digest) == [params.digest()] else None
+
+
+def write_generated(file: str, params: MagicParams) -> None:
+    os.makedirs(path.dirname(file), exist_ok=True)
+    tmp = f"{file}.{os.getpid()}.tmp"
+    write_tables(tmp, generate_tables(params))
+    os.replace(tmp, file)
+
+
+def ensure_tables(params: Optional[MagicParams] = None) -> Tuple[str, Sections]:
+    # hands back the mapping that was validated, so first use maps the file only once
+    params = params if params else MagicParams.default()
+    tables = _read_matching(SHIPPED_PATH, params)
+    if tables is not None:
+        return SHIPPED_PATH, tables
+    file = cache_path(params)
+    tables = _read_matching(file, params)
+    if tables is None:
+        write_generated(file, params)
+        tables = read_tables(file)
+    return file, tables
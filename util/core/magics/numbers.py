@@ -0,0 +1,59 @@
+BISHOP_MAGIC_NUMS = [
+    0x820420460402a080, 0x0020021200451400, 0x0010011200218000, 0x0004040888100800,
+    0x0006211001000400, 0x0401042240021400, 0x0884029888090060, 0x0024202808080810,
+    0x0020242038024080, 0x0080021081010102, 0x100004090c030120, 0x00210c0420814205,
+    0x0408311040061010, 0x4900011016100900, 0x6841020d30461020, 0x0220112088080800,
+    0x8040000802080628, 0x4a48000408480040, 0x2010000e00b20060, 0x1004020809409102,
+    0x0001011090400801, 0x2002000420842000, 0xa01200443a090402, 0x01010082a4020221,
+    0x7118c00204100682, 0x2223440021040c00, 0xa208018c08020142, 0x0004404004010200,
+    0x0014840004802000, 0x0204016024100401, 0x23021a0005451020, 0x0204222022c10410,
+    0x00122010002002b0, 0x0002501000022200, 0x84002804001800a1, 0x1002080800060a00,
+    0x0040018020120220, 0x41108881004a0100, 0x800c041410224502, 0x4001020080006403,
+    0x0205091140081002, 0x491210901c001808, 0x0400084048001000, 0x0008824200910800,
+    0xca00400408228102, 0x2042240800221200, 0x0054082081000405, 0x0001010202004291,
+    0x4040a40920100100, 0x4802060101082c10, 0x0208002623100105, 0x1000e2c084040010,
+    0x202302400682008a, 0x20820c50024a0c10, 0x200c20020c090100, 0x0684010822028800,
+    0x400e002101482012, 0x0800804218044242, 0x08a0040201008820, 0xc000000024420200,
+    0x3404102090c20200, 0x8000840810104981, 0x80330810d0009101, 0x0004011001020084,
+]
+
+BISHOP_SHIFTS = [
+    6, 5, 5, 5, 5, 5, 5, 6,
+    5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 7, 7, 7, 7, 5, 5,
+    5, 5, 7, 9, 9, 7, 5, 5,
+    5, 5, 7, 9, 9, 7, 5, 5,
+    5, 5, 7, 7, 7, 7, 5, 5,
+    5, 5, 5, 5, 5, 5, 5, 5,
+    6, 5, 5, 5, 5, 5, 5, 6,
+]
+
+ROOK_MAGIC_NUMS = [
+    0x0880081080c00020, 0x210020c000308100, 0x0080082001100280, 0x01001000a0050108,
+    0x0200041029600a00, 0x5100010008220400, 0x8280120001000d80, 0x1880012100014080,
+    0x3040800340008020, 0x0400400050026003, 0x0021002000104902, 0x020900200a100100,
+    0x000d800802840080, 0x0002808004000600, 0x0024001002110814, 0x2000800541000480,
+    0x8000ee8002400080, 0x0024c04010002005, 0x822002401000c800, 0x2040808010000800,
+    0x804080800c000802, 0x02a0080110402004, 0x201044000810010a, 0x4080020004004483,
+    0x4d84400180228000, 0x1406400880200880, 0x0000801200402203, 0x1080080280100084,
+    0x0402140080080080, 0x0a880c0080020080, 0x0342000200080405, 0x20004a8200050044,
+    0x8280c00020800889, 0x8002201000400940, 0x044a200101001542, 0x0088090021005000,
+    0x3008004200c00400, 0x0284120080800400, 0x4462106804000201, 0x1008240382000061,
+    0x0080400080208002, 0x0020100040004020, 0x4000802042020010, 0x040a002042120008,
+    0x012a008820120004, 0x0006000408020010, 0x0002008405020008, 0x80100c0040820003,
+    0x0002800100446100, 0x00a0982002400080, 0x09a0080010014040, 0x380c209200420a00,
+    0x0c04008108000580, 0xc002008004002280, 0x002900842a000100, 0x040100008a004300,
+    0x00010211800020c3, 0x0000a08412050242, 0x2001004010200489, 0x0a00081000210045,
+    0x4512002810204402, 0x8c22000401102802, 0x0485000082005401, 0x00000100208400ce,
+]
+
+ROOK_SHIFTS = [
+    12, 11, 11, 11, 11, 11, 11, 12,
+    11, 10, 10, 10, 10, 10, 10, 11,
+    11, 10, 10, 10, 10, 10, 10, 11,
+    11, 10, 10, 10, 10, 10, 10, 11,
+    11, 10, 10, 10, 10, 10, 10, 11,
+    11, 10, 10, 10, 10, 10, 10, 11,
+    11, 10, 10, 10, 10, 10, 10, 11,
+    12, 11, 11, 11, 11, 11, 11, 12,
+]
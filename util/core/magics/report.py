@@ -0,0 +1,48 @@
+import tracemalloc
+from os import path
+from typing import *
+
+import core.magics as magics
+from core.attacks import _SliderTables
+from core.square import SS
+
+
+def _traced(build: Callable[[], any]) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def _sliced_copies(table: Sequence[int], offsets: Sequence[int]) -> List[List[int]]:
+    bounds = list(offsets) + [len(table)]
+    return [list(table[bounds[i]:bounds[i + 1]]) for i in range(64)]
+
+
+def memory_report() -> Dict[str, int]:
+    bishop_table, bishop_offsets = magics.BISHOP_ATTACK_TABLE, magics.BISHOP_OFFSETS
+    rook_table, rook_offsets = magics.ROOK_ATTACK_TABLE, magics.ROOK_OFFSETS
+
+    def squareset_tables():
+        return [SS(v) for v in bishop_table], [SS(v) for v in rook_table]
+
+    def squareset_tables_with_slices():
+        tables = squareset_tables()
+        return tables, _sliced_copies(tables[0], bishop_offsets), _sliced_copies(tables[1], rook_offsets)
+
+    def shared_views():
+        tables = _SliderTables()
+        tables.load()
+        return tables
+
+    return {
+        "squareset lists": _traced(squareset_tables),
+        "squareset lists + per-square slices": _traced(squareset_tables_with_slices),
+        "mapped file (shared between processes)": path.getsize(magics.tables_path()),
+        "heap on top of the mapped file": _traced(shared_views),
+    }
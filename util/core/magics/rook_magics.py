@@ -1,20 +0,0 @@
-from core.square import SS
-
-ROOK_MAGIC_NUMS = [
-    SS(0x0880081080c00020), SS(0x210020c000308100), SS(0x0080082001100280), SS(0x01001000a0050108),
-    SS(0x0200041029600a00), SS(0x5100010008220400), SS(0x8280120001000d80), SS(0x1880012100014080),
-    SS(0x3040800340008020), SS(0x0400400050026003), SS(0x0021002000104902), SS(0x020900200a100100),
-    SS(0x000d800802840080), SS(0x0002808004000600), SS(0x0024001002110814), SS(0x2000800541000480),
-    SS(0x8000ee8002400080), SS(0x0024c04010002005), SS(0x822002401000c800), SS(0x2040808010000800),
-    SS(0x804080800c000802), SS(0x02a0080110402004), SS(0x201044000810010a), SS(0x4080020004004483),
-    SS(0x4d84400180228000), SS(0x1406400880200880), SS(0x0000801200402203), SS(0x1080080280100084),
-    SS(0x0402140080080080), SS(0x0a880c0080020080), SS(0x0342000200080405), SS(0x20004a8200050044),
-    SS(0x8280c00020800889), SS(0x8002201000400940), SS(0x044a200101001542), SS(0x0088090021005000),
-    SS(0x3008004200c00400), SS(0x0284120080800400), SS(0x4462106804000201), SS(0x1008240382000061),
-    SS(0x0080400080208002), SS(0x0020100040004020), SS(0x4000802042020010), SS(0x040a002042120008),
-    SS(0x012a008820120004), SS(0x0006000408020010), SS(0x0002008405020008), SS(0x80100c0040820003),
-    SS(0x0002800100446100), SS(0x00a0982002400080), SS(0x09a0080010014040), SS(0x380c209200420a00),
-    SS(0x0c04008108000580), SS(0xc002008004002280), SS(0x002900842a000100), SS(0x040100008a004300),
-    SS(0x00010211800020c3), SS(0x0000a08412050242), SS(0x2001004010200489), SS(0x0a00081000210045),
-    SS(0x4512002810204402), SS(0x8c22000401102802), SS(0x0485000082005401), SS(0x00000100208400ce),
-]
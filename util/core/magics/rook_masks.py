@@ -1,19 +0,0 @@
-from core.square import SS
-ROOK_MASKS = [
-    SS(0x000101010101017e),    SS(0x000202020202027c),    SS(0x000404040404047a),    SS(0x0008080808080876),
-    SS(0x001010101010106e),    SS(0x002020202020205e),    SS(0x004040404040403e),    SS(0x008080808080807e),
-    SS(0x0001010101017e00),    SS(0x0002020202027c00),    SS(0x0004040404047a00),    SS(0x0008080808087600),
-    SS(0x0010101010106e00),    SS(0x0020202020205e00),    SS(0x0040404040403e00),    SS(0x0080808080807e00),
-    SS(0x00010101017e0100),    SS(0x00020202027c0200),    SS(0x00040404047a0400),    SS(0x0008080808760800),
-    SS(0x00101010106e1000),    SS(0x00202020205e2000),    SS(0x00404040403e4000),    SS(0x00808080807e8000),
-    SS(0x000101017e010100),    SS(0x000202027c020200),    SS(0x000404047a040400),    SS(0x0008080876080800),
-    SS(0x001010106e101000),    SS(0x002020205e202000),    SS(0x004040403e404000),    SS(0x008080807e808000),
-    SS(0x0001017e01010100),    SS(0x0002027c02020200),    SS(0x0004047a04040400),    SS(0x0008087608080800),
-    SS(0x0010106e10101000),    SS(0x0020205e20202000),    SS(0x0040403e40404000),    SS(0x0080807e80808000),
-    SS(0x00017e0101010100),    SS(0x00027c0202020200),    SS(0x00047a0404040400),    SS(0x0008760808080800),
-    SS(0x00106e1010101000),    SS(0x00205e2020202000),    SS(0x00403e4040404000),    SS(0x00807e8080808000),
-    SS(0x007e010101010100),    SS(0x007c020202020200),    SS(0x007a040404040400),    SS(0x0076080808080800),
-    SS(0x006e101010101000),    SS(0x005e202020202000),    SS(0x003e404040404000),    SS(0x007e808080808000),
-    SS(0x7e01010101010100),    SS(0x7c02020202020200),    SS(0x7a04040404040400),    SS(0x7608080808080800),
-    SS(0x6e10101010101000),    SS(0x5e20202020202000),    SS(0x3e40404040404000),    SS(0x7e80808080808000),
-]
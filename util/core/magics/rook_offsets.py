@@ -1,18 +0,0 @@
-ROOK_OFFSETS = [
-    0x0000000000000000, 0x0000000000001000, 0x0000000000001800, 0x0000000000002000,
-    0x0000000000002800, 0x0000000000003000, 0x0000000000003800, 0x0000000000004000,
-    0x0000000000005000, 0x0000000000005800, 0x0000000000005c00, 0x0000000000006000,
-    0x0000000000006400, 0x0000000000006800, 0x0000000000006c00, 0x0000000000007000,
-    0x0000000000007800, 0x0000000000008000, 0x0000000000008400, 0x0000000000008800,
-    0x0000000000008c00, 0x0000000000009000, 0x0000000000009400, 0x0000000000009800,
-    0x000000000000a000, 0x000000000000a800, 0x000000000000ac00, 0x000000000000b000,
-    0x000000000000b400, 0x000000000000b800, 0x000000000000bc00, 0x000000000000c000,
-    0x000000000000c800, 0x000000000000d000, 0x000000000000d400, 0x000000000000d800,
-    0x000000000000dc00, 0x000000000000e000, 0x000000000000e400, 0x000000000000e800,
-    0x000000000000f000, 0x000000000000f800, 0x000000000000fc00, 0x0000000000010000,
-    0x0000000000010400, 0x0000000000010800, 0x0000000000010c00, 0x0000000000011000,
-    0x0000000000011800, 0x0000000000012000, 0x0000000000012400, 0x0000000000012800,
-    0x0000000000012c00, 0x0000000000013000, 0x0000000000013400, 0x0000000000013800,
-    0x0000000000014000, 0x0000000000015000, 0x0000000000015800, 0x0000000000016000,
-    0x0000000000016800, 0x0000000000017000, 0x0000000000017800, 0x0000000000018000,
-]
@@ -1,19 +0,0 @@
-from core.square import SS
-ROOK_SHIFTS = [
-    SS(0x000000000000000c),    SS(0x000000000000000b),    SS(0x000000000000000b),    SS(0x000000000000000b),
-    SS(0x000000000000000b),    SS(0x000000000000000b),    SS(0x000000000000000b),    SS(0x000000000000000c),
-    SS(0x000000000000000b),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),
-    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000b),
-    SS(0x000000000000000b),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),
-    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000b),
-    SS(0x000000000000000b),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),
-    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000b),
-    SS(0x000000000000000b),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),
-    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000b),
-    SS(0x000000000000000b),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),
-    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000b),
-    SS(0x000000000000000b),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),
-    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000a),    SS(0x000000000000000b),
-    SS(0x000000000000000c),    SS(0x000000000000000b),    SS(0x000000000000000b),    SS(0x000000000000000b),
-    SS(0x000000000000000b),    SS(0x000000000000000b),    SS(0x000000000000000b),    SS(0x000000000000000c),
-]
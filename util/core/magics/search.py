@@ -0,0 +1,134 @@
+import random
+from dataclasses import dataclass
+from multiprocessing import Pool
+from os import path
+from typing import *
+
+from core.magics.generate import *
+
+NUMBERS_PATH = path.join(path.dirname(__file__), "numbers.py")
+# candidates that set fewer of the product's top 8 bits are skipped without a collision check; the usual cut of 6 also
+# drops most of the sparse candidates that turn out to be valid
+MIN_TOP_BITS = 4
+
+
+@dataclass
+class SquareSearch:
+    slider: str
+    sq_idx: int
+    shift: int
+    attempts: int
+    seed: int
+
+
+@dataclass
+class SearchResult:
+    old: MagicParams
+    new: MagicParams
+
+    @staticmethod
+    def _entries(shifts: Sequence[int]) -> int:
+        return sum(1 << s for s in shifts)
+
+    @property
+    def improved(self) -> bool:
+        return self.new != self.old
+
+    def table_sizes(self) -> Dict[str, Tuple[int, int]]:
+        return {
+            "bishop": (self._entries(self.old.bishop_shifts), self._entries(self.new.bishop_shifts)),
+            "rook": (self._entries(self.old.rook_shifts), self._entries(self.new.rook_shifts)),
+        }
+
+
+def _directions(slider: str) -> Directions:
+    if slider == "bishop":
+        return BISHOP_DIRECTIONS
+    if slider == "rook":
+        return ROOK_DIRECTIONS
+    raise ValueError("slider must be bishop or rook")
+
+
+def is_valid_magic(magic_num: int, shift: int, occupied: Sequence[int], attacks: Sequence[int]) -> bool:
+    seen = dict()
+    for occ, attack in zip(occupied, attacks):
+        index = magic_index(occ, magic_num, shift)
+        if seen.setdefault(index, attack) != attack:
+            return False
+    return True
+
+
+def find_magic(search: SquareSearch) -> Optional[int]:
+    directions = _directions(search.slider)
+    mask = relevant_mask(search.sq_idx, directions)
+    occupied = list(occupancies(mask))
+    attacks = [ray_attacks(search.sq_idx, occ, directions) for occ in occupied]
+    rng = random.Random(search.seed)
+    for _ in range(search.attempts):
+        # sparse candidates are far more likely to map the mask's bits into the top of the product
+        candidate = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        if ((mask * candidate & MASK64) >> 56).bit_count() < MIN_TOP_BITS:
+            continue
+        if is_valid_magic(candidate, search.shift, occupied, attacks):
+            return candidate
+    return None
+
+
+def search_magics(params: MagicParams, attempts: int, processes: Optional[int] = None,
+                  seed: int = 0) -> SearchResult:
+    searches = []
+    for slider, shifts in [("bishop", params.bishop_shifts), ("rook", params.rook_shifts)]:
+        for i in range(64):
+            searches.append(SquareSearch(slider, i, shifts[i] - 1, attempts, seed * 128 + len(searches)))
+    with Pool(processes) as pool:
+        found = pool.map(find_magic, searches)
+
+    magic_nums = {"bishop": list(params.bishop_magic_nums), "rook": list(params.rook_magic_nums)}
+    shifts = {"bishop": list(params.bishop_shifts), "rook": list(params.rook_shifts)}
+    for search, magic_num in zip(searches, found):
+        if magic_num is not None:
+            magic_nums[search.slider][search.sq_idx] = magic_num
+            shifts[search.slider][search.sq_idx] = search.shift
+    new = MagicParams(
+        bishop_magic_nums=tuple(magic_nums["bishop"]),
+        bishop_shifts=tuple(shifts["bishop"]),
+        rook_magic_nums=tuple(magic_nums["rook"]),
+        rook_shifts=tuple(shifts["rook"]),
+    )
+    return SearchResult(params, new)
+
+
+def _hex_block(name: str, values: Sequence[int]) -> str:
+    lines = [f"{name} = ["]
+    for i in range(0, 64, 4):
+        lines.append("    " + " ".join(f"{v:#018x}," for v in values[i:i + 4]))
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def _int_block(name: str, values: Sequence[int]) -> str:
+    lines = [f"{name} = ["]
+    for i in range(0, 64, 8):
+        lines.append("    " + " ".join(f"{v}," for v in values[i:i + 8]))
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def render_numbers(params: MagicParams) -> str:
+    return "\n\n".join([
+        _hex_block("BISHOP_MAGIC_NUMS", params.bishop_magic_nums),
+        _int_block("BISHOP_SHIFTS", params.bishop_shifts),
+        _hex_block("ROOK_MAGIC_NUMS", params.rook_magic_nums),
+        _int_block("ROOK_SHIFTS", params.rook_shifts),
+    ]) + "\n"
+
+
+def emit(result: SearchResult, numbers_path: str = NUMBERS_PATH, tables_path: str = SHIPPED_PATH) -> bool:
+    if not result.improved:
+        return False
+    # validate before touching numbers.py so a bad search can never leave an unloadable tree behind
+    generate_tables(result.new)
+    with open(numbers_path, "w") as f:
+        f.write(render_numbers(result.new))
+    write_generated(tables_path, result.new)
+    return True
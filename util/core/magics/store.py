@@ -0,0 +1,62 @@
+import mmap
+import sys
+from array import array
+from typing import *
+
+SIGNATURE = int.from_bytes(b"SLMAGICS", "little")
+VERSION = 1
+HEADER_WORDS = 3
+ENTRY_WORDS = 3
+
+Sections = Dict[str, Sequence[int]]
+
+
+def _encode_name(name: str) -> int:
+    raw = name.encode("ascii")
+    if len(raw) > 8:
+        raise ValueError(f"section name must be at most 8 characters, got: '{name}'")
+    return int.from_bytes(raw, "little")
+
+
+def _decode_name(word: int) -> str:
+    return word.to_bytes(8, "little").rstrip(b"\0").decode("ascii")
+
+
+def write_tables(path: str, sections: Sections) -> None:
+    words = array("Q", [SIGNATURE, VERSION, len(sections)])
+    offset = HEADER_WORDS + ENTRY_WORDS * len(sections)
+    for name, values in sections.items():
+        words.extend([_encode_name(name), offset, len(values)])
+        offset += len(values)
+    for values in sections.values():
+        words.extend(values)
+    if sys.byteorder != "little":
+        words.byteswap()
+    with open(path, "wb") as f:
+        words.tofile(f)
+
+
+def _map_words(path: str) -> Sequence[int]:
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if sys.byteorder == "little":
+        return memoryview(mapped).cast("Q")
+    words = array("Q", mapped)
+    words.byteswap()
+    return words
+
+
+def read_tables(path: str) -> Sections:
+    words = _map_words(path)
+    if len(words) < HEADER_WORDS or words[0] != SIGNATURE:
+        raise ValueError(f"not a magic table file: '{path}'")
+    if words[1] != VERSION:
+        raise ValueError(f"unsupported magic table version {words[1]}, expected {VERSION}")
+    sections = dict()
+    for i in range(words[2]):
+        entry = HEADER_WORDS + ENTRY_WORDS * i
+        name, offset, length = words[entry], words[entry + 1], words[entry + 2]
+        if offset + length > len(words):
+            raise ValueError(f"section '{_decode_name(name)}' runs past the end of '{path}'")
+        sections[_decode_name(name)] = words[offset:offset + length]
+    return sections
@@ -1,5 +1,15 @@
 from dataclasses import dataclass
 
+WHITE_IDX = 0
+BLACK_IDX = 1
+
+PAWN_IDX = 0
+KNIGHT_IDX = 1
+BISHOP_IDX = 2
+ROOK_IDX = 3
+QUEEN_IDX = 4
+KING_IDX = 5
+
 @dataclass
 class PieceType:
     name: str
@@ -20,6 +30,8 @@ ROOK = PieceType("rook", 5, "R", "r")
 QUEEN = PieceType("quene", 9, "Q", "q")
 KING = PieceType("king", 10, "K", "k")
 
+PIECE_TYPES = (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING)
+
 WHITE_PAWN = Piece("white pawn", PAWN.white_letter, PAWN)
 WHITE_KNIGHT = Piece("white knight", KNIGHT.white_letter, KNIGHT)
 WHITE_BISHOP = Piece("white bishop", PAWN.white_letter, BISHOP)
@@ -1,99 +1,792 @@
+from collections import OrderedDict
+from os import getenv
 from typing import *
 
+from core.attacks import attacked_by_bb, bishop_attacks_bb, between_bb, ep_candidates_bb, king_attacks_bb, \
+    knight_attacks_bb, line_bb, pawn_attacks_bb, pinned_bb, queen_attacks_bb, rook_attacks_bb
 from core.move import Move
-from core.piece import PieceType
+from core.piece import BISHOP_IDX, BLACK_IDX, KING_IDX, KNIGHT_IDX, PAWN_IDX, PIECE_TYPES, PieceType, QUEEN_IDX, \
+    ROOK_IDX, WHITE_IDX
 from core.square import *
-from re import compile as regex, IGNORECASE
+from core.transposition import CacheStats, DerivedData, POSITION_CACHE
+from core.zobrist import BLACK_TO_MOVE, CASTLING, EP_FILE, PIECE_SQUARE, zobrist_key
+from env_vars import LINE_CACHE_POSITIONS
+from re import compile as regex
+from struct import Struct
 
-SAN_BASIC_REGEX = regex("^(?P<piece>[pnbrqk])?(?P<clarifier>[a-h1-8]{1,2})?(?P<cap>x)?(?P<dst>)?(?P<prom>=[nbrq])?[+#]?$", IGNORECASE)
+SAN_BASIC_REGEX = regex("^(?P<piece>[PNBRQK])?(?P<clarifier>[a-h]?[1-8]?)(?P<cap>x)?(?P<dst>[a-h][1-8])(?P<prom>=?[NBRQnbrq])?[+#]?[!?]*$")
+SAN_CASTLE_REGEX = regex("^(?P<o>[O0])-(?P=o)(?P<long>-(?P=o))?[+#]?[!?]*$")
 
+SAN_CACHE_SIZE = 4096
+DEFAULT_LINE_CACHE_POSITIONS = 4_000
 
+CASTLE_WHITE_SHORT = 1
+CASTLE_WHITE_LONG = 2
+CASTLE_BLACK_SHORT = 4
+CASTLE_BLACK_LONG = 8
+CASTLE_ALL = 15
+
+NO_SQUARE = -1
+NO_BOARD = -1
+
+# castling rights that survive a move touching the square, indexed by square
+_CASTLING_KEEP = [CASTLE_ALL] * 64
+_CASTLING_KEEP[0] = CASTLE_ALL & ~CASTLE_WHITE_LONG
+_CASTLING_KEEP[4] = CASTLE_ALL & ~(CASTLE_WHITE_SHORT | CASTLE_WHITE_LONG)
+_CASTLING_KEEP[7] = CASTLE_ALL & ~CASTLE_WHITE_SHORT
+_CASTLING_KEEP[56] = CASTLE_ALL & ~CASTLE_BLACK_LONG
+_CASTLING_KEEP[60] = CASTLE_ALL & ~(CASTLE_BLACK_SHORT | CASTLE_BLACK_LONG)
+_CASTLING_KEEP[63] = CASTLE_ALL & ~CASTLE_BLACK_SHORT
+
+_PROMOTION_IDX = {"N": KNIGHT_IDX, "B": BISHOP_IDX, "R": ROOK_IDX, "Q": QUEEN_IDX}
+_SAN_PIECES = {None: PAWN_IDX, "P": PAWN_IDX, "N": KNIGHT_IDX, "B": BISHOP_IDX, "R": ROOK_IDX, "Q": QUEEN_IDX,
+               "K": KING_IDX}
+
+SanSplit = Tuple[Square, Square, PieceType | None]
+# (position key, san) -> resolved move, least recently used first
+_SAN_CACHE: OrderedDict[Tuple[int, str], SanSplit] = OrderedDict()
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+_FEN_PIECES = "PNBRQKpnbrqk"
+_FEN_BOARDS = {letter: idx for idx, letter in enumerate(_FEN_PIECES)}
+_FEN_CASTLING = {"K": CASTLE_WHITE_SHORT, "Q": CASTLE_WHITE_LONG, "k": CASTLE_BLACK_SHORT, "q": CASTLE_BLACK_LONG}
+_FEN_TURNS = {"w": WHITE_IDX, "b": BLACK_IDX}
+# rank text -> ((board index, mask), ...), the zobrist key of those pieces and the board index on each square, one
+# table per row
+FenRank = Tuple[Tuple[Tuple[int, int], ...], int, List[int]]
+_FEN_RANKS: List[Dict[str, FenRank]] = [dict() for _ in range(8)]
+_FEN_RANKS_LIMIT = 4096
+# boards packed big endian, so packed[offset::8] holds the byte of every board on rank 8 - offset
+_FEN_PACK = Struct(">12Q").pack
+# those 12 bytes -> rank text, the writing side of _FEN_RANKS
+_FEN_RANK_TEXTS: Dict[bytes, str] = dict()
+_FEN_TURN_TEXTS = ("w", "b")
+_FEN_CASTLING_TEXTS = ["".join(ch for ch, bit in _FEN_CASTLING.items() if bits & bit) or "-" for bits in range(16)]
+
+
+def _parse_fen_rank(row: int, text: str) -> FenRank:
+    masks = dict()
+    cells = [NO_BOARD] * 8
+    key = 0
+    col = 0
+    for ch in text:
+        if "1" <= ch <= "8":
+            col += ord(ch) - ord("0")
+            continue
+        idx = _FEN_BOARDS.get(ch)
+        if idx is None or col > 7:
+            raise ValueError(f"invalid FEN rank: {text!r}")
+        sq_idx = row * 8 + col
+        masks[idx] = masks.get(idx, 0) | 1 << sq_idx
+        key ^= PIECE_SQUARE[idx * 64 + sq_idx]
+        cells[col] = idx
+        col += 1
+    if col != 8:
+        raise ValueError(f"invalid FEN rank: {text!r}")
+    ranks = _FEN_RANKS[row]
+    if len(ranks) >= _FEN_RANKS_LIMIT:
+        ranks.clear()
+    ranks[text] = res = (tuple(masks.items()), key, cells)
+    return res
+
+
+def _write_fen_rank(rank: bytes) -> str:
+    cells = [""] * 8
+    for idx, byte in enumerate(rank):
+        while byte:
+            low = byte & -byte
+            cells[low.bit_length() - 1] = _FEN_PIECES[idx]
+            byte ^= low
+    res = []
+    empty = 0
+    for cell in cells:
+        if not cell:
+            empty += 1
+            continue
+        if empty:
+            res.append(str(empty))
+            empty = 0
+        res.append(cell)
+    if empty:
+        res.append(str(empty))
+    if len(_FEN_RANK_TEXTS) >= _FEN_RANKS_LIMIT:
+        _FEN_RANK_TEXTS.clear()
+    _FEN_RANK_TEXTS[rank] = text = "".join(res)
+    return text
+
+
+def clear_fen_caches() -> None:
+    for ranks in _FEN_RANKS:
+        ranks.clear()
+    _FEN_RANK_TEXTS.clear()
+
+
+def _possible_castling(boards: Sequence[int]) -> int:
+    res = 0
+    if boards[KING_IDX] & 1 << 4:
+        res |= (CASTLE_WHITE_SHORT if boards[ROOK_IDX] & 1 << 7 else 0) | \
+               (CASTLE_WHITE_LONG if boards[ROOK_IDX] & 1 else 0)
+    if boards[6 + KING_IDX] & 1 << 60:
+        res |= (CASTLE_BLACK_SHORT if boards[6 + ROOK_IDX] & 1 << 63 else 0) | \
+               (CASTLE_BLACK_LONG if boards[6 + ROOK_IDX] & 1 << 56 else 0)
+    return res
+
+
+def _capturable_ep(boards: Sequence[int], occupied: int, turn: int, ep: int) -> int:
+    # mirrors push: the square is only kept while a pawn of the side to move could take en passant
+    if turn == WHITE_IDX:
+        pushed, origin, row = ep - 8, ep + 8, 5
+    else:
+        pushed, origin, row = ep + 8, ep - 8, 2
+    if (ep >> 3 != row or not boards[(turn ^ 1) * 6 + PAWN_IDX] & 1 << pushed
+            or occupied & (1 << ep | 1 << origin)
+            or not ep_candidates_bb(boards[turn * 6 + PAWN_IDX], ep, turn)):
+        return NO_SQUARE
+    return ep
+
+
+# the move with its from and to squares, the board index of the moved piece, the captured board index (or NO_BOARD)
+# and its square, then the castling rights, ep square, half move clock, key and white and black occupancy from before
+# the move
+Undo = Tuple[Move, int, int, int, int, int, int, int, int, int, int, int]
+
+
+def _mailbox(boards: Sequence[int]) -> List[int]:
+    res = [NO_BOARD] * 64
+    for idx, bb in enumerate(boards):
+        while bb:
+            low = bb & -bb
+            res[low.bit_length() - 1] = idx
+            bb ^= low
+    return res
 
 
 class Position:
+    # boards holds one bitboard per (color, piece type), white pawns through black king at color * 6 + piece; squares is the
+    # same board index (or NO_BOARD) per square, so make/unmake never has to search the boards
+    __slots__ = ("_boards", "_squares", "_occupied_co", "_occupied", "_turn", "_castling", "_ep", "_half_move_clock",
+                 "_full_move_number", "_stack", "_key")
+
     def __init__(self,
-                 is_white: bool,
-                 white_pawns: SquareSet,
-                 white_knights: SquareSet,
-                 white_bishops: SquareSet,
-                 white_rooks: SquareSet,
-                 white_queens: SquareSet,
-                 white_king: Square,
-                 black_pawns: SquareSet,
-                 black_knights: SquareSet,
-                 black_bishops: SquareSet,
-                 black_rooks: SquareSet,
-                 black_queens: SquareSet,
-                 black_king: Square,
-                 ep_square: Square | None,
-                 castling: Tuple[bool, bool, bool, bool],
-                 half_move_clock: int,
-                 full_move_number: int):
-        self.is_white = is_white
-        self.white_pawns = white_pawns
-        self.white_knights = white_knights
-        self.white_bishops = white_bishops
-        self.white_rooks = white_rooks
-        self.white_queens = white_queens
-        self.white_king = white_king
-        self.black_pawns = black_pawns
-        self.black_knights = black_knights
-        self.black_bishops = black_bishops
-        self.black_rooks = black_rooks
-        self.black_queens = black_queens
-        self.black_king = black_king
-        self.ep_square = ep_square
-        self.castling = castling
-        self.half_move_clock = half_move_clock
-        self.full_move_number = full_move_number
-        self.half_move_number = full_move_number * 2 + int(is_white)
-
-    def split_san(self, san: str) -> Tuple[Square, Square, PieceType]:
-        match =SAN_BASIC_REGEX.match(san)
+                 boards: Sequence[int],
+                 turn: int = WHITE_IDX,
+                 castling: int = CASTLE_ALL,
+                 ep: int = NO_SQUARE,
+                 half_move_clock: int = 0,
+                 full_move_number: int = 1):
+        if len(boards) != 12:
+            raise ValueError("a position needs 12 bitboards")
+        self._boards = list(boards)
+        self._squares = _mailbox(self._boards)
+        self._turn = turn
+        self._castling = castling
+        self._ep = ep
+        self._half_move_clock = half_move_clock
+        self._full_move_number = full_move_number
+        self._stack: List[Undo] = []
+        self._refresh_occupancy()
+        self._key = zobrist_key(self._boards, turn, castling, ep)
+
+    @classmethod
+    def _of(cls, boards: List[int], squares: List[int], occupied_co: List[int], turn: int, castling: int, ep: int,
+            half_move_clock: int, full_move_number: int, key: int) -> "Position":
+        res = Position.__new__(Position)
+        res._boards = boards
+        res._squares = squares
+        res._occupied_co = occupied_co
+        res._occupied = occupied_co[0] | occupied_co[1]
+        res._turn = turn
+        res._castling = castling
+        res._ep = ep
+        res._half_move_clock = half_move_clock
+        res._full_move_number = full_move_number
+        res._stack = []
+        res._key = key
+        return res
+
+    @classmethod
+    def from_fen(cls, fen: str) -> "Position":
+        fields = fen.split()
+        if not 4 <= len(fields) <= 6:
+            raise ValueError(f"not a FEN: {fen!r}")
+        rows = fields[0].split("/")
+        if len(rows) != 8:
+            raise ValueError(f"a FEN needs 8 ranks: {fen!r}")
+        boards = [0] * 12
+        squares = [NO_BOARD] * 64
+        key = 0
+        row = 7
+        for text in rows:
+            parsed = _FEN_RANKS[row].get(text) or _parse_fen_rank(row, text)
+            for idx, mask in parsed[0]:
+                boards[idx] |= mask
+            key ^= parsed[1]
+            squares[row * 8:row * 8 + 8] = parsed[2]
+            row -= 1
+        occupied_co = [boards[0] | boards[1] | boards[2] | boards[3] | boards[4] | boards[5],
+                       boards[6] | boards[7] | boards[8] | boards[9] | boards[10] | boards[11]]
+
+        turn = _FEN_TURNS.get(fields[1])
+        if turn is None:
+            raise ValueError(f"invalid side to move in FEN: {fen!r}")
+        castling = 0
+        if fields[2] != "-":
+            for ch in fields[2]:
+                bit = _FEN_CASTLING.get(ch)
+                if bit is None:
+                    raise ValueError(f"invalid castling rights in FEN: {fen!r}")
+                castling |= bit
+            castling &= _possible_castling(boards)
+        key ^= CASTLING[castling]
+        ep = NO_SQUARE
+        if fields[3] != "-":
+            ep = SQUARE_INDICES.get(fields[3])
+            if ep is None:
+                raise ValueError(f"invalid en passant square in FEN: {fen!r}")
+            ep = _capturable_ep(boards, occupied_co[0] | occupied_co[1], turn, ep)
+            if ep != NO_SQUARE:
+                key ^= EP_FILE[ep & 7]
+        if turn == BLACK_IDX:
+            key ^= BLACK_TO_MOVE
+        half_move_clock = int(fields[4]) if len(fields) > 4 else 0
+        full_move_number = int(fields[5]) if len(fields) > 5 else 1
+        return Position._of(boards, squares, occupied_co, turn, castling, ep, half_move_clock, full_move_number,
+                            key)
+
+    @classmethod
+    def from_fens(cls, fens: Iterable[str]) -> Iterator["Position"]:
+        from_fen = Position.from_fen
+        for fen in fens:
+            fen = fen.strip()
+            if fen:
+                yield from_fen(fen)
+
+    def board_fen(self) -> str:
+        packed = _FEN_PACK(*self._boards)
+        texts = _FEN_RANK_TEXTS
+        rows = []
+        for offset in range(8):
+            rank = packed[offset::8]
+            rows.append(texts.get(rank) or _write_fen_rank(rank))
+        return "/".join(rows)
+
+    def to_fen(self) -> str:
+        ep = "-" if self._ep == NO_SQUARE else SQUARE_NAMES[self._ep]
+        return (f"{self.board_fen()} {_FEN_TURN_TEXTS[self._turn]} {_FEN_CASTLING_TEXTS[self._castling]} {ep} "
+                f"{self._half_move_clock} {self._full_move_number}")
+
+    def _refresh_occupancy(self) -> None:
+        b = self._boards
+        white = b[0] | b[1] | b[2] | b[3] | b[4] | b[5]
+        black = b[6] | b[7] | b[8] | b[9] | b[10] | b[11]
+        self._occupied_co = [white, black]
+        self._occupied = white | black
+
+    def push(self, move: Move) -> None:
+        us = self._turn
+        them = us ^ 1
+        frm, to = move.frm._idx, move.to._idx
+        squares = self._squares
+        moved = squares[frm]
+        if moved // 6 != us:
+            raise ValueError(f"no piece of the side to move on {move.frm}")
+        boards = self._boards
+        occupied_co = self._occupied_co
+        piece = moved - us * 6
+        key = self._key
+
+        captured_sq = to
+        if piece == PAWN_IDX and to == self._ep:
+            captured_sq = to - 8 if us == WHITE_IDX else to + 8
+        captured = squares[captured_sq]
+        self._stack.append((move, frm, to, moved, captured, captured_sq, self._castling, self._ep,
+                            self._half_move_clock, key, occupied_co[0], occupied_co[1]))
+        if captured != NO_BOARD:
+            captured_bb = 1 << captured_sq
+            boards[captured] ^= captured_bb
+            occupied_co[them] ^= captured_bb
+            squares[captured_sq] = NO_BOARD
+            key ^= PIECE_SQUARE[captured * 64 + captured_sq]
+
+        landed = moved if move.prom is None else us * 6 + _PROMOTION_IDX[move.prom.white_letter]
+        boards[moved] ^= 1 << frm
+        boards[landed] ^= 1 << to
+        squares[frm] = NO_BOARD
+        squares[to] = landed
+        occupied = occupied_co[us] ^ (1 << frm | 1 << to)
+        key ^= PIECE_SQUARE[moved * 64 + frm] ^ PIECE_SQUARE[landed * 64 + to]
+
+        ep = NO_SQUARE
+        if piece == PAWN_IDX:
+            if to - frm == 16 or frm - to == 16:
+                ep = (frm + to) >> 1
+                if not ep_candidates_bb(boards[them * 6 + PAWN_IDX], ep, them):
+                    ep = NO_SQUARE
+        elif piece == KING_IDX and (to - frm == 2 or frm - to == 2):
+            rook_frm, rook_to = (frm + 3, frm + 1) if to > frm else (frm - 4, frm - 1)
+            rook = us * 6 + ROOK_IDX
+            rook_bb = 1 << rook_frm | 1 << rook_to
+            boards[rook] ^= rook_bb
+            occupied ^= rook_bb
+            squares[rook_frm] = NO_BOARD
+            squares[rook_to] = rook
+            key ^= PIECE_SQUARE[rook * 64 + rook_frm] ^ PIECE_SQUARE[rook * 64 + rook_to]
+        occupied_co[us] = occupied
+        self._occupied = occupied | occupied_co[them]
+
+        castling = self._castling & _CASTLING_KEEP[frm] & _CASTLING_KEEP[to]
+        if castling != self._castling:
+            key ^= CASTLING[self._castling] ^ CASTLING[castling]
+            self._castling = castling
+        if self._ep != NO_SQUARE:
+            key ^= EP_FILE[self._ep & 7]
+        if ep != NO_SQUARE:
+            key ^= EP_FILE[ep & 7]
+        self._ep = ep
+        self._key = key ^ BLACK_TO_MOVE
+        self._half_move_clock = 0 if piece == PAWN_IDX or captured != NO_BOARD else self._half_move_clock + 1
+        if us == BLACK_IDX:
+            self._full_move_number += 1
+        self._turn = them
+
+    def pop(self) -> Move:
+        (move, frm, to, moved, captured, captured_sq, self._castling, self._ep, self._half_move_clock, self._key,
+         white, black) = self._stack.pop()
+        boards = self._boards
+        squares = self._squares
+        boards[squares[to]] ^= 1 << to
+        boards[moved] ^= 1 << frm
+        squares[to] = NO_BOARD
+        squares[frm] = moved
+        if captured != NO_BOARD:
+            boards[captured] ^= 1 << captured_sq
+            squares[captured_sq] = captured
+        if moved % 6 == KING_IDX and (to - frm == 2 or frm - to == 2):
+            rook_frm, rook_to = (frm + 3, frm + 1) if to > frm else (frm - 4, frm - 1)
+            rook = moved - KING_IDX + ROOK_IDX
+            boards[rook] ^= 1 << rook_frm | 1 << rook_to
+            squares[rook_frm] = rook
+            squares[rook_to] = NO_BOARD
+        occupied_co = self._occupied_co
+        occupied_co[0] = white
+        occupied_co[1] = black
+        self._occupied = white | black
+        self._turn ^= 1
+        if self._turn == BLACK_IDX:
+            self._full_move_number -= 1
+        return move
+
+    def apply(self, move: Move | str) -> "Position":
+        if type(move) is str:
+            move = Move(*self.split_san(move))
+        res = self.copy(stack=False)
+        res.push(move)
+        return res
+
+    def copy(self, stack: bool = True) -> "Position":
+        res = Position.__new__(Position)
+        res._boards = self._boards.copy()
+        res._squares = self._squares.copy()
+        res._occupied_co = self._occupied_co.copy()
+        res._occupied = self._occupied
+        res._turn = self._turn
+        res._castling = self._castling
+        res._ep = self._ep
+        res._half_move_clock = self._half_move_clock
+        res._full_move_number = self._full_move_number
+        res._stack = self._stack.copy() if stack else []
+        res._key = self._key
+        return res
+
+    @property
+    def move_stack(self) -> List[Move]:
+        return [undo[0] for undo in self._stack]
+
+    def derived(self, depth: int = 0) -> DerivedData:
+        return POSITION_CACHE.get_or_compute(self._key, DerivedData, depth)
+
+    def attacked_bb(self, color: int) -> int:
+        data = self.derived()
+        res = data.attacked[color]
+        if res is None:
+            b = self._boards[color * 6:color * 6 + 6]
+            res = attacked_by_bb(color, b[PAWN_IDX], b[KNIGHT_IDX], b[BISHOP_IDX] | b[QUEEN_IDX],
+                                 b[ROOK_IDX] | b[QUEEN_IDX], b[KING_IDX], self._occupied)
+            data.attacked[color] = res
+        return res
+
+    def _attackers_bb(self, sq_idx: int, color: int, occ: int) -> int:
+        b = self._boards[color * 6:color * 6 + 6]
+        return (pawn_attacks_bb(sq_idx, color ^ 1) & b[PAWN_IDX] | knight_attacks_bb(sq_idx) & b[KNIGHT_IDX]
+                | bishop_attacks_bb(sq_idx, occ) & (b[BISHOP_IDX] | b[QUEEN_IDX])
+                | rook_attacks_bb(sq_idx, occ) & (b[ROOK_IDX] | b[QUEEN_IDX]) | king_attacks_bb(sq_idx) & b[KING_IDX])
+
+    def is_check(self) -> bool:
+        return bool(self._boards[self._turn * 6 + KING_IDX] & self.attacked_bb(self._turn ^ 1))
+
+    def pieces_bb(self, color: int, piece: int) -> int:
+        return self._boards[color * 6 + piece]
+
+    def occupied_bb(self, color: int | None = None) -> int:
+        return self._occupied if color is None else self._occupied_co[color]
+
+    @property
+    def boards(self) -> Tuple[int, ...]:
+        return tuple(self._boards)
+
+    @property
+    def key(self) -> int:
+        return self._key
+
+    @property
+    def turn(self) -> int:
+        return self._turn
+
+    @property
+    def castling_bits(self) -> int:
+        return self._castling
+
+    @property
+    def ep(self) -> int:
+        return self._ep
+
+    @property
+    def is_white(self) -> bool:
+        return self._turn == WHITE_IDX
+
+    @property
+    def white_pawns(self) -> SquareSet:
+        return SquareSet._of(self._boards[PAWN_IDX])
+
+    @property
+    def white_knights(self) -> SquareSet:
+        return SquareSet._of(self._boards[KNIGHT_IDX])
+
+    @property
+    def white_bishops(self) -> SquareSet:
+        return SquareSet._of(self._boards[BISHOP_IDX])
+
+    @property
+    def white_rooks(self) -> SquareSet:
+        return SquareSet._of(self._boards[ROOK_IDX])
+
+    @property
+    def white_queens(self) -> SquareSet:
+        return SquareSet._of(self._boards[QUEEN_IDX])
+
+    @property
+    def white_king(self) -> Square | None:
+        return _king(self._boards[KING_IDX])
+
+    @property
+    def black_pawns(self) -> SquareSet:
+        return SquareSet._of(self._boards[6 + PAWN_IDX])
+
+    @property
+    def black_knights(self) -> SquareSet:
+        return SquareSet._of(self._boards[6 + KNIGHT_IDX])
+
+    @property
+    def black_bishops(self) -> SquareSet:
+        return SquareSet._of(self._boards[6 + BISHOP_IDX])
+
+    @property
+    def black_rooks(self) -> SquareSet:
+        return SquareSet._of(self._boards[6 + ROOK_IDX])
+
+    @property
+    def black_queens(self) -> SquareSet:
+        return SquareSet._of(self._boards[6 + QUEEN_IDX])
+
+    @property
+    def black_king(self) -> Square | None:
+        return _king(self._boards[6 + KING_IDX])
+
+    @property
+    def ep_square(self) -> Square | None:
+        return None if self._ep == NO_SQUARE else SQ(self._ep)
+
+    @property
+    def castling(self) -> Tuple[bool, bool, bool, bool]:
+        c = self._castling
+        return (bool(c & CASTLE_WHITE_SHORT), bool(c & CASTLE_WHITE_LONG),
+                bool(c & CASTLE_BLACK_SHORT), bool(c & CASTLE_BLACK_LONG))
+
+    @property
+    def half_move_clock(self) -> int:
+        return self._half_move_clock
+
+    @property
+    def full_move_number(self) -> int:
+        return self._full_move_number
+
+    @property
+    def half_move_number(self) -> int:
+        return self._full_move_number * 2 - (1 if self._turn == WHITE_IDX else 0)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not Position:
+            return False
+        return (self._boards == other._boards and self._turn == other._turn and self._castling == other._castling
+                and self._ep == other._ep and self._half_move_clock == other._half_move_clock
+                and self._full_move_number == other._full_move_number)
+
+    def __copy__(self) -> "Position":
+        return self.copy()
+
+    def split_san(self, san: str) -> SanSplit:
+        cache_key = (self._key, san)
+        res = _SAN_CACHE.get(cache_key)
+        if res is not None:
+            _SAN_CACHE.move_to_end(cache_key)
+            return res
+        res = self._resolve_san(san)
+        _SAN_CACHE[cache_key] = res
+        while len(_SAN_CACHE) > SAN_CACHE_SIZE:
+            _SAN_CACHE.popitem(last=False)
+        return res
+
+    def _resolve_san(self, san: str) -> SanSplit:
+        us = self._turn
+        them = us ^ 1
+        b = self._boards
+        occ = self._occupied
+
+        castle = SAN_CASTLE_REGEX.match(san)
+        if castle:
+            king = 4 if us == WHITE_IDX else 60
+            if castle.group("long"):
+                right, rook, to = CASTLE_WHITE_LONG, king - 4, king - 2
+            else:
+                right, rook, to = CASTLE_WHITE_SHORT, king + 3, king + 2
+            if not self._castling & (right if us == WHITE_IDX else right << 2):
+                raise ValueError(f"{san}: no castling rights")
+            if between_bb(king, rook) & occ:
+                raise ValueError(f"{san}: castling is blocked")
+            if (between_bb(king, to) | 1 << king | 1 << to) & self.attacked_bb(them):
+                raise ValueError(f"{san}: castling through check")
+            return SQ(king), SQ(to), None
+
+        match = SAN_BASIC_REGEX.match(san)
         if not match:
             raise ValueError("san not in allowed format")
-        piece = match.group("piece")
-        clarifier = match.group("clarifier")
-        dst = match.group("dst")
-        cap = match.group("cap")
-        prom = match.group("prom")
-        # todo: come back to this
+        piece = _SAN_PIECES[match.group("piece")]
+        dst = SQUARE_INDICES[match.group("dst")]
+        dst_bb = 1 << dst
+        if self._occupied_co[us] & dst_bb:
+            raise ValueError(f"{san}: {SQUARE_NAMES[dst]} holds a piece of the side to move")
+        if piece != PAWN_IDX and bool(match.group("cap")) != bool(self._occupied_co[them] & dst_bb):
+            if match.group("cap"):
+                raise ValueError(f"{san}: nothing to capture on {SQUARE_NAMES[dst]}")
+            raise ValueError(f"{san}: a capture on {SQUARE_NAMES[dst]} needs an x")
+        own = b[us * 6 + piece]
+        king_bb = b[us * 6 + KING_IDX]
+        king = king_bb.bit_length() - 1
 
+        if piece == KING_IDX:
+            if self._attackers_bb(dst, them, occ ^ king_bb):
+                raise ValueError(f"{san}: {SQUARE_NAMES[dst]} is attacked")
+        elif king_bb:
+            checkers = self._attackers_bb(king, them, occ)
+            if checkers & (checkers - 1):
+                raise ValueError(f"{san}: only the king can move out of a double check")
+            if checkers:
+                answers = checkers | between_bb(king, checkers.bit_length() - 1)
+                if piece == PAWN_IDX and dst == self._ep and match.group("cap"):
+                    answers |= dst_bb if checkers & b[them * 6 + PAWN_IDX] else 0
+                if not answers & dst_bb:
+                    raise ValueError(f"{san}: does not answer the check")
 
-    def apply_san(self, san: str) -> Move:
-        frm, to, prom = self.split_san(san)
+        if piece == PAWN_IDX:
+            if match.group("cap"):
+                if not self._occupied_co[them] & dst_bb and dst != self._ep:
+                    raise ValueError(f"{san}: nothing to capture on {SQUARE_NAMES[dst]}")
+                candidates = pawn_attacks_bb(dst, them) & own
+            elif occ & dst_bb:
+                raise ValueError(f"{san}: {SQUARE_NAMES[dst]} is occupied")
+            else:
+                step = 8 if us == WHITE_IDX else -8
+                single = dst - step
+                if 0 <= single < 64 and own & 1 << single:
+                    candidates = 1 << single
+                elif dst >> 3 == (3 if us == WHITE_IDX else 4) and not occ & 1 << single:
+                    candidates = own & 1 << (single - step)
+                else:
+                    candidates = 0
+        elif piece == KNIGHT_IDX:
+            candidates = knight_attacks_bb(dst) & own
+        elif piece == BISHOP_IDX:
+            candidates = bishop_attacks_bb(dst, occ) & own
+        elif piece == ROOK_IDX:
+            candidates = rook_attacks_bb(dst, occ) & own
+        elif piece == QUEEN_IDX:
+            candidates = queen_attacks_bb(dst, occ) & own
+        else:
+            candidates = king_attacks_bb(dst) & own
+
+        for ch in match.group("clarifier"):
+            if ch <= "8":
+                candidates &= 0xff << 8 * (ord(ch) - ord("1"))
+            else:
+                candidates &= FILE_A_BB << (ord(ch) - ord("a"))
+
+        if piece != KING_IDX and king_bb and candidates:
+            pinned = candidates & pinned_bb(king, occ, self._occupied_co[us],
+                                            b[them * 6 + ROOK_IDX] | b[them * 6 + QUEEN_IDX],
+                                            b[them * 6 + BISHOP_IDX] | b[them * 6 + QUEEN_IDX])
+            while pinned:
+                low = pinned & -pinned
+                if not line_bb(king, low.bit_length() - 1) & dst_bb:
+                    candidates ^= low
+                pinned ^= low
 
+        if not candidates:
+            raise ValueError(f"{san}: no {PIECE_TYPES[piece].name} can move to {SQUARE_NAMES[dst]}")
+        if candidates & (candidates - 1):
+            raise ValueError(f"{san}: ambiguous, more than one {PIECE_TYPES[piece].name} can move there")
+
+        prom = match.group("prom")
+        if piece == PAWN_IDX and (dst >> 3 == 0 or dst >> 3 == 7):
+            if not prom:
+                raise ValueError(f"{san}: missing promotion")
+            prom = PIECE_TYPES[_PROMOTION_IDX[prom[-1].upper()]]
+        elif prom:
+            raise ValueError(f"{san}: only pawns reaching the last rank promote")
+        return SQ(candidates.bit_length() - 1), SQ(dst), prom
+
+    def apply_san(self, san: str) -> Move:
+        move = Move(*self.split_san(san))
+        self.push(move)
+        return move
 
     @classmethod
     def starting(cls) -> "Position":
         return Position(
-            is_white=True,
-            white_pawns=ss.white.starting.pawns,
-            white_knights=ss.white.starting.knights,
-            white_bishops=ss.white.starting.bishops,
-            white_rooks=ss.white.starting.rooks,
-            white_queens=ss.white.starting.queens,
-            white_king=sq.white.starting.king,
-            black_pawns=ss.black.starting.pawns,
-            black_knights=ss.black.starting.knights,
-            black_bishops=ss.black.starting.bishops,
-            black_rooks=ss.black.starting.rooks,
-            black_queens=ss.black.starting.queens,
-            black_king=sq.black.starting.king,
-            ep_square=None,
-            castling=(True, True, True, True),
+            boards=STARTING_BOARDS,
+            turn=WHITE_IDX,
+            castling=CASTLE_ALL,
+            ep=NO_SQUARE,
             half_move_clock=0,
             full_move_number=1
         )
 
 
     class Builder:
-        def __init__(self):
-            self.position = Position.starting()
+        def __init__(self, cache: "LineCache | None" = None):
+            self.cache = LINE_CACHE if cache is None else cache
+            self._node = self.cache.root
 
+        @property
+        def position(self) -> "Position":
+            return self._node.position.copy(stack=False)
 
-        def moves(self, sans: Iterable[str]) -> Self:
-            for san in sans:
-                self.position = self.position.apply(san)
+        def moves(self, sans: str | Iterable[str]) -> Self:
+            if type(sans) is str:
+                sans = sans.split()
+            self._node = self.cache.walk(self._node, sans)
             return self
 
+
+class _LineNode:
+    __slots__ = ("position", "parent", "san", "children")
+
+    def __init__(self, position: Position, parent: "_LineNode | None", san: str | None):
+        self.position = position
+        self.parent = parent
+        self.san = san
+        self.children: Dict[str, _LineNode] = dict()
+
+
+class LineCache:
+    # a trie of SAN prefixes from the starting position. Walking a line refreshes every node on it, deepest first, so
+    # a node is never colder than its descendants and the coldest node is always a leaf that can be cut off
+    __slots__ = ("max_positions", "root", "stats", "_lru")
+
+    def __init__(self, max_positions: int = DEFAULT_LINE_CACHE_POSITIONS):
+        if max_positions < 1:
+            raise ValueError("a line cache needs room for at least one position")
+        self.max_positions = max_positions
+        self.root = _LineNode(Position.starting(), None, None)
+        self.stats = CacheStats()
+        self._lru: OrderedDict[_LineNode, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def walk(self, node: _LineNode, sans: Iterable[str]) -> _LineNode:
+        stats = self.stats
+        node = self._attach(node)
+        try:
+            for san in sans:
+                child = node.children.get(san)
+                if child is None:
+                    child = _LineNode(node.position.apply(san), node, san)
+                    node.children[san] = child
+                    stats.misses += 1
+                    stats.stores += 1
+                else:
+                    stats.hits += 1
+                node = child
+        finally:
+            self._touch(node)
+            self._evict()
+        return node
+
+    def line(self, sans: str | Iterable[str]) -> Position:
+        return Position.Builder(self).moves(sans).position
+
+    def clear(self) -> None:
+        self.root.children.clear()
+        self._lru.clear()
+        self.stats = CacheStats()
+
+    def _attach(self, node: _LineNode) -> _LineNode:
+        # a builder may hold on to a node that has since been evicted; hang its line back under the root, or switch to
+        # the node that replaced it
+        path = []
+        while node.parent is not None:
+            path.append(node)
+            node = node.parent
+        for stale in reversed(path):
+            live = node.children.get(stale.san)
+            if live is None:
+                stale.parent = node
+                node.children[stale.san] = live = stale
+            node = live
+        return node
+
+    def _touch(self, node: _LineNode) -> None:
+        lru = self._lru
+        while node.parent is not None:
+            lru[node] = None
+            lru.move_to_end(node)
+            node = node.parent
+
+    def _evict(self) -> None:
+        lru = self._lru
+        while len(lru) > self.max_positions:
+            node, _ = lru.popitem(last=False)
+            if node.parent.children.get(node.san) is node:
+                del node.parent.children[node.san]
+            self.stats.evictions += 1
+
+
+def _king(bb: int) -> Square | None:
+    return SQ(bb.bit_length() - 1) if bb else None
+
+
+STARTING_BOARDS = (
+    0x0000_0000_0000_ff00, 0x0000_0000_0000_0042, 0x0000_0000_0000_0024,
+    0x0000_0000_0000_0081, 0x0000_0000_0000_0008, 0x0000_0000_0000_0010,
+    0x00ff_0000_0000_0000, 0x4200_0000_0000_0000, 0x2400_0000_0000_0000,
+    0x8100_0000_0000_0000, 0x0800_0000_0000_0000, 0x1000_0000_0000_0000,
+)
+
+
+def _line_cache_positions_from_env() -> int:
+    positions = getenv(LINE_CACHE_POSITIONS)
+    return int(positions) if positions else DEFAULT_LINE_CACHE_POSITIONS
+
+
+LINE_CACHE = LineCache(_line_cache_positions_from_env())
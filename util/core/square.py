@@ -1,46 +1,54 @@
-import re
+from __future__ import annotations
+
 from functools import total_ordering
 from typing import *
 
-ALGEBRAIC_REGEX = re.compile("^[a-h][1-8]$", re.I)
 BLACK = "black"
 EITHER = "either"
 WHITE = "white"
 
 SideNames = Literal["white", "black", "either"]
 
-SquareConstructorType = Union[int, str, Tuple[int, int], "Square"]
+SQUARE_NAMES: Tuple[str, ...] = tuple(f + r for r in "12345678" for f in "abcdefgh")
+SQUARE_INDICES: Dict[str, int] = {name: i for i, name in enumerate(SQUARE_NAMES)}
+# upper case files are accepted everywhere a square name is
+_INDEX_BY_NAME: Dict[str, int] = {**SQUARE_INDICES, **{name.upper(): i for i, name in enumerate(SQUARE_NAMES)}}
 
 
 @total_ordering
 class Square:
-    def __init__(self, which: SquareConstructorType = None):
-        self._idx: int = 0
+    __slots__ = ("_idx", "_name")
+
+    def __new__(cls, which: SquareConstructorType = None):
         if which is None:
-            self._idx = 0
-            return
-        if type(which) == int:
-            self._idx = which
-            if not self._is_valid():
-                raise ValueError("int must be 0<=X<=63")
-        elif type(which) == tuple and len(which) == 2:
+            return _SQUARES[0]
+        tipe = type(which)
+        if tipe == int:
+            if 0 <= which <= 63:
+                return _SQUARES[which]
+            raise ValueError("int must be 0<=X<=63")
+        if tipe == tuple and len(which) == 2:
             row, col = which
             if type(row) != int or type(col) != int:
                 raise ValueError("2-tuple can only be for ints")
-            self._idx = row * 8 + col
-            if not self._is_valid():
+            if not (0 <= row <= 7 and 0 <= col <= 7):
                 raise ValueError("2-tuple must each have values 0<=X<=7")
-        elif type(which) == str:
-            which = which.lower()
-            if not ALGEBRAIC_REGEX.search(which):
+            return _SQUARES[row * 8 + col]
+        if tipe == str:
+            idx = _INDEX_BY_NAME.get(which)
+            if idx is None:
                 raise ValueError("algebraic form only")
-            row = int(which[1]) - 1
-            col = "abcdefgh".index(which[0])
-            self._idx = row * 8 + col
-        elif type(which) == Square:
-            self._idx = which.idx
-        else:
-            raise ValueError("Unsupported constructor value")
+            return _SQUARES[idx]
+        if tipe == Square:
+            return which
+        raise ValueError("Unsupported constructor value")
+
+    @classmethod
+    def _intern(cls, idx: int) -> "Square":
+        square = object.__new__(cls)
+        object.__setattr__(square, "_idx", idx)
+        object.__setattr__(square, "_name", SQUARE_NAMES[idx])
+        return square
 
     @property
     def idx(self) -> int:
@@ -76,7 +84,7 @@ class Square:
 
     @property
     def name(self):
-        return f"{self.file}{self.rank}"
+        return self._name
 
     @property
     def white(self):
@@ -103,26 +111,31 @@ class Square:
             return self.row == 0 or self.row == 7
         raise ValueError("sides must be white, black, or either")
 
-    def _is_valid(self):
-        return 0 <= self.idx <= 63
-
     def __bytes__(self):
         return bytes(self.idx)
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __eq__(self, other):
+        if other is self:
+            return True
         if other is None:
             return False
         tipe = type(other)
         if tipe == int:
-            return self.idx == other
+            return self._idx == other
         if tipe == Square:
-            return self.idx == other.idx
+            return False
         if tipe == str:
-            return self.name == other.lower()
+            return _INDEX_BY_NAME.get(other) == self._idx
         return False
 
     def __hash__(self):
-        return self.idx
+        return self._idx
 
     def __hex__(self):
         return hex(self.idx)
@@ -133,46 +146,137 @@ class Square:
     def __lt__(self, other):
         return self.idx < Square(other).idx
 
+    def __reduce__(self):
+        return Square, (self._idx,)
+
     def __repr__(self):
         return f"SQ({self.name})"
 
+    def __setattr__(self, key, value):
+        raise AttributeError("Square is immutable")
+
     def __str__(self):
         return self.name
 
 
 SQ = Square
 
-SquareSetConstructorType = Union[int, Iterable, str, Square, "SquareSet"]
+SquareConstructorType = Union[int, str, Tuple[int, int], Square]
+
+_SQUARES: Tuple[Square, ...] = tuple(Square._intern(i) for i in range(64))
+
+MASK64 = 0xffff_ffff_ffff_ffff
+_new = object.__new__
+
+FILE_A_BB = 0x0101_0101_0101_0101
+FILE_H_BB = 0x8080_8080_8080_8080
+NOT_FILE_A_BB = ~FILE_A_BB & MASK64
+NOT_FILE_H_BB = ~FILE_H_BB & MASK64
+
+
+def north_bb(bb: int) -> int:
+    return (bb << 8) & MASK64
+
+
+def south_bb(bb: int) -> int:
+    return bb >> 8
+
+
+def east_bb(bb: int) -> int:
+    return (bb << 1) & NOT_FILE_A_BB
+
+
+def west_bb(bb: int) -> int:
+    return (bb >> 1) & NOT_FILE_H_BB
+
+
+def north_east_bb(bb: int) -> int:
+    return (bb << 9) & NOT_FILE_A_BB
+
+
+def north_west_bb(bb: int) -> int:
+    return (bb << 7) & NOT_FILE_H_BB
+
+
+def south_east_bb(bb: int) -> int:
+    return (bb >> 7) & NOT_FILE_A_BB
+
+
+def south_west_bb(bb: int) -> int:
+    return (bb >> 9) & NOT_FILE_H_BB
+
+
+def north_fill_bb(bb: int) -> int:
+    bb |= bb << 8
+    bb |= bb << 16
+    bb |= bb << 32
+    return bb & MASK64
+
+
+def south_fill_bb(bb: int) -> int:
+    bb |= bb >> 8
+    bb |= bb >> 16
+    bb |= bb >> 32
+    return bb
+
+
+def file_fill_bb(bb: int) -> int:
+    return north_fill_bb(bb) | south_fill_bb(bb)
+
+
+def flip_vertical_bb(bb: int) -> int:
+    return int.from_bytes(bb.to_bytes(8, "little"), "big")
+
+
+def mirror_horizontal_bb(bb: int) -> int:
+    bb = ((bb >> 1) & 0x5555_5555_5555_5555) | ((bb & 0x5555_5555_5555_5555) << 1)
+    bb = ((bb >> 2) & 0x3333_3333_3333_3333) | ((bb & 0x3333_3333_3333_3333) << 2)
+    return ((bb >> 4) & 0x0f0f_0f0f_0f0f_0f0f) | ((bb & 0x0f0f_0f0f_0f0f_0f0f) << 4)
+
+
+def rotate_180_bb(bb: int) -> int:
+    return flip_vertical_bb(mirror_horizontal_bb(bb))
 
 
 class SquareSet:
+    __slots__ = ("_value",)
+
     def __init__(self, initial: Optional[SquareSetConstructorType] = None):
         self._value = 0
         if initial is None:
             return
         tipe = type(initial)
-        if tipe == SquareSet:
-            self._value = initial.value
-        elif tipe == int:
+        if tipe is int:
             self._value = initial
+        elif tipe is SquareSet:
+            self._value = initial._value
         elif tipe in [tuple, list, set]:
             self._init_from_iter(initial)
         elif tipe == str:
             self._init_from_str(initial)
-        elif tipe == Square:
-            self._value = initial.mask
+        elif tipe is Square:
+            self._value = 1 << initial._idx
+        elif tipe is MutableSquareSet:
+            self._value = initial._value
         else:
             self._value = Square(initial).mask
         if self._value < 0:
             self._value += 2 ** 64
 
+    @classmethod
+    def _of(cls, value: int) -> "SquareSet":
+        # skips the constructor's type dispatch, value must already be a non-negative int
+        res = _new(cls)
+        res._value = value
+        return res
+
     @property
     def value(self):
         return self._value
 
     @property
     def inverse(self):
-        return SquareSet(~self.value)
+        return SquareSet._of(~self._value & MASK64)
 
     @property
     def bits(self):
@@ -180,57 +284,123 @@ class SquareSet:
 
     @property
     def count(self):
-        return self.value.bit_count()
+        return self._value.bit_count()
 
     def union(self, other: any) -> Self:
-        other = SS(other)
-        return SquareSet(self.value | other.value)
+        res = _new(SquareSet)
+        res._value = self._value | (other._value if type(other) is SquareSet else _bits(other))
+        return res
 
     def intersect(self, other: any) -> Self:
-        other = SS(other)
-        return SquareSet(self.value & other.value)
+        res = _new(SquareSet)
+        res._value = self._value & (other._value if type(other) is SquareSet else _bits(other))
+        return res
 
     def difference(self, other: any) -> Self:
-        other = SS(other)
-        return SquareSet(self.value & ~other.value)
+        res = _new(SquareSet)
+        res._value = self._value & ~(other._value if type(other) is SquareSet else _bits(other))
+        return res
 
     def is_subset_of(self, other: any):
-        other = SS(other)
-        return self.value == (self.value & other.value)
+        return self._value == (self._value & _bits(other))
 
     def has_subset(self, other: any):
-        other = SS(other)
-        return other.value == (self.value & other.value)
+        other = _bits(other)
+        return other == (self._value & other)
 
     def is_proper_subset_of(self, other: any):
-        other = SS(other)
-        return self.is_subset_of(other.value) and self.value != other.value
+        other = _bits(other)
+        return self._value == (self._value & other) and self._value != other
 
     def has_proper_subset(self, other: any):
-        other = SS(other)
-        return self.has_subset(other) and self.value != other.value
+        other = _bits(other)
+        return other == (self._value & other) and self._value != other
 
     def is_superset_of(self, other: any):
-        other = SS(other)
-        return other.value == (other.value & self.value)
+        other = _bits(other)
+        return other == (other & self._value)
 
     def has_superset(self, other: any):
-        other = SS(other)
-        return self.value == (other.value & self.value)
+        return self._value == (_bits(other) & self._value)
 
     def is_proper_superset_of(self, other: any):
-        other = SS(other)
-        return self.is_superset_of(other.value) and self.value != other.value
+        other = _bits(other)
+        return other == (other & self._value) and self._value != other
 
     def has_proper_superset(self, other: any):
-        other = SS(other)
-        return self.has_superset(other) and (self.value != other.value)
+        other = _bits(other)
+        return self._value == (other & self._value) and self._value != other
 
     def squares(self) -> List[Square]:
         return list(self)
 
+    def indices(self) -> Iterator[int]:
+        value = self._value
+        while value:
+            low = value & -value
+            yield low.bit_length() - 1
+            value ^= low
+
+    def lsb(self) -> Square:
+        if not self._value:
+            raise ValueError("empty SquareSet has no lsb")
+        return _SQUARES[(self._value & -self._value).bit_length() - 1]
+
+    def msb(self) -> Square:
+        if not self._value:
+            raise ValueError("empty SquareSet has no msb")
+        return _SQUARES[self._value.bit_length() - 1]
+
+    def pop_lsb(self) -> Tuple[Square, Self]:
+        if not self._value:
+            raise ValueError("empty SquareSet has no lsb")
+        low = self._value & -self._value
+        return _SQUARES[low.bit_length() - 1], SquareSet(self._value ^ low)
+
+    def north(self) -> Self:
+        return SquareSet._of(north_bb(self._value))
+
+    def south(self) -> Self:
+        return SquareSet._of(south_bb(self._value))
+
+    def east(self) -> Self:
+        return SquareSet._of(east_bb(self._value))
+
+    def west(self) -> Self:
+        return SquareSet._of(west_bb(self._value))
+
+    def north_east(self) -> Self:
+        return SquareSet._of(north_east_bb(self._value))
+
+    def north_west(self) -> Self:
+        return SquareSet._of(north_west_bb(self._value))
+
+    def south_east(self) -> Self:
+        return SquareSet._of(south_east_bb(self._value))
+
+    def south_west(self) -> Self:
+        return SquareSet._of(south_west_bb(self._value))
+
+    def north_fill(self) -> Self:
+        return SquareSet._of(north_fill_bb(self._value))
+
+    def south_fill(self) -> Self:
+        return SquareSet._of(south_fill_bb(self._value))
+
+    def file_fill(self) -> Self:
+        return SquareSet._of(file_fill_bb(self._value))
+
+    def flip_vertical(self) -> Self:
+        return SquareSet._of(flip_vertical_bb(self._value))
+
+    def mirror_horizontal(self) -> Self:
+        return SquareSet._of(mirror_horizontal_bb(self._value))
+
+    def rotate_180(self) -> Self:
+        return SquareSet._of(rotate_180_bb(self._value))
+
     def _comma_sep_alg(self):
-        return ",".join([sq.name for sq in self.squares()])
+        return ",".join([SQUARE_NAMES[i] for i in self.indices()])
 
     def _init_from_iter(self, initial: Iterable) -> None:
         acc = 0
@@ -250,29 +420,35 @@ class SquareSet:
         self._value = acc
 
     def _init_from_str(self, initial: str):
-        trimmed = [sq.strip() for sq in initial.split(",")]
-        self._init_from_iter(trimmed)
+        self._value = parse_square_list(initial)
 
     def __add__(self, other: any) -> Self:
-        return self.union(SS(other))
+        res = _new(SquareSet)
+        res._value = self._value | (other._value if type(other) is SquareSet else _bits(other))
+        return res
 
     def __and__(self, other: any) -> Self:
-        return self.intersect(SS(other))
+        res = _new(SquareSet)
+        res._value = self._value & (other._value if type(other) is SquareSet else _bits(other))
+        return res
 
     def __bool__(self):
-        return bool(self.value)
+        return bool(self._value)
 
     def __bytes__(self):
         return bytes(self.value)
 
     def __contains__(self, item):
-        return self.is_superset_of(SS(item))
+        item = _bits(item)
+        return item == (item & self._value)
 
     def __copy__(self):
-        return SquareSet(self.value)
+        return SquareSet._of(self._value)
 
     def __eq__(self, other: any):
-        return self.value == SS(other).value
+        if type(other) is SquareSet:
+            return self._value == other._value
+        return self._value == _bits(other)
 
     def __format__(self, format_spec):
         if format_spec == "alg":
@@ -282,62 +458,163 @@ class SquareSet:
         return self.value.__format__(format_spec)
 
     def __ge__(self, other):
-        return self.is_superset_of(SS(other))
+        return self.is_superset_of(other)
 
     def __getitem__(self, item: any):
-        sq = SQ(item)
-        return bool(self.value & sq.mask)
+        return bool(self._value & SQ(item).mask)
 
     def __gt__(self, other):
-        return self.is_proper_superset_of(SS(other))
+        return self.is_proper_superset_of(other)
 
     def __hash__(self) -> int:
-        return self.value
+        return self._value
 
     def __hex__(self):
         return hex(self.value)
 
     def __int__(self):
-        return self.value
+        return self._value
 
     def __invert__(self):
-        return SquareSet(~self.value)
+        return SquareSet._of(~self._value & MASK64)
 
     def __iter__(self):
-        for i in range(64):
-            if self.value & (1 << i):
-                yield Square(i)
+        value = self._value
+        while value:
+            low = value & -value
+            yield _SQUARES[low.bit_length() - 1]
+            value ^= low
 
     def __le__(self, other: any):
-        return self.is_subset_of(SS(other))
+        return self.is_subset_of(other)
 
     def __len__(self):
-        return self.count
+        return self._value.bit_count()
 
     def __lt__(self, other: any):
-        return self.is_proper_subset_of(SS(other))
+        return self.is_proper_subset_of(other)
 
     def __neg__(self):
-        return SquareSet(~self.value)
+        return SquareSet._of(~self._value & MASK64)
 
     def __ne__(self, other: any):
-        return self.value != SS(other).value
+        if type(other) is SquareSet:
+            return self._value != other._value
+        return self._value != _bits(other)
 
     def __or__(self, other):
-        return SquareSet(self.value | other.value)
+        res = _new(SquareSet)
+        res._value = self._value | (other._value if type(other) is SquareSet else _bits(other))
+        return res
+
+    def __rand__(self, other):
+        res = _new(SquareSet)
+        res._value = (other._value if type(other) is SquareSet else _bits(other)) & self._value
+        return res
 
     def __repr__(self) -> str:
         return self.__str__()
 
+    def __ror__(self, other):
+        res = _new(SquareSet)
+        res._value = (other._value if type(other) is SquareSet else _bits(other)) | self._value
+        return res
+
+    def __rxor__(self, other):
+        res = _new(SquareSet)
+        res._value = (other._value if type(other) is SquareSet else _bits(other)) ^ self._value
+        return res
+
     def __str__(self) -> str:
         return f"SS({self._comma_sep_alg()})"
 
     def __sub__(self, other):
-        return SS(self.value & ~SS(other).value)
+        res = _new(SquareSet)
+        res._value = self._value & ~(other._value if type(other) is SquareSet else _bits(other))
+        return res
+
+    def __xor__(self, other):
+        res = _new(SquareSet)
+        res._value = self._value ^ (other._value if type(other) is SquareSet else _bits(other))
+        return res
+
+
+class MutableSquareSet(SquareSet):
+    __slots__ = ()
+    __hash__ = None
+
+    def freeze(self) -> SquareSet:
+        return SquareSet._of(self._value)
+
+    def set(self, square: SquareConstructorType) -> Self:
+        self._value |= 1 << SQ(square)._idx
+        return self
+
+    def clear(self, square: SquareConstructorType) -> Self:
+        self._value &= ~(1 << SQ(square)._idx)
+        return self
+
+    def toggle(self, square: SquareConstructorType) -> Self:
+        self._value ^= 1 << SQ(square)._idx
+        return self
+
+    def __copy__(self):
+        return MutableSquareSet(self._value)
+
+    def __iand__(self, other: any) -> Self:
+        self._value &= _bits(other)
+        return self
+
+    def __ior__(self, other: any) -> Self:
+        self._value |= _bits(other)
+        return self
+
+    def __isub__(self, other: any) -> Self:
+        self._value &= ~_bits(other)
+        return self
+
+    def __ixor__(self, other: any) -> Self:
+        self._value ^= _bits(other)
+        return self
+
+    def __repr__(self) -> str:
+        return f"MSS({self._comma_sep_alg()})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+MSS = MutableSquareSet
+
+
+def parse_square_list(names: str) -> int:
+    acc = 0
+    index_by_name = _INDEX_BY_NAME
+    for i, name in enumerate(names.split(",")):
+        idx = index_by_name.get(name)
+        if idx is None:
+            idx = index_by_name.get(name.strip())
+            if idx is None:
+                raise ValueError(f"item {i}: \"{name.strip()}\" can not be part of a SquareSet")
+        acc |= 1 << idx
+    return acc
+
+
+def _bits(other: any) -> int:
+    tipe = type(other)
+    if tipe is SquareSet or tipe is MutableSquareSet:
+        return other._value
+    if tipe is int and other >= 0:
+        return other
+    if tipe is Square:
+        return 1 << other._idx
+    return SquareSet(other)._value
 
 
 SS = SquareSet
 
+SquareSetConstructorType = Union[int, Iterable, str, Square, SquareSet]
+
 
 def ranks(*args) -> Tuple[Square]:
     res = []
@@ -356,295 +633,338 @@ def files(s: str) -> Tuple[Square]:
     return tuple(res)
 
 
+def __getattr__(name: str):
+    if name == "ALGEBRAIC_REGEX":
+        # compiled on first use so that importing core.square does not pay for importing re
+        import re
+        globals()[name] = re.compile("^[a-h][1-8]$", re.I)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _lazy(int):
+    # the literal bitboard stands in for the constant until the first lookup builds it and replaces this entry
+    __slots__ = ()
+
+    def __get__(self, instance, owner):
+        res = self._build(int(self))
+        for attr, value in vars(owner).items():
+            if value is self:
+                setattr(owner, attr, res)
+                break
+        return res
+
+
+class _sq(_lazy):
+    __slots__ = ()
+
+    def _build(self, idx: int) -> Square:
+        return _SQUARES[idx]
+
+
+class _sqs(_lazy):
+    __slots__ = ()
+
+    def _build(self, value: int) -> Tuple[Square, ...]:
+        return tuple(_SQUARES[i] for i in SquareSet._of(value).indices())
+
+
+class _ss(_lazy):
+    __slots__ = ()
+
+    def _build(self, value: int) -> SquareSet:
+        return SquareSet._of(value)
+
+
 class sq:
     class starting:
-        all = ranks(1, 2, 7, 8)
-        white = ranks(1, 2)
-        black = ranks(7, 8)
-        pawns = ranks(2, 7)
-        knights = tuple((SQ(s) for s in ["b1", "g1", "b8", "g8"]))
-        bishops = tuple((SQ(s) for s in ["c1", "f1", "c8", "f8"]))
-        rooks = tuple((SQ(s) for s in ["a1", "h1", "a8", "h8"]))
-        queens = tuple((SQ(s) for s in ["d1", "d8"]))
-        kings = tuple((SQ(s) for s in ["e1", "e8"]))
+        all = _sqs(0xffff_0000_0000_ffff)
+        white = _sqs(0x0000_0000_0000_ffff)
+        black = _sqs(0xffff_0000_0000_0000)
+        pawns = _sqs(0x00ff_0000_0000_ff00)
+        knights = _sqs(0x4200_0000_0000_0042)
+        bishops = _sqs(0x2400_0000_0000_0024)
+        rooks = _sqs(0x8100_0000_0000_0081)
+        queens = _sqs(0x0800_0000_0000_0008)
+        kings = _sqs(0x1000_0000_0000_0010)
 
     class ranks:
-        r1 = ranks(1)
-        r2 = ranks(2)
-        r3 = ranks(3)
-        r4 = ranks(4)
-        r5 = ranks(5)
-        r6 = ranks(6)
-        r7 = ranks(7)
-        r8 = ranks(8)
+        r1 = _sqs(0x0000_0000_0000_00ff)
+        r2 = _sqs(0x0000_0000_0000_ff00)
+        r3 = _sqs(0x0000_0000_00ff_0000)
+        r4 = _sqs(0x0000_0000_ff00_0000)
+        r5 = _sqs(0x0000_00ff_0000_0000)
+        r6 = _sqs(0x0000_ff00_0000_0000)
+        r7 = _sqs(0x00ff_0000_0000_0000)
+        r8 = _sqs(0xff00_0000_0000_0000)
 
     class files:
-        a = files("a")
-        b = files("b")
-        c = files("c")
-        d = files("d")
-        e = files("e")
-        f = files("f")
-        g = files("g")
-        h = files("h")
+        a = _sqs(0x0101_0101_0101_0101)
+        b = _sqs(0x0202_0202_0202_0202)
+        c = _sqs(0x0404_0404_0404_0404)
+        d = _sqs(0x0808_0808_0808_0808)
+        e = _sqs(0x1010_1010_1010_1010)
+        f = _sqs(0x2020_2020_2020_2020)
+        g = _sqs(0x4040_4040_4040_4040)
+        h = _sqs(0x8080_8080_8080_8080)
 
     class white:
-        squares = tuple(SQ(i) for i in range(1, 64, 2))
+        squares = _sqs(0xaaaa_aaaa_aaaa_aaaa)
 
         class castling:
-            short_blockable = tuple(SQ(i) for i in ["f1", "g1"])
-            short_checkable = tuple(SQ(i) for i in ["e1", "f1", "g1"])
-            short_king = SQ("g1")
-            short_rook = SQ("f1")
-            long_blockable = tuple(SQ(i) for i in ["b1", "c1", "d1"])
-            long_checkable = tuple(SQ(i) for i in ["c1", "d1", "e1"])
-            long_king = SQ("c1")
-            long_rook = SQ("d1")
+            short_blockable = _sqs(0x0000_0000_0000_0060)
+            short_checkable = _sqs(0x0000_0000_0000_0070)
+            short_king = _sq(6)
+            short_rook = _sq(5)
+            long_blockable = _sqs(0x0000_0000_0000_000e)
+            long_checkable = _sqs(0x0000_0000_0000_001c)
+            long_king = _sq(2)
+            long_rook = _sq(3)
 
         class starting:
-            all = ranks(1, 2)
-            pawns = ranks(2)
-            knights = tuple((SQ(s) for s in ["b1", "g1"]))
-            bishops = tuple((SQ(s) for s in ["c1", "f1"]))
-            rooks = tuple((SQ(s) for s in ["a1", "h1"]))
-            queens = tuple((SQ(s) for s in ["d1"]))
-            king = SQ("e1")
-            promotion = ranks(8)
+            all = _sqs(0x0000_0000_0000_ffff)
+            pawns = _sqs(0x0000_0000_0000_ff00)
+            knights = _sqs(0x0000_0000_0000_0042)
+            bishops = _sqs(0x0000_0000_0000_0024)
+            rooks = _sqs(0x0000_0000_0000_0081)
+            queens = _sqs(0x0000_0000_0000_0008)
+            king = _sq(4)
+            promotion = _sqs(0xff00_0000_0000_0000)
 
     class black:
-        squares = tuple(SQ(i) for i in range(0, 64, 2))
+        squares = _sqs(0x5555_5555_5555_5555)
 
         class castling:
-            short_blockable = tuple(SQ(i) for i in ["f8", "g8"])
-            short_checkable = tuple(SQ(i) for i in ["e8", "f8", "g8"])
-            short_king = SQ("g8")
-            short_rook = SQ("f8")
-            long_blockable = tuple(SQ(i) for i in ["b8", "c8", "d8"])
-            long_checkable = tuple(SQ(i) for i in ["c8", "d8", "e8"])
-            long_king = SQ("c8")
-            long_rook = SQ("d8")
+            short_blockable = _sqs(0x6000_0000_0000_0000)
+            short_checkable = _sqs(0x7000_0000_0000_0000)
+            short_king = _sq(62)
+            short_rook = _sq(61)
+            long_blockable = _sqs(0x0e00_0000_0000_0000)
+            long_checkable = _sqs(0x1c00_0000_0000_0000)
+            long_king = _sq(58)
+            long_rook = _sq(59)
 
         class starting:
-            all = ranks(7, 8)
-            pawns = ranks(7)
-            knights = tuple((SQ(s) for s in ["b8", "g8"]))
-            bishops = tuple((SQ(s) for s in ["c8", "f8"]))
-            rooks = tuple((SQ(s) for s in ["a8", "h8"]))
-            queens = tuple((SQ(s) for s in ["d8"]))
-            king = SQ("e8")
-            promotion = ranks(1)
-
-    all = tuple(SQ(i) for i in range(64))
-    none = tuple()
-    empty = tuple()
-    a1 = SQ("a1")
-    b1 = SQ("b1")
-    c1 = SQ("c1")
-    d1 = SQ("d1")
-    e1 = SQ("e1")
-    f1 = SQ("f1")
-    g1 = SQ("g1")
-    h1 = SQ("h1")
-    a2 = SQ("a2")
-    b2 = SQ("b2")
-    c2 = SQ("c2")
-    d2 = SQ("d2")
-    e2 = SQ("e2")
-    f2 = SQ("f2")
-    g2 = SQ("g2")
-    h2 = SQ("h2")
-    a3 = SQ("a3")
-    b3 = SQ("b3")
-    c3 = SQ("c3")
-    d3 = SQ("d3")
-    e3 = SQ("e3")
-    f3 = SQ("f3")
-    g3 = SQ("g3")
-    h3 = SQ("h3")
-    a4 = SQ("a4")
-    b4 = SQ("b4")
-    c4 = SQ("c4")
-    d4 = SQ("d4")
-    e4 = SQ("e4")
-    f4 = SQ("f4")
-    g4 = SQ("g4")
-    h4 = SQ("h4")
-    a5 = SQ("a5")
-    b5 = SQ("b5")
-    c5 = SQ("c5")
-    d5 = SQ("d5")
-    e5 = SQ("e5")
-    f5 = SQ("f5")
-    g5 = SQ("g5")
-    h5 = SQ("h5")
-    a6 = SQ("a6")
-    b6 = SQ("b6")
-    c6 = SQ("c6")
-    d6 = SQ("d6")
-    e6 = SQ("e6")
-    f6 = SQ("f6")
-    g6 = SQ("g6")
-    h6 = SQ("h6")
-    a7 = SQ("a7")
-    b7 = SQ("b7")
-    c7 = SQ("c7")
-    d7 = SQ("d7")
-    e7 = SQ("e7")
-    f7 = SQ("f7")
-    g7 = SQ("g7")
-    h7 = SQ("h7")
-    a8 = SQ("a8")
-    b8 = SQ("b8")
-    c8 = SQ("c8")
-    d8 = SQ("d8")
-    e8 = SQ("e8")
-    f8 = SQ("f8")
-    g8 = SQ("g8")
-    h8 = SQ("h8")
+            all = _sqs(0xffff_0000_0000_0000)
+            pawns = _sqs(0x00ff_0000_0000_0000)
+            knights = _sqs(0x4200_0000_0000_0000)
+            bishops = _sqs(0x2400_0000_0000_0000)
+            rooks = _sqs(0x8100_0000_0000_0000)
+            queens = _sqs(0x0800_0000_0000_0000)
+            king = _sq(60)
+            promotion = _sqs(0x0000_0000_0000_00ff)
+
+    all = _sqs(MASK64)
+    none = ()
+    empty = ()
+    a1 = _sq(0)
+    b1 = _sq(1)
+    c1 = _sq(2)
+    d1 = _sq(3)
+    e1 = _sq(4)
+    f1 = _sq(5)
+    g1 = _sq(6)
+    h1 = _sq(7)
+    a2 = _sq(8)
+    b2 = _sq(9)
+    c2 = _sq(10)
+    d2 = _sq(11)
+    e2 = _sq(12)
+    f2 = _sq(13)
+    g2 = _sq(14)
+    h2 = _sq(15)
+    a3 = _sq(16)
+    b3 = _sq(17)
+    c3 = _sq(18)
+    d3 = _sq(19)
+    e3 = _sq(20)
+    f3 = _sq(21)
+    g3 = _sq(22)
+    h3 = _sq(23)
+    a4 = _sq(24)
+    b4 = _sq(25)
+    c4 = _sq(26)
+    d4 = _sq(27)
+    e4 = _sq(28)
+    f4 = _sq(29)
+    g4 = _sq(30)
+    h4 = _sq(31)
+    a5 = _sq(32)
+    b5 = _sq(33)
+    c5 = _sq(34)
+    d5 = _sq(35)
+    e5 = _sq(36)
+    f5 = _sq(37)
+    g5 = _sq(38)
+    h5 = _sq(39)
+    a6 = _sq(40)
+    b6 = _sq(41)
+    c6 = _sq(42)
+    d6 = _sq(43)
+    e6 = _sq(44)
+    f6 = _sq(45)
+    g6 = _sq(46)
+    h6 = _sq(47)
+    a7 = _sq(48)
+    b7 = _sq(49)
+    c7 = _sq(50)
+    d7 = _sq(51)
+    e7 = _sq(52)
+    f7 = _sq(53)
+    g7 = _sq(54)
+    h7 = _sq(55)
+    a8 = _sq(56)
+    b8 = _sq(57)
+    c8 = _sq(58)
+    d8 = _sq(59)
+    e8 = _sq(60)
+    f8 = _sq(61)
+    g8 = _sq(62)
+    h8 = _sq(63)
 
 
 class ss:
     class starting:
-        all = SS(sq.starting.all)
-        white = SS(sq.starting.white)
-        black = SS(sq.starting.black)
-        pawns = SS(sq.starting.pawns)
-        knights = SS(sq.starting.knights)
-        bishops = SS(sq.starting.bishops)
-        rooks = SS(sq.starting.rooks)
-        queens = SS(sq.starting.queens)
-        kings = SS(sq.starting.kings)
+        all = _ss(0xffff_0000_0000_ffff)
+        white = _ss(0x0000_0000_0000_ffff)
+        black = _ss(0xffff_0000_0000_0000)
+        pawns = _ss(0x00ff_0000_0000_ff00)
+        knights = _ss(0x4200_0000_0000_0042)
+        bishops = _ss(0x2400_0000_0000_0024)
+        rooks = _ss(0x8100_0000_0000_0081)
+        queens = _ss(0x0800_0000_0000_0008)
+        kings = _ss(0x1000_0000_0000_0010)
 
     class ranks:
-        r1 = SS(sq.ranks.r1)
-        r2 = SS(sq.ranks.r2)
-        r3 = SS(sq.ranks.r3)
-        r4 = SS(sq.ranks.r4)
-        r5 = SS(sq.ranks.r5)
-        r6 = SS(sq.ranks.r6)
-        r7 = SS(sq.ranks.r7)
-        r8 = SS(sq.ranks.r8)
+        r1 = _ss(0x0000_0000_0000_00ff)
+        r2 = _ss(0x0000_0000_0000_ff00)
+        r3 = _ss(0x0000_0000_00ff_0000)
+        r4 = _ss(0x0000_0000_ff00_0000)
+        r5 = _ss(0x0000_00ff_0000_0000)
+        r6 = _ss(0x0000_ff00_0000_0000)
+        r7 = _ss(0x00ff_0000_0000_0000)
+        r8 = _ss(0xff00_0000_0000_0000)
 
     class files:
-        a = SS(sq.files.a)
-        b = SS(sq.files.b)
-        c = SS(sq.files.c)
-        d = SS(sq.files.d)
-        e = SS(sq.files.e)
-        f = SS(sq.files.f)
-        g = SS(sq.files.g)
-        h = SS(sq.files.h)
+        a = _ss(0x0101_0101_0101_0101)
+        b = _ss(0x0202_0202_0202_0202)
+        c = _ss(0x0404_0404_0404_0404)
+        d = _ss(0x0808_0808_0808_0808)
+        e = _ss(0x1010_1010_1010_1010)
+        f = _ss(0x2020_2020_2020_2020)
+        g = _ss(0x4040_4040_4040_4040)
+        h = _ss(0x8080_8080_8080_8080)
 
     class white:
-        squares = SS(sq.white.squares)
+        squares = _ss(0xaaaa_aaaa_aaaa_aaaa)
 
         class castling:
-            short_blockable = SS(sq.white.castling.short_blockable)
-            short_checkable = SS(sq.white.castling.short_checkable)
-            short_king = SS(sq.white.castling.short_king)
-            short_rook = SS(sq.white.castling.short_rook)
-            long_blockable = SS(sq.white.castling.long_blockable)
-            long_checkable = SS(sq.white.castling.long_checkable)
-            long_king = SS(sq.white.castling.long_king)
-            long_rook = SS(sq.white.castling.long_rook)
+            short_blockable = _ss(0x0000_0000_0000_0060)
+            short_checkable = _ss(0x0000_0000_0000_0070)
+            short_king = _ss(0x0000_0000_0000_0040)
+            short_rook = _ss(0x0000_0000_0000_0020)
+            long_blockable = _ss(0x0000_0000_0000_000e)
+            long_checkable = _ss(0x0000_0000_0000_001c)
+            long_king = _ss(0x0000_0000_0000_0004)
+            long_rook = _ss(0x0000_0000_0000_0008)
 
         class starting:
-            all = SS(sq.white.starting.all)
-            pawns = SS(sq.white.starting.pawns)
-            knights = SS(sq.white.starting.knights)
-            bishops = SS(sq.white.starting.bishops)
-            rooks = SS(sq.white.starting.rooks)
-            queens = SS(sq.white.starting.queens)
-            king = SS(sq.white.starting.king)
-            promotion = SS(sq.white.starting.promotion)
+            all = _ss(0x0000_0000_0000_ffff)
+            pawns = _ss(0x0000_0000_0000_ff00)
+            knights = _ss(0x0000_0000_0000_0042)
+            bishops = _ss(0x0000_0000_0000_0024)
+            rooks = _ss(0x0000_0000_0000_0081)
+            queens = _ss(0x0000_0000_0000_0008)
+            king = _ss(0x0000_0000_0000_0010)
+            promotion = _ss(0xff00_0000_0000_0000)
 
     class black:
-        squares = SS(sq.black.squares)
+        squares = _ss(0x5555_5555_5555_5555)
 
         class castling:
-            short_blockable = SS(sq.black.castling.short_blockable)
-            short_checkable = SS(sq.black.castling.short_checkable)
-            short_king = SS(sq.black.castling.short_king)
-            short_rook = SS(sq.black.castling.short_rook)
-            long_blockable = SS(sq.black.castling.long_blockable)
-            long_checkable = SS(sq.black.castling.long_checkable)
-            long_king = SS(sq.black.castling.long_king)
-            long_rook = SS(sq.black.castling.long_rook)
+            short_blockable = _ss(0x6000_0000_0000_0000)
+            short_checkable = _ss(0x7000_0000_0000_0000)
+            short_king = _ss(0x4000_0000_0000_0000)
+            short_rook = _ss(0x2000_0000_0000_0000)
+            long_blockable = _ss(0x0e00_0000_0000_0000)
+            long_checkable = _ss(0x1c00_0000_0000_0000)
+            long_king = _ss(0x0400_0000_0000_0000)
+            long_rook = _ss(0x0800_0000_0000_0000)
 
         class starting:
-            all = SS(sq.black.starting.all)
-            pawns = SS(sq.black.starting.pawns)
-            knights = SS(sq.black.starting.knights)
-            bishops = SS(sq.black.starting.bishops)
-            rooks = SS(sq.black.starting.rooks)
-            queens = SS(sq.black.starting.queens)
-            king = SS(sq.black.starting.king)
-            promotion = SS(sq.black.starting.promotion)
-
-    all = SS(sq.all)
-    none = SS(sq.none)
-    empty = SS(sq.empty)
-    a1 = SS("a1")
-    b1 = SS("b1")
-    c1 = SS("c1")
-    d1 = SS("d1")
-    e1 = SS("e1")
-    f1 = SS("f1")
-    g1 = SS("g1")
-    h1 = SS("h1")
-    a2 = SS("a2")
-    b2 = SS("b2")
-    c2 = SS("c2")
-    d2 = SS("d2")
-    e2 = SS("e2")
-    f2 = SS("f2")
-    g2 = SS("g2")
-    h2 = SS("h2")
-    a3 = SS("a3")
-    b3 = SS("b3")
-    c3 = SS("c3")
-    d3 = SS("d3")
-    e3 = SS("e3")
-    f3 = SS("f3")
-    g3 = SS("g3")
-    h3 = SS("h3")
-    a4 = SS("a4")
-    b4 = SS("b4")
-    c4 = SS("c4")
-    d4 = SS("d4")
-    e4 = SS("e4")
-    f4 = SS("f4")
-    g4 = SS("g4")
-    h4 = SS("h4")
-    a5 = SS("a5")
-    b5 = SS("b5")
-    c5 = SS("c5")
-    d5 = SS("d5")
-    e5 = SS("e5")
-    f5 = SS("f5")
-    g5 = SS("g5")
-    h5 = SS("h5")
-    a6 = SS("a6")
-    b6 = SS("b6")
-    c6 = SS("c6")
-    d6 = SS("d6")
-    e6 = SS("e6")
-    f6 = SS("f6")
-    g6 = SS("g6")
-    h6 = SS("h6")
-    a7 = SS("a7")
-    b7 = SS("b7")
-    c7 = SS("c7")
-    d7 = SS("d7")
-    e7 = SS("e7")
-    f7 = SS("f7")
-    g7 = SS("g7")
-    h7 = SS("h7")
-    a8 = SS("a8")
-    b8 = SS("b8")
-    c8 = SS("c8")
-    d8 = SS("d8")
-    e8 = SS("e8")
-    f8 = SS("f8")
-    g8 = SS("g8")
-    h8 = SS("h8")
+            all = _ss(0xffff_0000_0000_0000)
+            pawns = _ss(0x00ff_0000_0000_0000)
+            knights = _ss(0x4200_0000_0000_0000)
+            bishops = _ss(0x2400_0000_0000_0000)
+            rooks = _ss(0x8100_0000_0000_0000)
+            queens = _ss(0x0800_0000_0000_0000)
+            king = _ss(0x1000_0000_0000_0000)
+            promotion = _ss(0x0000_0000_0000_00ff)
+
+    all = _ss(MASK64)
+    none = _ss(0x0000_0000_0000_0000)
+    empty = _ss(0x0000_0000_0000_0000)
+    a1 = _ss(0x0000_0000_0000_0001)
+    b1 = _ss(0x0000_0000_0000_0002)
+    c1 = _ss(0x0000_0000_0000_0004)
+    d1 = _ss(0x0000_0000_0000_0008)
+    e1 = _ss(0x0000_0000_0000_0010)
+    f1 = _ss(0x0000_0000_0000_0020)
+    g1 = _ss(0x0000_0000_0000_0040)
+    h1 = _ss(0x0000_0000_0000_0080)
+    a2 = _ss(0x0000_0000_0000_0100)
+    b2 = _ss(0x0000_0000_0000_0200)
+    c2 = _ss(0x0000_0000_0000_0400)
+    d2 = _ss(0x0000_0000_0000_0800)
+    e2 = _ss(0x0000_0000_0000_1000)
+    f2 = _ss(0x0000_0000_0000_2000)
+    g2 = _ss(0x0000_0000_0000_4000)
+    h2 = _ss(0x0000_0000_0000_8000)
+    a3 = _ss(0x0000_0000_0001_0000)
+    b3 = _ss(0x0000_0000_0002_0000)
+    c3 = _ss(0x0000_0000_0004_0000)
+    d3 = _ss(0x0000_0000_0008_0000)
+    e3 = _ss(0x0000_0000_0010_0000)
+    f3 = _ss(0x0000_0000_0020_0000)
+    g3 = _ss(0x0000_0000_0040_0000)
+    h3 = _ss(0x0000_0000_0080_0000)
+    a4 = _ss(0x0000_0000_0100_0000)
+    b4 = _ss(0x0000_0000_0200_0000)
+    c4 = _ss(0x0000_0000_0400_0000)
+    d4 = _ss(0x0000_0000_0800_0000)
+    e4 = _ss(0x0000_0000_1000_0000)
+    f4 = _ss(0x0000_0000_2000_0000)
+    g4 = _ss(0x0000_0000_4000_0000)
+    h4 = _ss(0x0000_0000_8000_0000)
+    a5 = _ss(0x0000_0001_0000_0000)
+    b5 = _ss(0x0000_0002_0000_0000)
+    c5 = _ss(0x0000_0004_0000_0000)
+    d5 = _ss(0x0000_0008_0000_0000)
+    e5 = _ss(0x0000_0010_0000_0000)
+    f5 = _ss(0x0000_0020_0000_0000)
+    g5 = _ss(0x0000_0040_0000_0000)
+    h5 = _ss(0x0000_0080_0000_0000)
+    a6 = _ss(0x0000_0100_0000_0000)
+    b6 = _ss(0x0000_0200_0000_0000)
+    c6 = _ss(0x0000_0400_0000_0000)
+    d6 = _ss(0x0000_0800_0000_0000)
+    e6 = _ss(0x0000_1000_0000_0000)
+    f6 = _ss(0x0000_2000_0000_0000)
+    g6 = _ss(0x0000_4000_0000_0000)
+    h6 = _ss(0x0000_8000_0000_0000)
+    a7 = _ss(0x0001_0000_0000_0000)
+    b7 = _ss(0x0002_0000_0000_0000)
+    c7 = _ss(0x0004_0000_0000_0000)
+    d7 = _ss(0x0008_0000_0000_0000)
+    e7 = _ss(0x0010_0000_0000_0000)
+    f7 = _ss(0x0020_0000_0000_0000)
+    g7 = _ss(0x0040_0000_0000_0000)
+    h7 = _ss(0x0080_0000_0000_0000)
+    a8 = _ss(0x0100_0000_0000_0000)
+    b8 = _ss(0x0200_0000_0000_0000)
+    c8 = _ss(0x0400_0000_0000_0000)
+    d8 = _ss(0x0800_0000_0000_0000)
+    e8 = _ss(0x1000_0000_0000_0000)
+    f8 = _ss(0x2000_0000_0000_0000)
+    g8 = _ss(0x4000_0000_0000_0000)
+    h8 = _ss(0x8000_0000_0000_0000)
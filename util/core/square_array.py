@@ -0,0 +1,108 @@
+from typing import *
+
+import numpy as np
+
+from core.square import SQ, SS, SquareConstructorType, SquareSet
+
+SquareSetArrayOperand = Union["SquareSetArray", SquareSet, int]
+
+_M1 = np.uint64(0x5555_5555_5555_5555)
+_M2 = np.uint64(0x3333_3333_3333_3333)
+_M4 = np.uint64(0x0f0f_0f0f_0f0f_0f0f)
+_H01 = np.uint64(0x0101_0101_0101_0101)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    values = values - ((values >> np.uint64(1)) & _M1)
+    values = (values & _M2) + ((values >> np.uint64(2)) & _M2)
+    values = (values + (values >> np.uint64(4))) & _M4
+    return ((values * _H01) >> np.uint64(56)).astype(np.int64)
+
+
+def _operand(other: SquareSetArrayOperand) -> np.ndarray | np.uint64:
+    if type(other) is SquareSetArray:
+        return other.values
+    return np.uint64(int(SS(other)))
+
+
+class SquareSetArray:
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Union[np.ndarray, Iterable[SquareSet | int]] = ()):
+        if isinstance(values, np.ndarray):
+            self._values = values.astype(np.uint64, copy=False)
+        else:
+            self._values = np.fromiter((int(v) for v in values), dtype=np.uint64)
+
+    @classmethod
+    def zeros(cls, size: int) -> "SquareSetArray":
+        return SquareSetArray(np.zeros(size, dtype=np.uint64))
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def squaresets(self) -> List[SquareSet]:
+        return [SS(v) for v in self._values.tolist()]
+
+    def union(self, other: SquareSetArrayOperand) -> "SquareSetArray":
+        return SquareSetArray(self._values | _operand(other))
+
+    def intersect(self, other: SquareSetArrayOperand) -> "SquareSetArray":
+        return SquareSetArray(self._values & _operand(other))
+
+    def difference(self, other: SquareSetArrayOperand) -> "SquareSetArray":
+        return SquareSetArray(self._values & ~_operand(other))
+
+    def count(self) -> np.ndarray:
+        return _popcount(self._values)
+
+    def contains(self, square: SquareConstructorType) -> np.ndarray:
+        return ((self._values >> np.uint64(SQ(square).idx)) & np.uint64(1)).astype(bool)
+
+    def has_all(self, other: SquareSetArrayOperand) -> np.ndarray:
+        other = _operand(other)
+        return (self._values & other) == other
+
+    def has_any(self, other: SquareSetArrayOperand) -> np.ndarray:
+        return (self._values & _operand(other)) != 0
+
+    def __and__(self, other: SquareSetArrayOperand) -> "SquareSetArray":
+        return self.intersect(other)
+
+    def __eq__(self, other: SquareSetArrayOperand) -> np.ndarray:
+        return self._values == _operand(other)
+
+    def __getitem__(self, item) -> Union[SquareSet, "SquareSetArray"]:
+        if isinstance(item, (int, np.integer)):
+            return SS(int(self._values[item]))
+        return SquareSetArray(self._values[item])
+
+    def __invert__(self) -> "SquareSetArray":
+        return SquareSetArray(~self._values)
+
+    def __iter__(self) -> Iterator[SquareSet]:
+        return iter(self.squaresets())
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __ne__(self, other: SquareSetArrayOperand) -> np.ndarray:
+        return self._values != _operand(other)
+
+    def __or__(self, other: SquareSetArrayOperand) -> "SquareSetArray":
+        return self.union(other)
+
+    def __repr__(self) -> str:
+        return f"SSA({len(self)})"
+
+    def __sub__(self, other: SquareSetArrayOperand) -> "SquareSetArray":
+        return self.difference(other)
+
+    def __xor__(self, other: SquareSetArrayOperand) -> "SquareSetArray":
+        return SquareSetArray(self._values ^ _operand(other))
+
+
+SSA = SquareSetArray
@@ -0,0 +1,199 @@
+import random
+from dataclasses import dataclass
+from typing import *
+
+import chess as c
+import pytest
+
+from core.attacks import *
+from core.attacks.fill import sliders_attacks_fill
+from core.bench import import_profile
+from core.piece import BLACK_IDX, WHITE_IDX
+from core.square import *
+
+
+def _chess_attacks(piece_type: int, location: int, occupied: int) -> int:
+    board = c.BaseBoard.empty()
+    for i in c.SquareSet(occupied):
+        board.set_piece_at(i, c.Piece(c.PAWN, c.BLACK))
+    board.set_piece_at(location, c.Piece(piece_type, c.WHITE))
+    return int(board.attacks_mask(location))
+
+
+def slider_attacks_should_match_python_chess():
+    @dataclass
+    class Case:
+        name: str
+        attacks: Callable[[SQ, SS], SS]
+        piece_type: int
+
+        def __iter__(self):
+            return iter([self.name, self.attacks, self.piece_type])
+
+    cases = [
+        Case("bishop", bishop_attacks, c.BISHOP),
+        Case("rook", rook_attacks, c.ROOK),
+        Case("queen", queen_attacks, c.QUEEN),
+    ]
+
+    rng = random.Random(0)
+    for name, attacks, piece_type in cases:
+        for i in range(64):
+            for _ in range(8):
+                occupied = rng.getrandbits(64) & rng.getrandbits(64) & ~(1 << i)
+                want = _chess_attacks(piece_type, i, occupied)
+                got = attacks(SQ(i), SS(occupied))
+                assert got.value == want, f"{name} on {SQ(i)} with {SS(occupied)}"
+
+
+def leaper_attacks_should_match_python_chess():
+    for i in range(64):
+        assert knight_attacks(SQ(i)).value == int(c.BB_KNIGHT_ATTACKS[i]), f"knight on {SQ(i)}"
+        assert king_attacks(SQ(i)).value == int(c.BB_KING_ATTACKS[i]), f"king on {SQ(i)}"
+
+
+def int_attacks_should_match_python_chess():
+    rng = random.Random(1)
+    for i in range(64):
+        occupied = rng.getrandbits(64) & ~(1 << i)
+        assert bishop_attacks_bb(i, occupied) == _chess_attacks(c.BISHOP, i, occupied)
+        assert rook_attacks_bb(i, occupied) == _chess_attacks(c.ROOK, i, occupied)
+        assert queen_attacks_bb(i, occupied) == _chess_attacks(c.QUEEN, i, occupied)
+        assert knight_attacks_bb(i) == int(c.BB_KNIGHT_ATTACKS[i])
+        assert king_attacks_bb(i) == int(c.BB_KING_ATTACKS[i])
+
+
+HEAVY_MODULES = ["numpy", "core.attacks.batch", "core.magics.generate", "core.magics.numbers", "core.magics.search"]
+
+
+def attacks_should_not_load_slider_tables_on_import():
+    out, _ = import_profile("import core.attacks, core.magics; print(core.magics.is_loaded(), "
+                             "core.attacks._sliders.is_loaded())")
+    assert out.split() == ["False", "False"]
+    out, _ = import_profile("import core.attacks, core.magics; core.attacks.rook_attacks_bb(0, 0); "
+                             "print(core.magics.is_loaded(), core.attacks._sliders.is_loaded())")
+    assert out.split() == ["True", "True"]
+
+
+def attacks_should_keep_startup_imports_light():
+    # timings are left to util bench import; here only what gets imported is pinned down
+    _, timings = import_profile("import core.attacks")
+    for module in HEAVY_MODULES:
+        assert module not in timings, f"core.attacks imported {module}"
+
+
+def between_and_line_should_match_python_chess():
+    for a in range(64):
+        for b in range(64):
+            assert between_bb(a, b) == int(c.between(a, b)), f"between {SQ(a)} {SQ(b)}"
+            want_line = int(c.ray(a, b)) if a != b else 0
+            assert line_bb(a, b) == want_line, f"line {SQ(a)} {SQ(b)}"
+    assert aligned(SQ("a1"), SQ("c3"), SQ("h8"))
+    assert not aligned(SQ("a1"), SQ("c3"), SQ("h7"))
+
+
+def pinned_should_match_python_chess():
+    @dataclass
+    class Case:
+        name: str
+        fen: str
+
+        def __iter__(self):
+            return iter([self.name, self.fen])
+
+    cases = [
+        Case("no pins", c.STARTING_FEN),
+        Case("bishop pins knight", "r1bqkbnr/ppp2ppp/2np4/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 1 4"),
+        Case("rook pins and a double blocker", "4k3/4r3/8/8/4N3/8/4R3/r2PKR2 w - - 0 1"),
+        Case("queen pins on both lines", "k7/8/8/8/4q3/8/2P5/1K1N3q w - - 0 1"),
+    ]
+
+    for name, fen in cases:
+        board = c.Board(fen)
+        color = board.turn
+        king = board.king(color)
+        own = int(board.occupied_co[color])
+        enemy = int(board.occupied_co[not color])
+        orthogonal = int(board.rooks | board.queens) & enemy
+        diagonal = int(board.bishops | board.queens) & enemy
+        want = 0
+        for i in c.SquareSet(own):
+            if board.is_pinned(color, i):
+                want |= 1 << i
+        assert pinned_bb(king, int(board.occupied), own, orthogonal, diagonal) == want, name
+
+
+def pawn_attacks_should_match_python_chess():
+    for i in range(64):
+        assert pawn_attacks_bb(i, WHITE_IDX) == int(c.BB_PAWN_ATTACKS[c.WHITE][i]), f"white pawn on {SQ(i)}"
+        assert pawn_attacks_bb(i, BLACK_IDX) == int(c.BB_PAWN_ATTACKS[c.BLACK][i]), f"black pawn on {SQ(i)}"
+
+
+def setwise_pawn_moves_should_match_python_chess():
+    fens = [
+        c.STARTING_FEN,
+        "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",
+        "rnbqkbnr/pppp1ppp/8/8/3Pp3/5N2/PPP1PPPP/RNBQKB1R b KQkq d3 0 2",
+        "r3k2r/1P4P1/8/2pP4/1p6/N1n2n1N/P1P2P1P/R3K2R w KQkq c6 0 1",
+        "4k3/pp3ppp/P1P5/7P/8/3p4/2P1P3/4K3 b - - 0 1",
+    ]
+
+    for fen in fens:
+        board = c.Board(fen)
+        color = WHITE_IDX if board.turn == c.WHITE else BLACK_IDX
+        pawns = int(board.pawns & board.occupied_co[board.turn])
+        empty = ~int(board.occupied) & 0xffff_ffff_ffff_ffff
+        enemies = int(board.occupied_co[not board.turn])
+        moves = [m for m in board.generate_pseudo_legal_moves(int(pawns)) if not m.promotion or m.promotion == c.QUEEN]
+
+        def targets(predicate) -> int:
+            return sum({1 << m.to_square for m in moves if predicate(m)})
+
+        forward = 8 if board.turn == c.WHITE else -8
+        assert pawn_pushes_bb(pawns, empty, color) == targets(lambda m: m.to_square - m.from_square == forward), fen
+        assert pawn_double_pushes_bb(pawns, empty, color) == targets(
+            lambda m: m.to_square - m.from_square == 2 * forward), fen
+        assert pawn_captures_left_bb(pawns, enemies, color) == targets(
+            lambda m: board.is_capture(m) and not board.is_en_passant(m) and
+                      c.square_file(m.to_square) < c.square_file(m.from_square)), fen
+        assert pawn_captures_right_bb(pawns, enemies, color) == targets(
+            lambda m: board.is_capture(m) and not board.is_en_passant(m) and
+                      c.square_file(m.to_square) > c.square_file(m.from_square)), fen
+        if board.ep_square is not None:
+            want = sum({1 << m.from_square for m in moves if board.is_en_passant(m)})
+            assert ep_candidates_bb(pawns, board.ep_square, color) == want, fen
+        attacked = 0
+        for i in c.SquareSet(pawns):
+            attacked |= int(c.BB_PAWN_ATTACKS[board.turn][i])
+        assert pawn_attacked_bb(pawns, color) == attacked, fen
+
+
+def fill_attacks_should_match_magic_attacks():
+    rng = random.Random(3)
+    for _ in range(500):
+        occupied = rng.getrandbits(64) & rng.getrandbits(64)
+        diagonal = occupied & rng.getrandbits(64) & rng.getrandbits(64)
+        orthogonal = occupied & rng.getrandbits(64) & rng.getrandbits(64)
+        want = sliders_attacks_magic(diagonal, orthogonal, occupied)
+        assert sliders_attacks_fill(diagonal, orthogonal, occupied) == want, f"{SS(diagonal)} {SS(orthogonal)}"
+
+
+def attacked_by_should_match_python_chess_with_either_engine():
+    board = c.Board("2rq1rk1/pb2bppp/1pn1pn2/3p4/2PP4/P1NBPN2/1P3PPP/R2Q1RK1 w - - 1 12")
+    try:
+        for engine in [MAGIC_ENGINE, FILL_ENGINE]:
+            set_slider_engine(engine)
+            for color, idx in [(c.WHITE, WHITE_IDX), (c.BLACK, BLACK_IDX)]:
+                side = board.occupied_co[color]
+                want = 0
+                for i in c.SquareSet(side):
+                    want |= int(board.attacks_mask(i))
+                got = attacked_by_bb(idx, int(board.pawns & side), int(board.knights & side),
+                                     int((board.bishops | board.queens) & side),
+                                     int((board.rooks | board.queens) & side), int(board.kings & side),
+                                     int(board.occupied))
+                assert got == want, f"{engine} {c.COLOR_NAMES[color]}"
+        with pytest.raises(ValueError, match="slider engine must be"):
+            set_slider_engine("bogus")
+    finally:
+        set_slider_engine(MAGIC_ENGINE)
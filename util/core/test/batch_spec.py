@@ -0,0 +1,51 @@
+import random
+import warnings
+
+import chess as c
+import numpy as np
+
+from core.attacks import bishop_attacks_bb, pawn_attacks_bb, queen_attacks_bb, rook_attacks_bb
+from core.attacks import batch
+from core.piece import BLACK_IDX, WHITE_IDX
+
+
+def batch_slider_attacks_should_match_scalar_lookups():
+    rng = random.Random(2)
+    squares = np.array([rng.randrange(64) for _ in range(4096)], dtype=np.intp)
+    occupied = np.array([rng.getrandbits(64) for _ in range(4096)], dtype=np.uint64)
+
+    for name, vectorized, scalar in [
+        ("bishop", batch.bishop_attacks, bishop_attacks_bb),
+        ("rook", batch.rook_attacks, rook_attacks_bb),
+        ("queen", batch.queen_attacks, queen_attacks_bb),
+    ]:
+        got = vectorized(squares, occupied)
+        assert got.dtype == np.uint64, name
+        want = [scalar(int(s), int(o)) for s, o in zip(squares, occupied)]
+        assert got.tolist() == want, name
+
+
+def batch_slider_attacks_should_broadcast_a_single_square():
+    occupied = np.array([0, int(c.BB_RANK_4), int(c.BB_ALL)], dtype=np.uint64)
+    got = batch.rook_attacks(c.E4, occupied)
+    assert got.tolist() == [rook_attacks_bb(c.E4, int(o)) for o in occupied]
+
+
+def batch_leaper_attacks_should_match_python_chess():
+    squares = np.arange(64)
+    assert batch.knight_attacks(squares).tolist() == [int(b) for b in c.BB_KNIGHT_ATTACKS]
+    assert batch.king_attacks(squares).tolist() == [int(b) for b in c.BB_KING_ATTACKS]
+    assert batch.pawn_attacks(squares, WHITE_IDX).tolist() == [int(b) for b in c.BB_PAWN_ATTACKS[c.WHITE]]
+    assert batch.pawn_attacks(squares, BLACK_IDX).tolist() == [int(b) for b in c.BB_PAWN_ATTACKS[c.BLACK]]
+    colors = np.array([WHITE_IDX, BLACK_IDX] * 32)
+    assert batch.pawn_attacks(squares, colors).tolist() == [pawn_attacks_bb(s, s % 2) for s in range(64)]
+
+
+def batch_attacks_should_take_scalar_arguments():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for occupied in [0x100, int(c.BB_ALL)]:
+            for sq in range(64):
+                assert int(batch.rook_attacks(sq, occupied)) == rook_attacks_bb(sq, occupied)
+                assert int(batch.bishop_attacks(sq, occupied)) == bishop_attacks_bb(sq, occupied)
+        assert int(batch.pawn_attacks(c.E4, BLACK_IDX)) == pawn_attacks_bb(c.E4, BLACK_IDX)
@@ -0,0 +1,127 @@
+import random
+from dataclasses import replace
+from os import path
+
+import pytest
+
+import core.magics as magics
+from core.magics import *
+from core.magics import generate, store
+from core.magics.generate import *
+from core.magics.search import NUMBERS_PATH, SearchResult, SquareSearch, emit, find_magic, render_numbers, \
+    search_magics
+from core.magics.report import memory_report
+from core.magics.store import read_tables, write_tables
+from env_vars import MAGICS_CACHE_DIR
+
+
+def magic_tables_should_have_consistent_sizes():
+    for name, table, offsets, shifts in [
+        ("bishop", BISHOP_ATTACK_TABLE, BISHOP_OFFSETS, BISHOP_SHIFTS),
+        ("rook", ROOK_ATTACK_TABLE, ROOK_OFFSETS, ROOK_SHIFTS),
+    ]:
+        assert len(offsets) == 64, name
+        assert len(shifts) == 64, name
+        for i in range(64):
+            hi = offsets[i + 1] if i < 63 else len(table)
+            assert hi - offsets[i] == 1 << shifts[i], f"{name} square {i}"
+
+
+def magic_store_should_round_trip_sections(tmp_path):
+    file = str(tmp_path / "tables.bin")
+    write_tables(file, {"a": [1, 2, 3], "empty": [], "big": [0xffff_ffff_ffff_ffff]})
+    got = read_tables(file)
+    assert {k: list(v) for k, v in got.items()} == {"a": [1, 2, 3], "empty": [], "big": [0xffff_ffff_ffff_ffff]}
+
+
+def magic_store_should_reject_foreign_files(tmp_path):
+    file = tmp_path / "tables.bin"
+    file.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError, match="not a magic table file"):
+        read_tables(str(file))
+
+
+def memory_report_should_show_lookups_sharing_the_mapped_file():
+    report = memory_report()
+    assert report["heap on top of the mapped file"] < report["mapped file (shared between processes)"] // 4
+    assert report["squareset lists"] < report["squareset lists + per-square slices"]
+
+
+def generator_should_reproduce_shipped_tables():
+    shipped = read_tables(SHIPPED_PATH)
+    generated = generate_tables(MagicParams.default())
+    assert list(generated) == list(shipped)
+    for name, values in generated.items():
+        assert list(shipped[name]) == values, name
+
+
+def generator_should_cache_tables_for_changed_params(tmp_path, monkeypatch):
+    monkeypatch.setenv(MAGICS_CACHE_DIR, str(tmp_path))
+    default = MagicParams.default()
+    params = replace(default, bishop_shifts=(7,) + default.bishop_shifts[1:])
+
+    assert ensure_tables(default)[0] == SHIPPED_PATH
+    file, tables = ensure_tables(params)
+    assert file == cache_path(params)
+    assert path.dirname(file) == str(tmp_path)
+    assert tables["bshift"][0] == 7
+
+    monkeypatch.setattr(generate, "write_generated", lambda *args: pytest.fail("cache should have been reused"))
+    file, tables = ensure_tables(params)
+    assert file == cache_path(params)
+    assert tables["bshift"][0] == 7
+
+
+def magic_tables_should_map_the_file_once_on_first_use(monkeypatch):
+    calls = []
+    map_words = store._map_words
+    monkeypatch.setattr(store, "_map_words", lambda file: calls.append(file) or map_words(file))
+    monkeypatch.setattr(magics, "_tables", None)
+    magics.load_tables()
+    assert calls == [SHIPPED_PATH]
+
+
+def generator_should_reject_colliding_magic_numbers():
+    default = MagicParams.default()
+    params = replace(default, rook_magic_nums=(0,) + default.rook_magic_nums[1:])
+    with pytest.raises(ValueError, match="collides on square 0"):
+        generate_tables(params)
+
+
+def search_should_find_verified_magics():
+    for slider, sq_idx, shift in [("bishop", 0, 6), ("bishop", 27, 9), ("rook", 63, 12)]:
+        magic_num = find_magic(SquareSearch(slider, sq_idx, shift, attempts=100_000, seed=0))
+        assert magic_num is not None, f"{slider} {sq_idx}"
+        directions = BISHOP_DIRECTIONS if slider == "bishop" else ROOK_DIRECTIONS
+        assert square_attacks(sq_idx, magic_num, shift, directions) is not None, f"{slider} {sq_idx}"
+
+
+def search_should_render_numbers_in_the_checked_in_format():
+    with open(NUMBERS_PATH) as f:
+        assert render_numbers(MagicParams.default()) == f.read()
+
+
+def search_should_emit_only_improved_tables(tmp_path):
+    default = MagicParams.default()
+    loose = replace(default, bishop_shifts=(9,) + default.bishop_shifts[1:])
+    result = search_magics(loose, attempts=50, processes=2)
+    assert result.new.bishop_shifts[0] < 9
+
+    numbers_file, tables_file = str(tmp_path / "numbers.py"), str(tmp_path / "tables.bin")
+    assert emit(result, numbers_file, tables_file)
+    with open(numbers_file) as f:
+        assert f.read() == render_numbers(result.new)
+    tables = read_tables(tables_file)
+    rng = random.Random(7)
+    for prefix, directions in [("b", BISHOP_DIRECTIONS), ("r", ROOK_DIRECTIONS)]:
+        attacks = tables[f"{prefix}attack"]
+        for i in range(64):
+            mask, magic_num, shift, offset = (tables[prefix + name][i] for name in ["mask", "magic", "shift", "offset"])
+            for _ in range(16):
+                occupied = rng.getrandbits(64) & mask
+                got = attacks[offset + magic_index(occupied, magic_num, shift)]
+                assert got == ray_attacks(i, occupied, directions), f"{prefix} square {i}"
+
+    unchanged = str(tmp_path / "unchanged.bin")
+    assert not emit(SearchResult(default, default), numbers_file, unchanged)
+    assert not path.exists(unchanged)
@@ -1,9 +1,15 @@
+import random
+
 import pytest
 from dataclasses import dataclass
 import chess as c
 
-from core.position import Position
+from core.move import Move
+from core.piece import BLACK_IDX, KNIGHT_IDX, PIECE_TYPES, QUEEN_IDX, WHITE_IDX
+import core.position as position_module
+from core.position import *
 from core.square import *
+from core.zobrist import zobrist_key
 
 def position_should_calculate_half_move_number():
     @dataclass
@@ -12,11 +18,369 @@ def position_should_calculate_half_move_number():
         value: Callable[[], Position]
         want: int
 
-
     cases = [
         Case("initial position", lambda: Position.starting(), 1),
         Case("after 1. e4", lambda: Position.Builder().moves("e4").position, 2),
-        Case("after 1. e5 e5", Position.Builder().moves(["e4", "e5"]).position, 3),
-        Case("after 1. e4 e5 2. Nf3", Position.Builder().moves(["e4", "e5", "Nf3"]).position, 4),
-        Case("after 1. e4 e5 2. Nf3 Nc6", Position.Builder().moves(["e4", "e5", "Nf3", "Nc6"]).position, 5),
+        Case("after 1. e4 e5", lambda: Position.Builder().moves(["e4", "e5"]).position, 3),
+        Case("after 1. e4 e5 2. Nf3", lambda: Position.Builder().moves(["e4", "e5", "Nf3"]).position, 4),
+        Case("after 1. e4 e5 2. Nf3 Nc6", lambda: Position.Builder().moves(["e4", "e5", "Nf3", "Nc6"]).position, 5),
+    ]
+    for case in cases:
+        assert case.value().half_move_number == case.want, case.name
+
+
+def position_should_keep_compact_bitboards():
+    sut = Position.starting()
+    assert not hasattr(sut, "__dict__")
+    assert sut.boards == STARTING_BOARDS
+    assert sut.pieces_bb(WHITE_IDX, KNIGHT_IDX) == int(ss.white.starting.knights)
+    assert sut.pieces_bb(BLACK_IDX, QUEEN_IDX) == int(ss.black.starting.queens)
+    assert sut.occupied_bb(WHITE_IDX) == int(ss.white.starting.all)
+    assert sut.occupied_bb(BLACK_IDX) == int(ss.black.starting.all)
+    assert sut.occupied_bb() == int(ss.starting.all)
+    assert sut.castling_bits == CASTLE_ALL
+    assert sut.ep == NO_SQUARE
+    with pytest.raises(ValueError):
+        Position(STARTING_BOARDS[:11])
+
+
+def position_should_expose_legacy_attributes():
+    sut = Position.starting()
+    assert sut.is_white
+    assert sut.white_pawns == ss.white.starting.pawns
+    assert sut.white_bishops == ss.white.starting.bishops
+    assert sut.black_rooks == ss.black.starting.rooks
+    assert sut.white_king is sq.white.starting.king
+    assert sut.black_king is sq.black.starting.king
+    assert sut.ep_square is None
+    assert sut.castling == (True, True, True, True)
+    assert (sut.half_move_clock, sut.full_move_number, sut.half_move_number) == (0, 1, 1)
+    with pytest.raises(AttributeError):
+        sut.white_pawns = ss.empty
+
+    sut = Position(STARTING_BOARDS, turn=BLACK_IDX, castling=CASTLE_WHITE_LONG | CASTLE_BLACK_SHORT, ep=SQ("e3").idx,
+                   full_move_number=1)
+    assert not sut.is_white
+    assert sut.ep_square is SQ("e3")
+    assert sut.castling == (False, True, True, False)
+    assert sut.half_move_number == 2
+
+
+def _random_game(rng: random.Random, plies: int) -> Iterator[Tuple[c.Board, Move]]:
+    board = c.Board()
+    for _ in range(plies):
+        moves = list(board.legal_moves)
+        if not moves:
+            return
+        m = rng.choice(moves)
+        board.push(m)
+        yield board, Move(SQ(m.from_square), SQ(m.to_square), PIECE_TYPES[m.promotion - 1] if m.promotion else None)
+
+
+def _assert_matches(sut: Position, board: c.Board):
+    for color in [WHITE_IDX, BLACK_IDX]:
+        for piece in range(6):
+            assert sut.pieces_bb(color, piece) == int(board.pieces_mask(piece + 1, color == WHITE_IDX)), board.fen()
+    assert sut.occupied_bb() == int(board.occupied), board.fen()
+    assert sut.is_white == board.turn, board.fen()
+    want_ep = board.ep_square if board.has_pseudo_legal_en_passant() else None
+    assert sut.ep_square == (None if want_ep is None else SQ(want_ep)), board.fen()
+    assert sut.castling == (board.has_kingside_castling_rights(c.WHITE), board.has_queenside_castling_rights(c.WHITE),
+                            board.has_kingside_castling_rights(c.BLACK),
+                            board.has_queenside_castling_rights(c.BLACK)), board.fen()
+    assert (sut.half_move_clock, sut.full_move_number) == (board.halfmove_clock, board.fullmove_number), board.fen()
+
+
+def position_should_push_and_pop_like_python_chess():
+    rng = random.Random(20)
+    for _ in range(20):
+        sut = Position.starting()
+        history = [sut.copy()]
+        for board, move in _random_game(rng, 200):
+            sut.push(move)
+            _assert_matches(sut, board)
+            history.append(sut.copy())
+        while history:
+            assert sut == history.pop()
+            if sut.move_stack:
+                sut.pop()
+
+
+def position_should_apply_without_changing_the_original():
+    start = Position.starting()
+    sut = start.apply(Move(SQ("e2"), SQ("e4"), None)).apply(Move(SQ("d7"), SQ("d5"), None))
+    assert start == Position.starting()
+    assert sut.white_pawns == SS("a2,b2,c2,d2,e4,f2,g2,h2")
+    assert sut.black_pawns == SS("a7,b7,c7,d5,e7,f7,g7,h7")
+    assert sut.ep_square is None
+    sut = sut.apply(Move(SQ("e4"), SQ("d5"), None))
+    assert sut.black_pawns == SS("a7,b7,c7,e7,f7,g7,h7")
+    assert sut.half_move_clock == 0
+    with pytest.raises(ValueError):
+        sut.push(Move(SQ("e4"), SQ("e5"), None))
+
+
+def position_key_should_be_maintained_incrementally():
+    rng = random.Random(21)
+    for _ in range(10):
+        sut = Position.starting()
+        keys = [sut.key]
+        for board, move in _random_game(rng, 200):
+            sut.push(move)
+            assert sut.key == zobrist_key(sut.boards, sut.turn, sut.castling_bits, sut.ep), board.fen()
+            keys.append(sut.key)
+        while sut.move_stack:
+            assert sut.key == keys.pop()
+            sut.pop()
+        assert sut.key == Position.starting().key
+
+
+def position_key_should_detect_transpositions():
+    def play(moves: str) -> Position:
+        res = Position.starting()
+        for m in moves.split():
+            res.push(Move(SQ(m[:2]), SQ(m[2:]), None))
+        return res
+
+    assert play("g1f3 g8f6 b1c3").key == play("b1c3 g8f6 g1f3").key
+    assert play("g1f3 g8f6 b1c3").key != play("g1f3 g8f6").key
+    assert play("e2e4 e7e5 e1e2 e8e7 e2e1 e7e8").key != Position.starting().key
+    assert play("g1f3 g8f6 f3g1 f6g8").key == Position.starting().key
+
+
+def position_should_round_trip_fen_like_python_chess():
+    rng = random.Random(23)
+    assert Position.from_fen(STARTING_FEN) == Position.starting()
+    assert Position.starting().to_fen() == STARTING_FEN
+    for _ in range(20):
+        sut = Position.starting()
+        for board, move in _random_game(rng, 200):
+            sut.push(move)
+            for fen in [board.fen(en_passant="fen"), board.fen(en_passant="xfen")]:
+                parsed = Position.from_fen(fen)
+                assert parsed == sut, fen
+                assert parsed.key == sut.key, fen
+            assert sut.to_fen() == board.fen(en_passant="xfen")
+
+
+def position_should_normalize_fen_rights():
+    @dataclass
+    class Case:
+        name: str
+        fen: str
+        want: str
+
+        def __iter__(self):
+            return iter([self.name, self.fen, self.want])
+
+    cases = [
+        Case("optional clocks", "8/8/8/8/8/8/8/K6k w - -", "8/8/8/8/8/8/8/K6k w - - 0 1"),
+        Case("castling without a rook", "4k3/8/8/8/8/8/8/4K2R w KQkq - 0 1", "4k3/8/8/8/8/8/8/4K2R w K - 0 1"),
+        Case("castling in any order", "r3k2r/8/8/8/8/8/8/R3K2R b qkQK - 0 1", "r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1"),
+        Case("ep without a capturing pawn", "4k3/8/8/8/4P3/8/8/4K3 b - e3 0 1", "4k3/8/8/8/4P3/8/8/4K3 b - - 0 1"),
+        Case("ep with a capturing pawn", "4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1", "4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1"),
+        Case("ep on the wrong rank", "4k3/8/8/8/3pP3/8/8/4K3 b - e4 0 1", "4k3/8/8/8/3pP3/8/8/4K3 b - - 0 1"),
+    ]
+
+    for name, fen, want in cases:
+        assert Position.from_fen(fen).to_fen() == want, name
+
+
+def position_should_reject_invalid_fen():
+    for fen in ["", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+                "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                "rnbqkbnr/ppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w KQkq - 0 1",
+                "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+                "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQxq - 0 1",
+                "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq z9 0 1",
+                "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - zero 1"]:
+        with pytest.raises(ValueError):
+            Position.from_fen(fen)
+
+
+def position_should_stream_fens():
+    lines = iter([STARTING_FEN + "\n", "\n", "8/8/8/8/8/8/8/K6k w - - 0 1\n"])
+    sut = Position.from_fens(lines)
+    assert next(sut) == Position.starting()
+    assert next(iter(lines)) == "\n", "lines are read lazily"
+    assert next(sut).to_fen() == "8/8/8/8/8/8/8/K6k w - - 0 1"
+    assert list(sut) == []
+
+
+def position_should_resolve_san_like_python_chess():
+    rng = random.Random(24)
+    for _ in range(10):
+        board = c.Board()
+        sut = Position.starting()
+        for _ in range(120):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            for m in moves:
+                frm, to, prom = sut.split_san(board.san(m))
+                assert (frm.idx, to.idx) == (m.from_square, m.to_square), board.san(m)
+                assert prom == (PIECE_TYPES[m.promotion - 1] if m.promotion else None), board.san(m)
+            m = rng.choice(moves)
+            assert sut.apply_san(board.san(m)).to.idx == m.to_square
+            board.push(m)
+        assert sut.to_fen() == board.fen(en_passant="xfen")
+
+
+def position_should_resolve_san_edge_cases():
+    @dataclass
+    class Case:
+        name: str
+        fen: str
+        san: str
+        want: Tuple[str, str, str | None]
+
+        def __iter__(self):
+            return iter([self.name, self.fen, self.san, self.want])
+
+    cases = [
+        Case("file disambiguation", "4k3/8/8/8/8/8/8/R3K2R w - - 0 1", "Rad1", ("a1", "d1", None)),
+        Case("rank disambiguation", "4k3/8/8/8/R7/8/8/R3K3 w - - 0 1", "R1a3", ("a1", "a3", None)),
+        Case("square disambiguation", "4k3/8/8/8/Q1Q5/8/Q7/4K3 w - - 0 1", "Qa4b3", ("a4", "b3", None)),
+        Case("pin resolves ambiguity", "4k3/8/8/8/1b6/8/3N4/4K1N1 w - - 0 1", "Nf3", ("g1", "f3", None)),
+        Case("short castle", "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", "O-O", ("e1", "g1", None)),
+        Case("long castle with zeros", "r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1", "0-0-0+", ("e8", "c8", None)),
+        Case("promotion", "8/P3k3/8/8/8/8/8/4K3 w - - 0 1", "a8=Q+", ("a7", "a8", "Q")),
+        Case("capture promotion without =", "1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1", "axb8N", ("a7", "b8", "N")),
+        Case("en passant", "4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "exd6", ("e5", "d6", None)),
+        Case("double push", STARTING_FEN, "e4", ("e2", "e4", None)),
+        Case("annotated", STARTING_FEN, "Nf3!?", ("g1", "f3", None)),
+    ]
+
+    for name, fen, san, want in cases:
+        frm, to, prom = Position.from_fen(fen).split_san(san)
+        assert (frm.name, to.name, prom.white_letter if prom else None) == want, name
+
+
+def position_should_reject_unresolvable_san():
+    @dataclass
+    class Case:
+        name: str
+        fen: str
+        san: str
+
+        def __iter__(self):
+            return iter([self.name, self.fen, self.san])
+
+    cases = [
+        Case("garbage", STARTING_FEN, "hello"),
+        Case("no such piece", STARTING_FEN, "Qh5"),
+        Case("blocked pawn", "4k3/8/8/8/4p3/4P3/8/4K3 w - - 0 1", "e4"),
+        Case("ambiguous", "4k3/8/8/R7/8/8/8/R3K3 w - - 0 1", "Ra3"),
+        Case("only candidate is pinned", "4k3/8/8/8/1b6/8/3N4/4K3 w - - 0 1", "Nf3"),
+        Case("castle without rights", "r3k2r/8/8/8/8/8/8/R3K2R w kq - 0 1", "O-O"),
+        Case("castle blocked", STARTING_FEN, "O-O"),
+        Case("castle through check", "r3k2r/8/8/8/8/8/5r2/R3K2R w KQkq - 0 1", "O-O"),
+        Case("missing promotion", "8/P3k3/8/8/8/8/8/4K3 w - - 0 1", "a8"),
+        Case("promotion too early", STARTING_FEN, "e4=Q"),
+        Case("capture of nothing", STARTING_FEN, "exd3"),
+        Case("lower case piece", STARTING_FEN, "nf3"),
+        Case("ignores the check", "r1bqkb1r/pppp1Qpp/2n2n2/4p3/2B1P3/8/PPPP1PPP/RNB1K1NR b KQkq - 0 4", "Nd4"),
+        Case("king onto an attacked square", "4k3/8/8/8/8/8/3r4/4K3 w - - 0 1", "Kd1"),
+        Case("king along the checking line", "4k3/8/8/8/8/8/8/r3K3 w - - 0 1", "Kf1"),
+        Case("answers one of two checks", "4k3/8/8/8/8/5n1R/8/r3K3 w - - 0 1", "Rxf3"),
+        Case("piece capture of nothing", STARTING_FEN, "Nxf3"),
+        Case("piece capture without x", "4k3/8/8/8/8/5p2/8/4K1N1 w - - 0 1", "Nf3"),
     ]
+
+    for name, fen, san in cases:
+        try:
+            Position.from_fen(fen).split_san(san)
+        except ValueError:
+            continue
+        pytest.fail(name)
+
+
+def position_should_memoize_san_resolution(monkeypatch):
+    position_module._SAN_CACHE.clear()
+    sut = Position.starting()
+    first = sut.split_san("Nf3")
+    assert Position.from_fen(STARTING_FEN).split_san("Nf3") is first
+
+    monkeypatch.setattr(position_module, "SAN_CACHE_SIZE", 8)
+    board = c.Board()
+    for _ in range(30):
+        move = next(iter(board.legal_moves))
+        sut.apply_san(board.san(move))
+        board.push(move)
+        assert len(position_module._SAN_CACHE) <= 8
+    assert (Position.starting().key, "Nf3") not in position_module._SAN_CACHE, "least recently used goes first"
+
+
+def builder_should_replay_san_lines():
+    sut = Position.Builder().moves(["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O"]).position
+    assert sut.to_fen() == "r1bqkb1r/1ppp1ppp/p1n2n2/4p3/B3P3/5N2/PPPP1PPP/RNBQ1RK1 b kq - 3 5"
+    assert Position.Builder().moves("e4 e5").position.half_move_number == 3
+
+
+def line_cache_should_only_apply_new_moves():
+    sut = LineCache()
+    sut.line(["e4", "e5", "Nf3"])
+    assert sut.stats.misses == 3
+    position = sut.line(["e4", "e5", "Nf3", "Nc6", "Bb5"])
+    assert (sut.stats.hits, sut.stats.misses) == (3, 5)
+    assert position == Position.Builder().moves("e4 e5 Nf3 Nc6 Bb5").position
+    assert len(sut) == 5
+
+    builder = Position.Builder(sut).moves("e4 e5")
+    builder.moves(["Nf3", "Nc6"]).moves("Bc4")
+    assert (sut.stats.hits, sut.stats.misses) == (7, 6)
+    assert builder.position.to_fen() == "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3"
+
+
+def line_cache_should_hand_out_independent_positions():
+    sut = LineCache()
+    position = sut.line("d4")
+    position.apply_san("d5")
+    assert sut.line("d4").to_fen() == "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq - 0 1"
+
+
+def line_cache_should_evict_cold_branches():
+    sut = LineCache(max_positions=6)
+    sut.line("e4 e5 Nf3 Nc6")
+    sut.line("d4 d5 c4")
+    assert len(sut) == 6
+    assert sut.stats.evictions == 1
+    assert "e4" in sut.root.children and "d4" in sut.root.children
+    assert "Nc6" not in sut.root.children["e4"].children["e5"].children["Nf3"].children
+
+    sut.line("e4 e5")
+    sut.line("c4 e5 Nc3")
+    assert sut.root.children["d4"].children == {}, "the coldest branch is cut back from its leaves"
+    assert "Nf3" not in sut.root.children["e4"].children["e5"].children
+    assert len(sut) == 6
+    assert sut.line("e4 e5 Nf3 Nc6 Bb5") == Position.Builder().moves("e4 e5 Nf3 Nc6 Bb5").position
+
+
+def line_cache_should_reattach_a_stale_builder():
+    sut = LineCache(max_positions=4)
+    builder = Position.Builder(sut).moves("e4 e5")
+    sut.line("d4 d5 c4 e6")
+    assert "e4" not in sut.root.children
+    builder.moves("Nf3")
+    assert len(sut) == 4
+    assert sut.root.children["e4"].children["e5"].children["Nf3"].children == {}
+    assert "d4" in sut.root.children
+    misses = sut.stats.misses
+    assert sut.line("e4 e5 Nf3") == builder.position
+    assert sut.stats.misses == misses
+
+    replaced = Position.Builder(sut).moves("e4")
+    sut.line("d4 d5 c4 e6")
+    sut.line("e4 c5")
+    assert replaced.moves("e5").position == sut.line("e4 e5")
+    assert list(sut.root.children["e4"].children) == ["c5", "e5"]
+
+
+def line_cache_should_keep_the_valid_prefix_of_a_bad_line():
+    sut = LineCache(max_positions=4)
+    with pytest.raises(ValueError):
+        sut.line("e4 e5 Ke3")
+    assert len(sut) == 2
+    sut.line("d4 d5 c4 e6 Nc3")
+    assert len(sut) == 4
@@ -0,0 +1,61 @@
+import random
+from dataclasses import dataclass
+
+import chess as c
+import numpy as np
+
+from core.square import *
+from core.square_array import SSA, SquareSetArray
+
+
+def squareset_array_should_round_trip_squaresets():
+    sets = [ss.empty, ss.all, ss.white.starting.pawns, SS("e4,d5")]
+    arr = SSA(sets)
+    assert len(arr) == 4
+    assert arr.squaresets() == sets
+    assert list(arr) == sets
+    assert arr[3] == SS("e4,d5")
+    assert arr[1:3].squaresets() == sets[1:3]
+    assert SSA([0, 0xff]).squaresets() == [ss.empty, ss.ranks.r1]
+
+
+def squareset_array_should_match_squareset_operations():
+    rng = random.Random(4)
+    left = [SS(rng.getrandbits(64)) for _ in range(256)]
+    right = [SS(rng.getrandbits(64)) for _ in range(256)]
+    a, b = SSA(left), SSA(right)
+
+    assert (a | b).squaresets() == [x | y for x, y in zip(left, right)]
+    assert (a & b).squaresets() == [x & y for x, y in zip(left, right)]
+    assert (a - b).squaresets() == [x - y for x, y in zip(left, right)]
+    assert (a ^ b).squaresets() == [x ^ y for x, y in zip(left, right)]
+    assert (~a).squaresets() == [~x for x in left]
+    assert (a & ss.files.e).squaresets() == [x & ss.files.e for x in left]
+    assert a.count().tolist() == [len(x) for x in left]
+    assert a.contains("e4").tolist() == [x[SQ("e4")] for x in left]
+    assert a.has_all("e4,d5").tolist() == [x.has_subset(SS("e4,d5")) for x in left]
+    assert a.has_any(ss.files.a).tolist() == [bool(x & ss.files.a) for x in left]
+    assert (a == b).tolist() == [x == y for x, y in zip(left, right)]
+
+
+def squareset_array_should_popcount_without_numpy_bitwise_count(monkeypatch):
+    values = SSA([0, 1, 0xffff_ffff_ffff_ffff, 0x8000_0000_0000_0001, c.BB_LIGHT_SQUARES])
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    assert values.count().tolist() == [0, 1, 64, 2, 32]
+
+
+def squareset_array_should_filter_positions():
+    @dataclass
+    class Stored:
+        white_knights: SquareSet
+        white_pawns: SquareSet
+
+    boards = [c.Board(), c.Board("rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"),
+              c.Board("rnbqkbnr/pppp1ppp/8/4p3/3PP3/8/PPP2PPP/RNBQKBNR b KQkq - 0 2")]
+    stored = [Stored(SS(int(b.knights & b.occupied_co[c.WHITE])), SS(int(b.pawns & b.occupied_co[c.WHITE])))
+              for b in boards]
+    knights = SSA(s.white_knights for s in stored)
+    pawns = SSA(s.white_pawns for s in stored)
+
+    matches = knights.contains("f3") & pawns.contains("e4")
+    assert np.flatnonzero(matches).tolist() == [1]
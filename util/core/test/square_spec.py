@@ -1,3 +1,8 @@
+import copy
+import pickle
+import random
+import timeit
+
 import pytest
 from dataclasses import dataclass
 import chess as c
@@ -14,15 +19,13 @@ def square_should_be_constructible():
         def __iter__(self):
             return iter([self.name, self.value, self.want])
 
-    dummy = SQ()
-    dummy._idx = 42
     cases = [
         Case("None", None, 0),
         Case("int", 42, 42),
         Case("algebraic notation lower", "e4", c.parse_square("e4")),
         Case("algebraic notation upper", "E4", c.parse_square("e4")),
         Case("row and col", (1, 2), c.parse_square("c2")),
-        Case("another square", dummy, 42),
+        Case("another square", SQ(42), 42),
     ]
     for name, value, want in cases:
         try:
@@ -32,6 +35,19 @@ def square_should_be_constructible():
         assert got.idx == want, name
 
 
+def square_should_be_an_interned_immutable_singleton():
+    assert SQ(28) is SQ("e4") is SQ("E4") is SQ((3, 4)) is SQ(SQ(28))
+    assert SQ() is SQ(0)
+    assert copy.copy(SQ(28)) is SQ(28)
+    assert copy.deepcopy(SQ(28)) is SQ(28)
+    assert pickle.loads(pickle.dumps(SQ(28))) is SQ(28)
+    assert all(a is b for a, b in zip(SS(0xffff), sq.ranks.r1 + sq.ranks.r2))
+    with pytest.raises(AttributeError, match="immutable"):
+        SQ(28)._idx = 42
+    with pytest.raises(AttributeError):
+        SQ(28).foo = 42
+
+
 def square_should_validate_parameters_to_constructor():
     @dataclass
     class Case:
@@ -356,4 +372,223 @@ def squareset_can_be_used_as_dict_key():
         assert d[SS(0)] == 1, "any equivalent squareset should work"
         assert SS(0) in d, "should work as contains"
     except:
-        pytest.fail("SquareSet should be usable as a key in dictionary")
\ No newline at end of file
+        pytest.fail("SquareSet should be usable as a key in dictionary")
+
+
+def squareset_should_scan_bits():
+    @dataclass
+    class Case:
+        name: str
+        sut: SquareSet
+        indices: List[int]
+        lsb: str
+        msb: str
+
+        def __iter__(self):
+            return iter([self.name, self.sut, self.indices, self.lsb, self.msb])
+
+    cases = [
+        Case("single square", SS("e4"), [c.E4], "e4", "e4"),
+        Case("kings", ss.starting.kings, [c.E1, c.E8], "e1", "e8"),
+        Case("corners", SS("a1,h1,a8,h8"), [c.A1, c.H1, c.A8, c.H8], "a1", "h8"),
+        Case("all", ss.all, list(range(64)), "a1", "h8"),
+    ]
+
+    for name, sut, indices, lsb, msb in cases:
+        assert list(sut.indices()) == indices, name
+        assert sut.lsb() is SQ(lsb), name
+        assert sut.msb() is SQ(msb), name
+        popped, rest = sut.pop_lsb()
+        assert popped is SQ(lsb), name
+        assert rest == sut - SS(lsb), name
+
+    for method in [ss.empty.lsb, ss.empty.msb, ss.empty.pop_lsb]:
+        with pytest.raises(ValueError, match="empty SquareSet"):
+            method()
+
+
+def squareset_should_support_reflected_and_xor_operators():
+    @dataclass
+    class Case:
+        name: str
+        sut: Callable[[], any]
+        want: any
+
+        def __iter__(self):
+            return iter([self.name, self.sut, self.want])
+
+    cases = [
+        Case("int & SS", lambda: c.BB_RANK_1 & ss.files.a, SS("a1")),
+        Case("int | SS", lambda: c.BB_A1 | SS("h8"), SS("a1,h8")),
+        Case("SS ^ SS", lambda: SS("a1,b1") ^ SS("b1,c1"), SS("a1,c1")),
+        Case("int ^ SS", lambda: c.BB_A1 ^ SS("a1,c1"), SS("c1")),
+        Case("SS | Square", lambda: SS("a1") | SQ("b1"), SS("a1,b1")),
+        Case("SS & str", lambda: ss.ranks.r1 & "a1,a2", SS("a1")),
+        Case("result is a SquareSet", lambda: type(c.BB_A1 | SS("h8")), SquareSet),
+    ]
+
+    for name, sut, want in cases:
+        assert sut() == want, name
+
+
+def squareset_operators_should_skip_coercion_for_squaresets_and_ints():
+    a, b = ss.white.starting.all, ss.files.e
+
+    def fastest(fast: Callable[[], any], slow: Callable[[], any]) -> Tuple[float, float]:
+        # interleaved so that a burst of noise on a busy machine hits both sides alike
+        best_fast, best_slow = float("inf"), float("inf")
+        for _ in range(9):
+            best_fast = min(best_fast, timeit.timeit(fast, number=10_000))
+            best_slow = min(best_slow, timeit.timeit(slow, number=10_000))
+        return best_fast, best_slow
+
+    # the slow side is what every operator used to do: run the argument through the SquareSet constructor first
+    cases = [
+        ("& SquareSet", lambda: a & b, lambda: SquareSet(a.value & SquareSet(b).value)),
+        ("& int", lambda: a & 0xff, lambda: SquareSet(a.value & SquareSet(0xff).value)),
+        ("== SquareSet", lambda: a == b, lambda: a.value == SquareSet(b).value),
+    ]
+
+    for name, fast, slow in cases:
+        fast_time, slow_time = fastest(fast, slow)
+        assert fast_time < slow_time * 0.8, name
+
+
+def mutable_squareset_should_build_in_place():
+    acc = MSS()
+    same = acc
+    for location in sq.white.starting.knights:
+        acc |= SS(c.BB_KNIGHT_ATTACKS[location.idx])
+    acc &= ~ss.white.starting.all
+    acc.set("e4").set(SQ("d4")).toggle("d4").toggle(c.E5).clear("e4")
+    acc -= SS("a3")
+    acc ^= SS("h1")
+
+    assert acc is same
+    assert acc == SS("c3,f3,h3,e5,h1")
+    frozen = acc.freeze()
+    assert type(frozen) is SquareSet
+    assert frozen == acc
+    acc.clear("e5")
+    assert frozen == SS("c3,f3,h3,e5,h1"), "freezing takes a snapshot"
+    assert SS(acc) == SS("c3,f3,h3,h1")
+    assert type(ss.ranks.r1 & acc) is SquareSet
+    assert type(copy.copy(acc)) is MutableSquareSet and copy.copy(acc) is not acc
+    with pytest.raises(TypeError):
+        hash(acc)
+
+
+def squareset_should_shift_fill_and_transform_like_python_chess():
+    @dataclass
+    class Case:
+        name: str
+        sut: Callable[[SquareSet], SquareSet]
+        want: Callable[[int], int]
+
+        def __iter__(self):
+            return iter([self.name, self.sut, self.want])
+
+    cases = [
+        Case("north", SS.north, c.shift_up),
+        Case("south", SS.south, c.shift_down),
+        Case("east", SS.east, c.shift_right),
+        Case("west", SS.west, c.shift_left),
+        Case("north east", SS.north_east, c.shift_up_right),
+        Case("north west", SS.north_west, c.shift_up_left),
+        Case("south east", SS.south_east, c.shift_down_right),
+        Case("south west", SS.south_west, c.shift_down_left),
+        Case("flip vertical", SS.flip_vertical, c.flip_vertical),
+        Case("mirror horizontal", SS.mirror_horizontal, c.flip_horizontal),
+        Case("rotate 180", SS.rotate_180, lambda bb: c.flip_vertical(c.flip_horizontal(bb))),
+    ]
+
+    rng = random.Random(5)
+    samples = [0, c.BB_ALL, c.BB_FILE_A, c.BB_FILE_H, c.BB_RANK_1, c.BB_RANK_8] + [rng.getrandbits(64) for _ in range(64)]
+    for name, sut, want in cases:
+        for bb in samples:
+            assert sut(SS(bb)).value == want(bb), f"{name} {bb:#x}"
+
+
+def squareset_should_fill_along_files():
+    @dataclass
+    class Case:
+        name: str
+        sut: Callable[[], SquareSet]
+        want: SquareSet
+
+        def __iter__(self):
+            return iter([self.name, self.sut, self.want])
+
+    cases = [
+        Case("north fill", lambda: SS("e4,b7").north_fill(), SS("e4,e5,e6,e7,e8,b7,b8")),
+        Case("south fill", lambda: SS("e4,b7").south_fill(), SS("e1,e2,e3,e4,b1,b2,b3,b4,b5,b6,b7")),
+        Case("file fill", lambda: SS("e4,b7").file_fill(), ss.files.e | ss.files.b),
+        Case("file fill of the starting pawns", lambda: ss.white.starting.pawns.file_fill(), ss.all),
+        Case("empty stays empty", lambda: ss.empty.file_fill(), ss.empty),
+    ]
+
+    for name, sut, want in cases:
+        assert sut() == want, name
+
+
+def square_names_should_round_trip_through_tables():
+    for i in range(64):
+        name = c.SQUARE_NAMES[i]
+        assert SQUARE_NAMES[i] == name
+        assert SQUARE_INDICES[name] == i
+        assert SQ(name) is SQ(i)
+        assert SQ(name.upper()) is SQ(i)
+        assert SQ(i).name == name
+    with pytest.raises(ValueError):
+        SQ("i9")
+
+
+def squareset_should_parse_comma_separated_names():
+    @dataclass
+    class Case:
+        name: str
+        value: str
+        want: int
+
+        def __iter__(self):
+            return iter([self.name, self.value, self.want])
+
+    cases = [
+        Case("single", "e4", c.BB_E4),
+        Case("spaces around items", " a1 , H8 ,e4", c.BB_A1 | c.BB_H8 | c.BB_E4),
+        Case("repeated items", "d5,d5", c.BB_D5),
+        Case("every square", ",".join(SQUARE_NAMES), c.BB_ALL),
+    ]
+
+    for name, value, want in cases:
+        assert SS(value).value == want, name
+        assert str(SS(want)) == str(SS(value)), name
+    with pytest.raises(ValueError, match=r'item 1: "z9" can not be part of a SquareSet'):
+        SS("a1, z9")
+
+
+def square_constants_should_match_their_definitions():
+    assert sq.ranks.r4 == ranks(4)
+    assert sq.files.c == files("c")
+    assert sq.starting.all == ranks(1, 2, 7, 8)
+    assert sq.white.squares == tuple(SQ(i) for i in range(1, 64, 2))
+    assert sq.black.castling.long_checkable == (SQ("c8"), SQ("d8"), SQ("e8"))
+    assert sq.white.starting.king is SQ("e1")
+    assert sq.h8 is SQ("h8")
+    for name in SQUARE_NAMES:
+        assert getattr(ss, name) == SS(name), name
+        assert getattr(sq, name) is SQ(name), name
+    assert ss.starting.all == SS(sq.starting.all)
+    assert ss.black.castling.short_blockable == SS("f8,g8")
+    assert ss.none == ss.empty == SS(0)
+    assert ss.files.e is ss.files.e
+    assert type(ss.files.e) is SquareSet
+
+
+SQUARE_IMPORT_BUDGET_US = 2_500
+
+
+def square_should_import_within_budget():
+    from core.bench import import_time_us
+    own, _ = import_time_us("core.square", runs=10)
+    assert own < SQUARE_IMPORT_BUDGET_US, f"core.square took {own}us"
@@ -0,0 +1,80 @@
+import chess as c
+
+from core.move import Move
+from core.piece import WHITE_IDX
+from core.position import Position
+from core.square import *
+from core.transposition import *
+
+
+def transposition_cache_should_count_hits_and_misses():
+    sut = TranspositionCache(64)
+    assert sut.get(42) is None
+    sut.put(42, "value")
+    assert sut.get(42) == "value"
+    assert 42 in sut and 43 not in sut
+    assert sut.get_or_compute(43, lambda: "computed") == "computed"
+    assert sut.get_or_compute(43, lambda: "recomputed") == "computed"
+    assert sut.stats == CacheStats(hits=2, misses=2, stores=2, evictions=0)
+    assert sut.stats.hit_rate == 0.5
+
+
+def transposition_cache_should_stay_bounded():
+    sut = TranspositionCache(64)
+    assert sut.capacity == 64
+    for key in range(1000):
+        sut.put(key * 0x9e37_79b9_7f4a_7c15 & 0xffff_ffff_ffff_ffff, key)
+    assert len(sut) == 64
+    assert sut.stats.evictions == 1000 - 64
+    sut.clear()
+    assert len(sut) == 0 and sut.stats == CacheStats()
+
+
+def transposition_cache_should_replace_old_then_shallow_entries():
+    sut = TranspositionCache(BUCKET_SIZE)
+    for key, depth in [(1, 5), (2, 1), (3, 7), (4, 3)]:
+        sut.put(key, key, depth)
+    sut.put(5, 5, 0)
+    assert 2 not in sut, "shallowest entry of the current age goes first"
+
+    sut.new_age()
+    sut.get(1)
+    sut.put(6, 6, 0)
+    assert 1 in sut, "entries read in the current age are kept"
+    assert 5 not in sut, "shallowest entry of an older age goes first"
+
+    sut.put(3, "again", 0)
+    assert sut.get(3) == "again"
+    assert len(sut) == BUCKET_SIZE
+
+
+def transposition_cache_should_rotate_equal_entries():
+    sut = TranspositionCache(BUCKET_SIZE)
+    for key in range(1, 100):
+        sut.put(key, key)
+    assert [key for key in range(1, 100) if key in sut] == [96, 97, 98, 99]
+
+    sut.get(96)
+    sut.put(100, 100)
+    assert 97 not in sut, "the least recently used entry goes first"
+    assert 96 in sut
+
+
+def position_should_share_derived_data_across_transpositions():
+    POSITION_CACHE.clear()
+    a = Position.starting()
+    for m in ["g1f3", "g8f6", "b1c3"]:
+        a.push(Move(SQ(m[:2]), SQ(m[2:]), None))
+    b = Position.starting()
+    for m in ["b1c3", "g8f6", "g1f3"]:
+        b.push(Move(SQ(m[:2]), SQ(m[2:]), None))
+    board = c.Board("rnbqkb1r/pppppppp/5n2/8/8/2N2N2/PPPPPPPP/R1BQKB1R b KQkq - 3 2")
+    want = 0
+    for s in c.SquareSet(board.occupied_co[c.WHITE]):
+        want |= int(board.attacks(s))
+    assert a.attacked_bb(WHITE_IDX) == want
+    misses = POSITION_CACHE.stats.misses
+    assert b.attacked_bb(WHITE_IDX) == a.attacked_bb(WHITE_IDX)
+    assert POSITION_CACHE.stats.misses == misses
+    assert b.derived() is a.derived()
+    assert not a.is_check()
@@ -0,0 +1,127 @@
+from dataclasses import dataclass, field
+from os import getenv
+from typing import *
+
+from env_vars import POSITION_CACHE_ENTRIES
+
+BUCKET_SIZE = 4
+DEFAULT_ENTRIES = 1 << 16
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TranspositionCache:
+    # buckets are runs of BUCKET_SIZE slots in flat lists; a full bucket gives up the slot of an older age first, then
+    # the one with the lowest depth and then the least recently used one
+    __slots__ = ("_mask", "_keys", "_values", "_depths", "_ages", "_ticks", "_age", "_tick", "stats")
+
+    def __init__(self, entries: int = DEFAULT_ENTRIES):
+        buckets = 1 << max(0, (entries // BUCKET_SIZE - 1).bit_length())
+        size = buckets * BUCKET_SIZE
+        self._mask = buckets - 1
+        self._keys: List[int | None] = [None] * size
+        self._values: List[any] = [None] * size
+        self._depths = [0] * size
+        self._ages = [0] * size
+        self._ticks = [0] * size
+        self._age = 0
+        self._tick = 0
+        self.stats = CacheStats()
+
+    @property
+    def capacity(self) -> int:
+        return len(self._keys)
+
+    @property
+    def age(self) -> int:
+        return self._age
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._keys.count(None)
+
+    def __contains__(self, key: int) -> bool:
+        start = (key & self._mask) * BUCKET_SIZE
+        return key in self._keys[start:start + BUCKET_SIZE]
+
+    def get(self, key: int, default: any = None) -> any:
+        keys = self._keys
+        start = (key & self._mask) * BUCKET_SIZE
+        for slot in range(start, start + BUCKET_SIZE):
+            if keys[slot] == key:
+                self.stats.hits += 1
+                self._ages[slot] = self._age
+                self._tick += 1
+                self._ticks[slot] = self._tick
+                return self._values[slot]
+        self.stats.misses += 1
+        return default
+
+    def put(self, key: int, value: any, depth: int = 0) -> None:
+        keys, ages, depths, ticks = self._keys, self._ages, self._depths, self._ticks
+        start = (key & self._mask) * BUCKET_SIZE
+        victim = None
+        for slot in range(start, start + BUCKET_SIZE):
+            k = keys[slot]
+            if k == key or k is None:
+                victim = slot
+                break
+            if victim is None or ((ages[slot] == self._age, depths[slot], ticks[slot]) <
+                                  (ages[victim] == self._age, depths[victim], ticks[victim])):
+                victim = slot
+        else:
+            self.stats.evictions += 1
+        keys[victim] = key
+        self._values[victim] = value
+        depths[victim] = depth
+        ages[victim] = self._age
+        self._tick += 1
+        ticks[victim] = self._tick
+        self.stats.stores += 1
+
+    def get_or_compute(self, key: int, compute: Callable[[], any], depth: int = 0) -> any:
+        res = self.get(key, _MISSING)
+        if res is _MISSING:
+            res = compute()
+            self.put(key, res, depth)
+        return res
+
+    def new_age(self) -> None:
+        self._age += 1
+
+    def clear(self) -> None:
+        size = len(self._keys)
+        self._keys = [None] * size
+        self._values = [None] * size
+        self._depths = [0] * size
+        self._ages = [0] * size
+        self._ticks = [0] * size
+        self._age = 0
+        self._tick = 0
+        self.stats = CacheStats()
+
+
+_MISSING = object()
+
+
+@dataclass
+class DerivedData:
+    attacked: List[int | None] = field(default_factory=lambda: [None, None])
+
+
+def _entries_from_env() -> int:
+    entries = getenv(POSITION_CACHE_ENTRIES)
+    return int(entries) if entries else DEFAULT_ENTRIES
+
+
+POSITION_CACHE = TranspositionCache(_entries_from_env())
@@ -0,0 +1,41 @@
+import random
+from typing import *
+
+SEED = 0x5EED_C0DE
+
+_rng = random.Random(SEED)
+
+# indexed by board index * 64 + square, see core.position.Position
+PIECE_SQUARE: List[int] = [_rng.getrandbits(64) for _ in range(12 * 64)]
+_CASTLING_RIGHTS = [_rng.getrandbits(64) for _ in range(4)]
+# indexed by the 4 castling bits
+CASTLING: List[int] = [0] * 16
+for _bits in range(16):
+    for _i in range(4):
+        if _bits >> _i & 1:
+            CASTLING[_bits] ^= _CASTLING_RIGHTS[_i]
+EP_FILE: List[int] = [_rng.getrandbits(64) for _ in range(8)]
+BLACK_TO_MOVE: int = _rng.getrandbits(64)
+
+del _rng, _bits, _i
+
+
+def squares_key(board_idx: int, mask: int) -> int:
+    res = 0
+    base = board_idx * 64
+    while mask:
+        low = mask & -mask
+        res ^= PIECE_SQUARE[base + low.bit_length() - 1]
+        mask ^= low
+    return res
+
+
+def zobrist_key(boards: Sequence[int], turn: int, castling: int, ep: int) -> int:
+    res = CASTLING[castling]
+    for idx, bb in enumerate(boards):
+        res ^= squares_key(idx, bb)
+    if ep >= 0:
+        res ^= EP_FILE[ep & 7]
+    if turn:
+        res ^= BLACK_TO_MOVE
+    return res
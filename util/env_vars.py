@@ -1,2 +1,6 @@
 CORR_ID = "CORR_ID"
 LOG_LEVEL = "LOG_LEVEL"
+MAGICS_CACHE_DIR = "MAGICS_CACHE_DIR"
+SLIDER_ENGINE = "SLIDER_ENGINE"
+POSITION_CACHE_ENTRIES = "POSITION_CACHE_ENTRIES"
+LINE_CACHE_POSITIONS = "LINE_CACHE_POSITIONS"
@@ -14,6 +14,85 @@ def info():
     c.echo("in click")
 
 
+@util.group()
+def magics():
+    pass
+
+
+@magics.command()
+def memory():
+    from core.magics.report import memory_report
+    for name, size in memory_report().items():
+        c.echo(f"{name:<40} {size / 1024:>10.1f} KiB")
+
+
+@magics.command()
+def generate():
+    from core.magics.generate import MagicParams, SHIPPED_PATH, write_generated
+    write_generated(SHIPPED_PATH, MagicParams.default())
+    c.echo(f"wrote {SHIPPED_PATH}")
+
+
+@magics.command()
+@c.option("--attempts", default=100_000, help="Candidates tried per square before keeping the current magic")
+@c.option("--processes", default=None, type=int, help="Worker processes, defaults to the cpu count")
+@c.option("--seed", default=0, help="Seed for the candidate generators")
+@c.option("--write", is_flag=True, help="Emit the improved magics into core.magics")
+def search(attempts: int, processes: int | None, seed: int, write: bool):
+    from core.magics.generate import MagicParams
+    from core.magics.search import emit, search_magics
+    result = search_magics(MagicParams.default(), attempts, processes, seed)
+    for slider, (old, new) in result.table_sizes().items():
+        c.echo(f"{slider:<8} {old:>8} -> {new:>8} entries ({old * 8 / 1024:.1f} KiB -> {new * 8 / 1024:.1f} KiB)")
+    if write:
+        if emit(result):
+            c.echo("wrote core/magics/numbers.py and core/magics/tables.bin")
+        else:
+            c.echo("no square improved, nothing written")
+
+
+@util.group()
+def bench():
+    pass
+
+
+@bench.command()
+@c.option("--number", default=2000, help="Calls per timing run")
+def attacks(number: int):
+    from core.attacks import slider_engine
+    from core.bench import bench_attacked_squares
+    c.echo(f"slider engine: {slider_engine()}")
+    for name, timings in bench_attacked_squares(number).items():
+        c.echo(name)
+        for what, ns in timings.items():
+            c.echo(f"    {what:<16} {ns:>10.0f} ns")
+
+
+@bench.command()
+@c.option("--number", default=200, help="Replays of the sample line per timing run")
+def moves(number: int):
+    from core.bench import bench_make_unmake
+    for what, ns in bench_make_unmake(number).items():
+        c.echo(f"{what:<12} {ns:>10.0f} ns per move")
+
+
+@bench.command()
+@c.option("--count", default=20_000, help="FENs per timing run")
+def fen(count: int):
+    from core.bench import bench_fen
+    for what, rate in bench_fen(count).items():
+        c.echo(f"{what:<15} {rate:>12,.0f} FENs per second")
+
+
+@bench.command("import")
+@c.option("--module", default="core.square", help="Module to import")
+@c.option("--runs", default=20, help="Fresh interpreters to take the best timing from")
+def import_(module: str, runs: int):
+    from core.bench import import_time_us
+    own, cumulative = import_time_us(module, runs)
+    c.echo(f"{module}: {own} us self, {cumulative} us cumulative")
+
+
 if __name__ == "__main__":
     log.debug("f4dd0d93-33a0-4928-8637-58be4bd2e452", "Util starting")
     util()